@@ -0,0 +1,154 @@
+import secrets
+from datetime import datetime
+from typing import Literal, Optional
+from fastapi import Depends, FastAPI, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from database_manager import DatabaseManager
+from monitoring.metrics import CONTENT_TYPE, render_prometheus
+from services.police.police_data_mongo_service import PoliceDataMongoService
+from services.record_export import EXPORT_BATCH_SIZE, EXPORT_MEDIA_TYPES, iter_export
+from services.stats.stats_data_mongo_service import StatDataMongoService
+from settings import settings
+
+# Backend API routes, mounted on the Reflex backend through api_transformer.
+# Routes for the browser or other clients live under /api/, the only prefix
+# nginx proxies to the backend.
+api = FastAPI()
+
+ExportFormat = Literal["csv", "ndjson"]
+
+
+def require_api_token(authorization: Optional[str] = Header(None)) -> None:
+    """
+    Let through requests bearing DASHBOARD_API_TOKEN.
+
+    The export and search routes return guest records and failure reasons,
+    and /metrics is reachable on the backend port without nginx, so they
+    are closed while no token is configured.
+    """
+    token = settings.DASHBOARD_API_TOKEN
+    if not token or not secrets.compare_digest(authorization or "", f"Bearer {token}"):
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid or missing API token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+@api.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    dependencies=[Depends(require_api_token)],
+)
+def metrics_endpoint() -> PlainTextResponse:
+    """Prometheus metrics for this backend worker."""
+    return PlainTextResponse(render_prometheus(), media_type=CONTENT_TYPE)
+
+
+def _connected_db_manager() -> DatabaseManager:
+    db_manager = DatabaseManager.get_instance()
+    db_manager.connect_mongo(
+        connection_string=settings.get_mongo_connection_string(),
+        database=settings.get_mongo_database(),
+    )
+    return db_manager
+
+
+def _export_response(docs, fields, export_format: str, name: str):
+    # The iterator is lazy: the header goes out before the first query
+    # batch, and Starlette pulls each chunk in a worker thread as the client
+    # reads, so a slow client holds back the cursor instead of buffering.
+    return StreamingResponse(
+        iter_export(docs, fields, export_format, EXPORT_BATCH_SIZE),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{name}.{export_format}"'
+        },
+    )
+
+
+def _export_name(collection: str, *parts: Optional[str]) -> str:
+    return "-".join([collection, *(part for part in parts if part)])
+
+
+@api.get("/api/export/police_data", dependencies=[Depends(require_api_token)])
+def export_police_data(
+    format: ExportFormat = "csv",
+    police_type: Optional[str] = None,
+    state: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> StreamingResponse:
+    """
+    Stream the police_data records of a police type and state, newest first.
+
+    start and end bound created_at (start inclusive, end exclusive), e.g.
+    /api/export/police_data?police_type=SPAIN_HOS&state=INVALID
+    &start=2025-01-01T00:00:00&end=2025-01-02T00:00:00
+    """
+    service = PoliceDataMongoService(_connected_db_manager())
+    docs = service.iter_records(
+        police_type, state, start, end, batch_size=EXPORT_BATCH_SIZE
+    )
+    return _export_response(
+        docs,
+        service.EXPORT_FIELDS,
+        format,
+        _export_name("police_data", police_type, state),
+    )
+
+
+@api.get("/api/export/stat_data", dependencies=[Depends(require_api_token)])
+def export_stat_data(
+    format: ExportFormat = "csv",
+    stat_type: Optional[str] = None,
+    state: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> StreamingResponse:
+    """
+    Stream the stat_data records of a stat type and state, newest first.
+
+    state is CHECKIN_<state> or CHECKOUT_<state> for one side, or a bare
+    state for either, as on the statistics detail page.
+    """
+    service = StatDataMongoService(_connected_db_manager())
+    docs = service.iter_records(
+        stat_type, state, start, end, batch_size=EXPORT_BATCH_SIZE
+    )
+    return _export_response(
+        docs,
+        service.EXPORT_FIELDS,
+        format,
+        _export_name("stat_data", stat_type, state),
+    )
+
+
+@api.get("/api/search/police_data", dependencies=[Depends(require_api_token)])
+def search_police_reasons(
+    q: str,
+    police_type: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+) -> dict:
+    """
+    One page of the police_data records whose reason contains every word of
+    q, with the match counts per police type.
+    """
+    service = PoliceDataMongoService(_connected_db_manager())
+    return service.search_reasons(q, police_type, skip, limit)
+
+
+@api.get("/api/search/stat_data", dependencies=[Depends(require_api_token)])
+def search_stat_reasons(
+    q: str,
+    stat_type: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+) -> dict:
+    """
+    One page of the stat_data records whose check-in or check-out details
+    contain every word of q, with the match counts per stat type.
+    """
+    service = StatDataMongoService(_connected_db_manager())
+    return service.search_reasons(q, stat_type, skip, limit)
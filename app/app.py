@@ -1,5 +1,9 @@
+import asyncio
 import logging
 import reflex as rx
+from database_manager import DatabaseManager
+from services import PoliceDataMongoService, StatDataMongoService
+from settings import settings
 from app.components.police.police_dashboard import police_dashboard_page
 from app.components.stat.statistics_dashboard import statistics_dashboard_page
 from app.components.stat.statistics_type_detail import statistics_type_detail_page
@@ -7,6 +11,7 @@ from app.components.police.police_type_detail import police_type_detail_page
 from app.states.police.police_data_state import PoliceDataState
 from app.states.statistics.statistics_data_state import StatisticsDataState
 from app.states.police.navigation_state import NavigationState
+from app.api import api
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +49,8 @@ def police_type_detail(police_type: str = "") -> rx.Component:
         police_type_detail_page(),
         on_mount=[
             PoliceDataState.fetch_dashboard_stats,
+            PoliceDataState.fetch_police_type_recent_records,
+            PoliceDataState.fetch_police_type_trend,
         ],
         width="100%",
         background="linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%)",
@@ -65,11 +72,35 @@ def statistics_type_detail(statistics_type: str = "") -> rx.Component:
     )
 
 
+def _ensure_mongo_indexes():
+    """Create missing MongoDB indexes for the dashboard collections."""
+    db_manager = DatabaseManager.get_instance()
+    db_manager.connect_mongo(
+        connection_string=settings.get_mongo_connection_string(),
+        database=settings.get_mongo_database(),
+    )
+    for service in (
+        PoliceDataMongoService(db_manager),
+        StatDataMongoService(db_manager),
+    ):
+        service.ensure_indexes()
+
+
+async def ensure_mongo_indexes():
+    """Lifespan task provisioning indexes without blocking startup."""
+    try:
+        await asyncio.to_thread(_ensure_mongo_indexes)
+    except Exception as e:
+        logger.error(f"Failed to ensure MongoDB indexes: {str(e)}")
+
+
 app = rx.App(
+    api_transformer=api,
     stylesheets=[
         "https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap",
-    ]
+    ],
 )
+app.register_lifespan_task(ensure_mongo_indexes)
 app.add_page(index)
 app.add_page(police_dashboard, route="/police")
 app.add_page(statistics_dashboard, route="/statistics")
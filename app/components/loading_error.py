@@ -91,3 +91,26 @@ def error_component(error_message: str) -> rx.Component:
         width="100%",
         height="100vh",
     )
+
+
+def stale_data_badge() -> rx.Component:
+    """Header badge shown while stale numbers are refreshed in the background."""
+    return rx.box(
+        rx.hstack(
+            rx.spinner(size="1", color="white"),
+            rx.text(
+                "Refreshing",
+                size="2",
+                color="white",
+                font_weight="600",
+            ),
+            spacing="2",
+            align="center",
+        ),
+        padding="8px 12px",
+        background="rgba(245, 158, 11, 0.25)",
+        border_radius="20px",
+        border="1px solid rgba(245, 158, 11, 0.4)",
+        class_name="status-badge smooth-transition",
+        title="Showing the last known numbers while fresh data is computed",
+    )
@@ -4,6 +4,7 @@ from .police_header import dashboard_header
 from app.components.status_cards import status_overview_section
 from app.components.stats_cards import stats_cards_section
 from app.components.sidebar import sidebar
+from app.components.time_window_selector import time_window_selector
 from .charts import charts_section
 from app.components.loading_error import loading_component, error_component
 from app.states.police.police_data_state import PoliceDataState
@@ -21,10 +22,17 @@ def police_dashboard_page() -> rx.Component:
                     PoliceDataState.error_message != "",
                     error_component(PoliceDataState.error_message),
                     rx.box(
-                        dashboard_header(),
+                        dashboard_header(PoliceDataState.is_stale),
                         # Main content area with enhanced background
                         rx.container(
                             rx.vstack(
+                                time_window_selector(
+                                    PoliceDataState.time_window,
+                                    PoliceDataState.custom_window_start,
+                                    PoliceDataState.custom_window_end,
+                                    PoliceDataState.set_time_window,
+                                    PoliceDataState.apply_custom_window,
+                                ),
                                 stats_cards_section(
                                     PoliceDataState.get_total_records,
                                     PoliceDataState.get_success_rate,
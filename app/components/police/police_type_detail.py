@@ -1,4 +1,5 @@
 import reflex as rx
+from app.components.trend_chart import success_rate_trend_card
 from app.states.police.police_data_state import PoliceDataState
 
 
@@ -394,7 +395,8 @@ def reasons_modal() -> rx.Component:
                             f"Showing page {PoliceDataState.reasons_current_page} "
                             f"of {PoliceDataState.get_total_pages} "
                             f"({PoliceDataState.total_reasons_count} total "
-                            f"reasons)",
+                            f"reasons across {PoliceDataState.total_reason_records} "
+                            f"records)",
                             size="2",
                             color="gray.600",
                         ),
@@ -750,6 +752,139 @@ def police_type_recent_records() -> rx.Component:
     )
 
 
+def reason_search_card() -> rx.Component:
+    """Search every record whose reason contains the given words."""
+    return rx.card(
+        rx.vstack(
+            rx.hstack(
+                rx.icon("search", size=24, color="blue.600"),
+                rx.heading("Search Reasons", size="4", color="gray.800"),
+                spacing="3",
+                align="center",
+            ),
+            rx.divider(),
+            rx.form(
+                rx.hstack(
+                    rx.input(
+                        name="text",
+                        placeholder="Words in the reason, e.g. invalid document",
+                        width="100%",
+                    ),
+                    rx.button(
+                        "Search",
+                        type="submit",
+                        loading=PoliceDataState.reason_search_loading,
+                    ),
+                    spacing="2",
+                    width="100%",
+                ),
+                on_submit=PoliceDataState.search_reasons,
+                width="100%",
+            ),
+            rx.cond(
+                PoliceDataState.reason_search_counts,
+                rx.vstack(
+                    # Matches per police type, over every type
+                    rx.flex(
+                        rx.foreach(
+                            PoliceDataState.reason_search_counts,
+                            lambda item: rx.badge(
+                                f"{item['police_type']}: {item['count']}",
+                                size="2",
+                                variant="surface",
+                            ),
+                        ),
+                        wrap="wrap",
+                        spacing="2",
+                    ),
+                    rx.table.root(
+                        rx.table.header(
+                            rx.table.row(
+                                rx.table.column_header_cell("CREATED", weight="medium"),
+                                rx.table.column_header_cell(
+                                    "POLICE TYPE", weight="medium"
+                                ),
+                                rx.table.column_header_cell("STATE", weight="medium"),
+                                rx.table.column_header_cell("REASON", weight="medium"),
+                            ),
+                        ),
+                        rx.table.body(
+                            rx.foreach(
+                                PoliceDataState.reason_search_results,
+                                lambda record: rx.table.row(
+                                    rx.table.cell(record["created_at"]),
+                                    rx.table.cell(record["police_type"]),
+                                    rx.table.cell(
+                                        rx.badge(
+                                            record["state"], size="2", variant="surface"
+                                        )
+                                    ),
+                                    rx.table.cell(record["reason"]),
+                                ),
+                            ),
+                        ),
+                        width="100%",
+                        border="1px solid var(--gray-200)",
+                        border_radius="lg",
+                        overflow="hidden",
+                    ),
+                    rx.hstack(
+                        rx.text(
+                            f"Showing page {PoliceDataState.reason_search_page} "
+                            f"of {PoliceDataState.reason_search_total_pages} "
+                            f"({PoliceDataState.reason_search_total} matching records)",
+                            size="2",
+                            color="gray.600",
+                        ),
+                        rx.spacer(),
+                        rx.hstack(
+                            rx.button(
+                                "← Previous",
+                                variant="outline",
+                                size="2",
+                                disabled=PoliceDataState.reason_search_page <= 1,
+                                on_click=PoliceDataState.reason_search_previous_page,
+                            ),
+                            rx.button(
+                                "Next →",
+                                variant="outline",
+                                size="2",
+                                disabled=PoliceDataState.reason_search_page
+                                >= PoliceDataState.reason_search_total_pages,
+                                on_click=PoliceDataState.reason_search_next_page,
+                            ),
+                            spacing="2",
+                        ),
+                        justify="between",
+                        width="100%",
+                    ),
+                    spacing="3",
+                    width="100%",
+                ),
+                rx.cond(
+                    PoliceDataState.reason_search_text,
+                    rx.text(
+                        "No records match this search.",
+                        size="2",
+                        color="gray.500",
+                    ),
+                ),
+            ),
+            spacing="4",
+            align="start",
+            width="100%",
+        ),
+        padding="2rem",
+        background="white",
+        border="1px solid var(--gray-200)",
+        border_radius="xl",
+        box_shadow=(
+            "0 4px 6px -1px rgba(0, 0, 0, 0.1), " "0 2px 4px -1px rgba(0, 0, 0, 0.06)"
+        ),
+        width="100%",
+    )
+
+
 def police_type_detail_page() -> rx.Component:
     """Main component for the police type detail page."""
     return rx.box(
@@ -760,8 +895,16 @@ def police_type_detail_page() -> rx.Component:
                 police_type_overview_card(),
                 # State distribution chart
                 police_type_state_distribution_chart(),
+                # Success rate over the selected time window
+                success_rate_trend_card(
+                    PoliceDataState.police_type_trend,
+                    PoliceDataState.trend_bucket_label,
+                    PoliceDataState.trend_loading,
+                ),
                 # Recent records card below state distribution
                 police_type_recent_records(),
+                # Reason search over every record
+                reason_search_card(),
                 spacing="6",
                 align="start",
                 width="100%",
@@ -1,9 +1,15 @@
 import reflex as rx
 from datetime import datetime
 
+from app.components.loading_error import stale_data_badge
 
-def dashboard_header() -> rx.Component:
-    """Enhanced header component with modern styling and real-time indicators."""
+
+def dashboard_header(is_stale=False) -> rx.Component:
+    """Enhanced header component with modern styling and real-time indicators.
+
+    Args:
+        is_stale: State var that is true while cached numbers are being refreshed
+    """
     return rx.box(
         # Main header content
         rx.container(
@@ -49,33 +55,37 @@ def dashboard_header() -> rx.Component:
                     # Status indicators and time
                     rx.vstack(
                         rx.hstack(
-                            rx.box(
-                                rx.hstack(
-                                    rx.box(
-                                        width="8px",
-                                        height="8px",
-                                        background="var(--green-9)",
-                                        border_radius="50%",
-                                        style={"animation": "pulse 2s infinite"},
-                                    ),
-                                    rx.text(
-                                        "Live",
-                                        size="2",
-                                        color="white",
-                                        font_weight="600",
+                            rx.cond(
+                                is_stale,
+                                stale_data_badge(),
+                                rx.box(
+                                    rx.hstack(
+                                        rx.box(
+                                            width="8px",
+                                            height="8px",
+                                            background="var(--green-9)",
+                                            border_radius="50%",
+                                            style={"animation": "pulse 2s infinite"},
+                                        ),
+                                        rx.text(
+                                            "Live",
+                                            size="2",
+                                            color="white",
+                                            font_weight="600",
+                                        ),
+                                        spacing="2",
+                                        align="center",
                                     ),
-                                    spacing="2",
-                                    align="center",
+                                    padding="8px 12px",
+                                    background="rgba(34, 197, 94, 0.2)",
+                                    border_radius="20px",
+                                    border="1px solid rgba(34, 197, 94, 0.3)",
+                                    class_name="status-badge smooth-transition",
+                                    _hover={
+                                        "transform": "translateY(-1px)",
+                                        "box_shadow": "0 4px 12px rgba(34, 197, 94, 0.3)",
+                                    },
                                 ),
-                                padding="8px 12px",
-                                background="rgba(34, 197, 94, 0.2)",
-                                border_radius="20px",
-                                border="1px solid rgba(34, 197, 94, 0.3)",
-                                class_name="status-badge smooth-transition",
-                                _hover={
-                                    "transform": "translateY(-1px)",
-                                    "box_shadow": "0 4px 12px rgba(34, 197, 94, 0.3)",
-                                },
                             ),
                             rx.box(
                                 rx.hstack(
@@ -3,6 +3,7 @@ from app.components.loading_error import loading_component, error_component
 from app.components.status_cards import status_overview_section
 from app.components.stats_cards import stats_cards_section
 from app.components.sidebar import sidebar
+from app.components.time_window_selector import time_window_selector
 from app.components.stat.stat_header import dashboard_header
 from app.states.statistics.statistics_data_state import StatisticsDataState
 
@@ -19,10 +20,17 @@ def statistics_dashboard_page() -> rx.Component:
                     StatisticsDataState.error_message != "",
                     error_component(StatisticsDataState.error_message),
                     rx.box(
-                        dashboard_header(),
+                        dashboard_header(StatisticsDataState.is_stale),
                         # Main content area with enhanced background
                         rx.container(
                             rx.vstack(
+                                time_window_selector(
+                                    StatisticsDataState.time_window,
+                                    StatisticsDataState.custom_window_start,
+                                    StatisticsDataState.custom_window_end,
+                                    StatisticsDataState.set_time_window,
+                                    StatisticsDataState.apply_custom_window,
+                                ),
                                 stats_cards_section(
                                     StatisticsDataState.get_total_records,
                                     StatisticsDataState.get_success_rate,
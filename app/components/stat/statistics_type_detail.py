@@ -1,4 +1,5 @@
 import reflex as rx
+from app.components.trend_chart import success_rate_trend_card
 from app.states.statistics.statistics_data_state import StatisticsDataState
 
 
@@ -1132,6 +1133,147 @@ def statistics_type_recent_records() -> rx.Component:
     )
 
 
+def reason_search_card() -> rx.Component:
+    """Search every record whose reason contains the given words."""
+    return rx.card(
+        rx.vstack(
+            rx.hstack(
+                rx.icon("search", size=24, color="blue.600"),
+                rx.heading("Search Reasons", size="4", color="gray.800"),
+                spacing="3",
+                align="center",
+            ),
+            rx.divider(),
+            rx.form(
+                rx.hstack(
+                    rx.input(
+                        name="text",
+                        placeholder="Words in the check-in or check-out details",
+                        width="100%",
+                    ),
+                    rx.button(
+                        "Search",
+                        type="submit",
+                        loading=StatisticsDataState.reason_search_loading,
+                    ),
+                    spacing="2",
+                    width="100%",
+                ),
+                on_submit=StatisticsDataState.search_reasons,
+                width="100%",
+            ),
+            rx.cond(
+                StatisticsDataState.reason_search_counts,
+                rx.vstack(
+                    # Matches per stat type, over every type
+                    rx.flex(
+                        rx.foreach(
+                            StatisticsDataState.reason_search_counts,
+                            lambda item: rx.badge(
+                                f"{item['stat_type']}: {item['count']}",
+                                size="2",
+                                variant="surface",
+                            ),
+                        ),
+                        wrap="wrap",
+                        spacing="2",
+                    ),
+                    rx.table.root(
+                        rx.table.header(
+                            rx.table.row(
+                                rx.table.column_header_cell("CREATED", weight="medium"),
+                                rx.table.column_header_cell(
+                                    "STAT TYPE", weight="medium"
+                                ),
+                                rx.table.column_header_cell(
+                                    "CHECK-IN", weight="medium"
+                                ),
+                                rx.table.column_header_cell(
+                                    "CHECK-OUT", weight="medium"
+                                ),
+                                rx.table.column_header_cell("DETAILS", weight="medium"),
+                            ),
+                        ),
+                        rx.table.body(
+                            rx.foreach(
+                                StatisticsDataState.reason_search_results,
+                                lambda record: rx.table.row(
+                                    rx.table.cell(record["created_at"]),
+                                    rx.table.cell(record["stat_type"]),
+                                    rx.table.cell(record["status_check_in"]),
+                                    rx.table.cell(record["status_check_out"]),
+                                    rx.table.cell(
+                                        rx.text(
+                                            record["status_check_in_details"],
+                                            " ",
+                                            record["status_check_out_details"],
+                                        )
+                                    ),
+                                ),
+                            ),
+                        ),
+                        width="100%",
+                        border="1px solid var(--gray-200)",
+                        border_radius="lg",
+                        overflow="hidden",
+                    ),
+                    rx.hstack(
+                        rx.text(
+                            f"Showing page {StatisticsDataState.reason_search_page} "
+                            f"of {StatisticsDataState.reason_search_total_pages} "
+                            f"({StatisticsDataState.reason_search_total} matching records)",
+                            size="2",
+                            color="gray.600",
+                        ),
+                        rx.spacer(),
+                        rx.hstack(
+                            rx.button(
+                                "← Previous",
+                                variant="outline",
+                                size="2",
+                                disabled=StatisticsDataState.reason_search_page <= 1,
+                                on_click=StatisticsDataState.reason_search_previous_page,
+                            ),
+                            rx.button(
+                                "Next →",
+                                variant="outline",
+                                size="2",
+                                disabled=StatisticsDataState.reason_search_page
+                                >= StatisticsDataState.reason_search_total_pages,
+                                on_click=StatisticsDataState.reason_search_next_page,
+                            ),
+                            spacing="2",
+                        ),
+                        justify="between",
+                        width="100%",
+                    ),
+                    spacing="3",
+                    width="100%",
+                ),
+                rx.cond(
+                    StatisticsDataState.reason_search_text,
+                    rx.text(
+                        "No records match this search.",
+                        size="2",
+                        color="gray.500",
+                    ),
+                ),
+            ),
+            spacing="4",
+            align="start",
+            width="100%",
+        ),
+        padding="2rem",
+        background="white",
+        border="1px solid var(--gray-200)",
+        border_radius="xl",
+        box_shadow=(
+            "0 4px 6px -1px rgba(0, 0, 0, 0.1), " "0 2px 4px -1px rgba(0, 0, 0, 0.06)"
+        ),
+        width="100%",
+    )
+
+
 def statistics_type_detail_page() -> rx.Component:
     """Main component for the statistics type detail page."""
     return rx.box(
@@ -1148,8 +1290,16 @@ def statistics_type_detail_page() -> rx.Component:
                 ),
                 # State distribution charts
                 statistics_type_state_distribution_charts(),
+                # Success rate over the selected time window
+                success_rate_trend_card(
+                    StatisticsDataState.statistics_type_trend,
+                    StatisticsDataState.trend_bucket_label,
+                    StatisticsDataState.trend_loading,
+                ),
                 # Recent records card
                 statistics_type_recent_records(),
+                # Reason search over every record
+                reason_search_card(),
                 spacing="6",
                 align="start",
                 width="100%",
@@ -1169,6 +1319,8 @@ def statistics_type_detail_page() -> rx.Component:
         # Load statistics type from URL and fetch recent records when component mounts
         on_mount=[
             StatisticsDataState.load_statistics_type_from_url,
+            StatisticsDataState.fetch_statistics_type_distributions,
             StatisticsDataState.fetch_recent_records_for_statistics_type,
+            StatisticsDataState.fetch_statistics_type_trend,
         ],
     )
@@ -109,6 +109,36 @@ def status_card(type_data, route_prefix="police-type") -> rx.Component:
                         align="center",
                         width="100%",
                     ),
+                    # Previous window of equal length, when one was compared
+                    rx.cond(
+                        type_data["has_previous"],
+                        rx.hstack(
+                            rx.text(
+                                "Previous Period",
+                                size="1",
+                                color="gray.600",
+                                weight="medium",
+                            ),
+                            rx.hstack(
+                                rx.text(
+                                    f"{type_data['previous_success_rate']}%",
+                                    size="2",
+                                    color="gray.700",
+                                ),
+                                rx.badge(
+                                    type_data["delta_label"],
+                                    size="1",
+                                    variant="soft",
+                                    color_scheme=type_data["delta_color"],
+                                ),
+                                spacing="2",
+                                align="center",
+                            ),
+                            justify="between",
+                            align="center",
+                            width="100%",
+                        ),
+                    ),
                     # ...removed Records row...
                 ),
                 spacing="3",
@@ -0,0 +1,70 @@
+import reflex as rx
+
+from app.states.time_window import CUSTOM_WINDOW, TIME_WINDOW_OPTIONS
+
+WINDOW_LABELS = {CUSTOM_WINDOW: "Custom", "all": "All"}
+
+
+def time_window_selector(
+    window, custom_start, custom_end, on_change, on_custom_submit
+) -> rx.Component:
+    """Time range control shared by the dashboards.
+
+    Args:
+        window: State var holding the selected window name
+        custom_start: State var with the custom window's start (ISO string)
+        custom_end: State var with the custom window's end (ISO string)
+        on_change: Event handler receiving the new window name
+        on_custom_submit: Event handler receiving the custom form's data
+    """
+    return rx.card(
+        rx.hstack(
+            rx.hstack(
+                rx.icon("calendar-range", size=20, color="blue.600"),
+                rx.text("Time range", size="3", weight="medium", color="gray.800"),
+                spacing="2",
+                align="center",
+            ),
+            rx.segmented_control.root(
+                *[
+                    rx.segmented_control.item(
+                        WINDOW_LABELS.get(option, option), value=option
+                    )
+                    for option in TIME_WINDOW_OPTIONS
+                ],
+                value=window,
+                on_change=on_change,
+            ),
+            rx.cond(
+                window == CUSTOM_WINDOW,
+                rx.form(
+                    rx.hstack(
+                        rx.input(
+                            name="start",
+                            type="datetime-local",
+                            default_value=custom_start,
+                        ),
+                        rx.text("to", size="2", color="gray.600"),
+                        rx.input(
+                            name="end",
+                            type="datetime-local",
+                            default_value=custom_end,
+                        ),
+                        rx.button("Apply", type="submit", size="2"),
+                        spacing="2",
+                        align="center",
+                    ),
+                    on_submit=on_custom_submit,
+                ),
+            ),
+            spacing="4",
+            align="center",
+            wrap="wrap",
+            width="100%",
+        ),
+        padding="1rem 1.5rem",
+        background="white",
+        border="1px solid var(--gray-200)",
+        border_radius="xl",
+        width="100%",
+    )
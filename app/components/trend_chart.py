@@ -0,0 +1,87 @@
+import reflex as rx
+
+
+def success_rate_trend_card(points, bucket_label, loading) -> rx.Component:
+    """Line chart of a type's success rate over the selected time window.
+
+    Args:
+        points: State var with the trend's [{"time", "success_rate", "total"}]
+        bucket_label: State var with the bucket size, e.g. "5 minutes"
+        loading: State var that is true while the trend loads
+    """
+    return rx.card(
+        rx.vstack(
+            rx.hstack(
+                rx.icon("chart-line", size=24, color="blue.600"),
+                rx.heading(
+                    "Success Rate Trend",
+                    size="4",
+                    color="gray.800",
+                    font_weight="600",
+                ),
+                rx.spacer(),
+                rx.cond(
+                    bucket_label,
+                    rx.badge(
+                        "per " + bucket_label.to(str),
+                        color_scheme="gray",
+                        variant="soft",
+                    ),
+                ),
+                align="center",
+                spacing="3",
+                width="100%",
+            ),
+            rx.cond(
+                loading,
+                rx.center(rx.spinner(size="3"), height="300px", width="100%"),
+                rx.cond(
+                    points.length() > 0,
+                    rx.recharts.line_chart(
+                        rx.recharts.cartesian_grid(stroke_dasharray="3 3"),
+                        rx.recharts.line(
+                            data_key="success_rate",
+                            name="Success rate (%)",
+                            stroke="#2563EB",
+                            stroke_width=2,
+                            dot=False,
+                            type_="monotone",
+                        ),
+                        rx.recharts.x_axis(data_key="time", min_tick_gap=24),
+                        rx.recharts.y_axis(domain=[0, 100], unit="%"),
+                        rx.recharts.graphing_tooltip(
+                            separator=": ",
+                            content_style={
+                                "background": "white",
+                                "border": "1px solid #e2e8f0",
+                                "border_radius": "6px",
+                                "box_shadow": "0 4px 12px rgba(0, 0, 0, 0.15)",
+                            },
+                        ),
+                        data=points,
+                        width="100%",
+                        height=300,
+                    ),
+                    rx.center(
+                        rx.text(
+                            "No completed records in this time range.",
+                            size="2",
+                            color="gray.500",
+                        ),
+                        height="120px",
+                        width="100%",
+                    ),
+                ),
+            ),
+            spacing="4",
+            width="100%",
+        ),
+        padding="2rem",
+        background="white",
+        border="1px solid var(--gray-200)",
+        border_radius="xl",
+        box_shadow=(
+            "0 4px 6px -1px rgba(0, 0, 0, 0.1), " "0 2px 4px -1px rgba(0, 0, 0, 0.06)"
+        ),
+        width="100%",
+    )
@@ -0,0 +1,512 @@
+"""
+Optional in-memory columnar engine for the dashboard numbers.
+
+police_data and stat_data are held as NumPy columns: categorical fields
+(state, police type, source type, stat type) dictionary-encoded as int32
+codes and created_at as int64 epoch milliseconds. The dashboard
+statistics and per-type success and error counts are then bincounts over
+those columns instead of aggregation round trips to MongoDB; the states
+turn the counts into rates with success_rate_statuses.
+
+Reason texts are not kept. The expected-error rules only look at the type,
+state and reason of a row, so they are evaluated while loading and stored
+as one boolean per row.
+
+A table refreshes when its collection's data version changes: the rows in
+the window the sync rewrites are dropped, that window and any newly
+inserted documents are read back, and a full reload happens when the row
+count no longer matches the collection (e.g. after a clearing sync).
+
+Enabled with ANALYTICS_ENGINE=numpy; needs the `analytics` extra.
+"""
+
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from app.states.police.analyzer import get_error_rules_for_police_type
+from app.states.statistics.analyzer import get_error_rules_for_stat_type
+
+LOAD_BATCH_SIZE = 20_000
+
+# created_at of documents without a parseable timestamp
+MISSING_TIMESTAMP = np.iinfo(np.int64).min
+
+
+class DictionaryColumn:
+    """
+    A categorical column stored as int32 codes into a list of values
+
+    Codes are assigned in order of first appearance and never change, so
+    rows appended later stay comparable with existing ones.
+    """
+
+    def __init__(self):
+        self.values: List[Any] = []
+        self.index: Dict[Any, int] = {}
+        self.codes = np.empty(0, dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def encode(self, values: Iterable[Any]) -> np.ndarray:
+        """Codes of the values, adding unseen ones to the dictionary"""
+        index = self.index
+        codes = []
+        for value in values:
+            code = index.get(value)
+            if code is None:
+                code = index[value] = len(self.values)
+                self.values.append(value)
+            codes.append(code)
+        return np.array(codes, dtype=np.int32)
+
+    def mask_of(self, values: Iterable[Any]) -> np.ndarray:
+        """Boolean mask over the codes: True where the value is in values"""
+        wanted = np.zeros(max(len(self.values), 1), dtype=bool)
+        for value in values:
+            code = self.index.get(value)
+            if code is not None:
+                wanted[code] = True
+        return wanted
+
+
+def value_counts(values: List[Any], counts: np.ndarray) -> Dict[Any, int]:
+    """Counts per value, most frequent first, zero counts left out"""
+    order = np.argsort(-counts, kind="stable")
+    return {values[i]: int(counts[i]) for i in order if counts[i] > 0}
+
+
+def parse_timestamps(values: List[Optional[str]]) -> np.ndarray:
+    """ISO created_at strings to int64 epoch milliseconds"""
+    try:
+        return np.array(values, dtype="datetime64[ms]").astype(np.int64)
+    except (ValueError, TypeError):
+        # Timezone offsets or missing values: parse one by one
+        return np.array([_parse_timestamp(value) for value in values], dtype=np.int64)
+
+
+def _parse_timestamp(value: Optional[str]) -> int:
+    try:
+        parsed = datetime.fromisoformat(value).replace(tzinfo=None)
+    except (TypeError, ValueError):
+        return MISSING_TIMESTAMP
+    return to_epoch_ms(parsed)
+
+
+def to_epoch_ms(value: datetime) -> int:
+    return int(np.datetime64(value, "ms").astype(np.int64))
+
+
+class ColumnarTable:
+    """
+    Rows of one collection as NumPy columns
+
+    Args:
+        categorical: Fields stored as dictionary-encoded columns
+        flags: Names of boolean columns computed by flagger
+        flagger: Returns one bool per flag for a document
+        flag_fields: Extra fields flagger reads, only used while loading
+    """
+
+    def __init__(
+        self,
+        categorical: Tuple[str, ...],
+        flags: Tuple[str, ...] = (),
+        flagger: Optional[Callable[[Dict[str, Any]], Tuple[bool, ...]]] = None,
+        flag_fields: Tuple[str, ...] = (),
+    ):
+        self.columns = {name: DictionaryColumn() for name in categorical}
+        self.flag_names = flags
+        self.flagger = flagger
+        self.flag_fields = flag_fields
+        self.created_at = np.empty(0, dtype=np.int64)
+        self.flags = {name: np.empty(0, dtype=bool) for name in flags}
+        # Largest _id read so far; newer inserts have larger ObjectIds
+        self.high_water_id = None
+        self.version: Optional[int] = None
+        self._cubes: Dict[Tuple[str, ...], np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.created_at)
+
+    @property
+    def projection(self) -> Dict[str, int]:
+        fields = ("created_at", *self.columns, *self.flag_fields)
+        return {field: 1 for field in fields}
+
+    def append(self, docs: List[Dict[str, Any]]):
+        """Encode a batch of documents and append it"""
+        if not docs:
+            return
+        self._cubes = {}
+        for name, column in self.columns.items():
+            codes = column.encode([doc.get(name) for doc in docs])
+            column.codes = np.concatenate([column.codes, codes])
+        timestamps = parse_timestamps([doc.get("created_at") for doc in docs])
+        self.created_at = np.concatenate([self.created_at, timestamps])
+        if self.flag_names:
+            flags = np.array([self.flagger(doc) for doc in docs], dtype=bool)
+            for i, name in enumerate(self.flag_names):
+                self.flags[name] = np.concatenate([self.flags[name], flags[:, i]])
+        ids = [doc["_id"] for doc in docs if "_id" in doc]
+        if ids:
+            newest = max(ids)
+            if self.high_water_id is None or newest > self.high_water_id:
+                self.high_water_id = newest
+
+    def keep(self, mask: np.ndarray):
+        """Drop the rows where mask is False"""
+        self._cubes = {}
+        for column in self.columns.values():
+            column.codes = column.codes[mask]
+        self.created_at = self.created_at[mask]
+        for name in self.flag_names:
+            self.flags[name] = self.flags[name][mask]
+
+    def between(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> "ColumnarTable":
+        """
+        The rows created from start (inclusive) to end (exclusive)
+
+        A filtered copy sharing the dictionaries' values, with cubes of its
+        own; the table itself when neither bound is given.
+        """
+        if start is None and end is None:
+            return self
+        mask = np.ones(len(self), dtype=bool)
+        if start is not None:
+            mask &= self.created_at >= to_epoch_ms(start)
+        if end is not None:
+            mask &= self.created_at < to_epoch_ms(end)
+        window = ColumnarTable(
+            tuple(self.columns), self.flag_names, self.flagger, self.flag_fields
+        )
+        window.columns = {
+            name: _copy_column(column) for name, column in self.columns.items()
+        }
+        window.created_at = self.created_at
+        window.flags = dict(self.flags)
+        window.version = self.version
+        window.keep(mask)
+        return window
+
+    def cube(self, *dimensions: str) -> np.ndarray:
+        """
+        Row counts per combination of the given columns and flags
+
+        The result has one axis per dimension: the dictionary codes of a
+        column, or False/True of a flag. It is computed with one bincount
+        and cached until the rows change, so every query after a refresh
+        only sums over this small array.
+        """
+        cached = self._cubes.get(dimensions)
+        if cached is not None:
+            return cached
+        shape = []
+        keys = np.zeros(len(self), dtype=np.int64)
+        for name in dimensions:
+            if name in self.columns:
+                size, codes = max(len(self.columns[name]), 1), self.columns[name].codes
+            else:
+                size, codes = 2, self.flags[name]
+            keys = keys * size + codes
+            shape.append(size)
+        counts = np.bincount(keys, minlength=int(np.prod(shape))).reshape(shape)
+        self._cubes[dimensions] = counts
+        return counts
+
+
+class CollectionLoader:
+    """Keeps a ColumnarTable in line with a MongoDB collection"""
+
+    def __init__(
+        self,
+        table_factory: Callable[[], ColumnarTable],
+        refresh_window: timedelta,
+        batch_size: int = LOAD_BATCH_SIZE,
+    ):
+        self.table_factory = table_factory
+        self.refresh_window = refresh_window
+        self.batch_size = batch_size
+        self.table = table_factory()
+        self._lock = threading.Lock()
+
+    def _read(
+        self,
+        collection,
+        query: Dict[str, Any],
+        table: ColumnarTable,
+        decode: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]],
+    ):
+        cursor = collection.find(query, table.projection).batch_size(self.batch_size)
+        batch = []
+        for doc in cursor:
+            batch.append(decode(doc) if decode else doc)
+            if len(batch) >= self.batch_size:
+                table.append(batch)
+                batch = []
+        table.append(batch)
+
+    def _reload(self, collection, version: Optional[int], decode) -> ColumnarTable:
+        table = self.table_factory()
+        self._read(collection, {}, table, decode)
+        table.version = version
+        # Swap in the finished table; readers never see a partial one
+        self.table = table
+        return table
+
+    def refresh(
+        self,
+        collection,
+        version: Optional[int],
+        decode: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+    ) -> ColumnarTable:
+        """
+        Bring the table up to date with the collection
+
+        Nothing is read when the data version is unchanged; with an unknown
+        version (None) the table is always refreshed. decode, if given, is
+        applied to every document read (e.g. to expand integer codes).
+        """
+        with self._lock:
+            table = self.table
+            if version is not None and version == table.version:
+                return table
+            if table.version is None or table.high_water_id is None:
+                return self._reload(collection, version, decode)
+
+            cutoff = datetime.now() - self.refresh_window
+            # Work on a copy so readers keep a consistent table meanwhile
+            updated = self.table_factory()
+            updated.columns = {
+                name: _copy_column(column) for name, column in table.columns.items()
+            }
+            updated.created_at = table.created_at
+            updated.flags = dict(table.flags)
+            updated.high_water_id = table.high_water_id
+            updated.keep(updated.created_at < to_epoch_ms(cutoff))
+            self._read(
+                collection,
+                {
+                    "$or": [
+                        {"created_at": {"$gte": cutoff.isoformat()}},
+                        {"_id": {"$gt": table.high_water_id}},
+                    ]
+                },
+                updated,
+                decode,
+            )
+            if len(updated) != collection.count_documents({}):
+                # Rows were deleted or rewritten outside the window
+                return self._reload(collection, version, decode)
+            updated.version = version
+            self.table = updated
+            return updated
+
+
+def _copy_column(column: DictionaryColumn) -> DictionaryColumn:
+    copy = DictionaryColumn()
+    copy.values = list(column.values)
+    copy.index = dict(column.index)
+    copy.codes = column.codes
+    return copy
+
+
+# police_data
+
+_police_rules: Dict[Any, Any] = {}
+
+
+def _police_flags(doc: Dict[str, Any]) -> Tuple[bool]:
+    police_type = doc.get("police_type")
+    rules = _police_rules.get(police_type)
+    if rules is None:
+        rules = _police_rules[police_type] = get_error_rules_for_police_type(
+            police_type
+        )
+    expected = rules.is_expected_error(
+        error_reason=doc.get("reason") or "", state=doc.get("state")
+    )
+    return (expected,)
+
+
+def police_table() -> ColumnarTable:
+    return ColumnarTable(
+        categorical=("police_type", "state", "source_type"),
+        flags=("expected",),
+        flagger=_police_flags,
+        flag_fields=("reason",),
+    )
+
+
+def police_statistics(table: ColumnarTable) -> Dict[str, Any]:
+    """Same result as PoliceDataMongoService.get_statistics"""
+    columns = table.columns
+    cube = table.cube("police_type", "state", "expected")
+    sources = value_counts(columns["source_type"].values, table.cube("source_type"))
+    return {
+        "total_records": len(table),
+        "movements": sources.get("movement", 0),
+        "registrations": sources.get("registration", 0),
+        "state_distribution": value_counts(
+            columns["state"].values, cube.sum(axis=(0, 2))
+        ),
+        "police_type_distribution": value_counts(
+            columns["police_type"].values, cube.sum(axis=(1, 2))
+        ),
+    }
+
+
+def police_type_summaries(
+    table: ColumnarTable, success_states: List[str], error_states: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    State, success and error counts per police type
+
+    Matches calculate_police_success_rate: errors are rows in an error
+    state whose reason is not an expected error for the police type.
+    """
+    states = table.columns["state"]
+    cube = table.cube("police_type", "state", "expected")
+    counts = cube.sum(axis=2)
+    success = counts[:, states.mask_of(success_states)].sum(axis=1)
+    errors = cube[:, states.mask_of(error_states), 0].sum(axis=1)
+    return _summaries(
+        table.columns["police_type"].values, states.values, counts, success, errors
+    )
+
+
+# stat_data
+
+_stat_rules: Dict[Any, Any] = {}
+
+
+def _stat_flags(doc: Dict[str, Any]) -> Tuple[bool, bool]:
+    stat_type = doc.get("stat_type")
+    rules = _stat_rules.get(stat_type)
+    if rules is None:
+        rules = _stat_rules[stat_type] = get_error_rules_for_stat_type(stat_type)
+    return (
+        rules.is_expected_error(
+            error_reason=doc.get("status_check_in_details") or "",
+            state=doc.get("status_check_in"),
+        ),
+        rules.is_expected_error(
+            error_reason=doc.get("status_check_out_details") or "",
+            state=doc.get("status_check_out"),
+        ),
+    )
+
+
+STAT_SIDES = (
+    ("status_check_in", "expected_check_in"),
+    ("status_check_out", "expected_check_out"),
+)
+
+
+def stat_table() -> ColumnarTable:
+    return ColumnarTable(
+        categorical=("stat_type", "status_check_in", "status_check_out"),
+        flags=("expected_check_in", "expected_check_out"),
+        flagger=_stat_flags,
+        flag_fields=("status_check_in_details", "status_check_out_details"),
+    )
+
+
+def stat_statistics(table: ColumnarTable) -> Dict[str, Any]:
+    """Same result as StatDataMongoService.get_statistics"""
+    state_distribution: Dict[str, int] = {}
+    for side, flag in STAT_SIDES:
+        cube = table.cube("stat_type", side, flag)
+        side_counts = value_counts(table.columns[side].values, cube.sum(axis=(0, 2)))
+        for state, count in side_counts.items():
+            state_distribution[state] = state_distribution.get(state, 0) + count
+    type_distribution = value_counts(
+        table.columns["stat_type"].values, table.cube("stat_type")
+    )
+    return {
+        "total_records": len(table),
+        "state_distribution": state_distribution,
+        "statistics_type_distribution": type_distribution,
+        "stat_type_distribution": type_distribution,
+    }
+
+
+def stat_type_summaries(
+    table: ColumnarTable, success_states: List[str], error_states: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    State, success and error counts per stat type, check-in and check-out
+    counted separately as in calculate_stat_success_rate
+    """
+    n_types = max(len(table.columns["stat_type"]), 1)
+    # Both sides are mapped onto one list of states so they can be added
+    state_values: List[Any] = []
+    for side, _ in STAT_SIDES:
+        for state in table.columns[side].values:
+            if state not in state_values:
+                state_values.append(state)
+    counts = np.zeros((n_types, len(state_values)), dtype=np.int64)
+    success = np.zeros(n_types, dtype=np.int64)
+    errors = np.zeros(n_types, dtype=np.int64)
+    for side, flag in STAT_SIDES:
+        column = table.columns[side]
+        cube = table.cube("stat_type", side, flag)
+        side_counts = cube.sum(axis=2)
+        for code, state in enumerate(column.values):
+            counts[:, state_values.index(state)] += side_counts[:, code]
+        success += side_counts[:, column.mask_of(success_states)].sum(axis=1)
+        errors += cube[:, column.mask_of(error_states), 0].sum(axis=1)
+    return _summaries(
+        table.columns["stat_type"].values, state_values, counts, success, errors
+    )
+
+
+def _summaries(
+    group_values: List[Any],
+    state_values: List[Any],
+    counts: np.ndarray,
+    success: np.ndarray,
+    errors: np.ndarray,
+) -> Dict[str, Dict[str, Any]]:
+    totals = counts.sum(axis=1)
+    summaries = {}
+    for code, group in enumerate(group_values):
+        if totals[code] == 0:
+            continue
+        summaries[group] = {
+            "total": int(totals[code]),
+            "states": {
+                state_values[i]: int(count)
+                for i, count in enumerate(counts[code])
+                if count > 0
+            },
+            "success_count": int(success[code]),
+            "error_count": int(errors[code]),
+        }
+    return summaries
+
+
+class AnalyticsEngine:
+    """The police_data and stat_data tables of one process"""
+
+    def __init__(self, refresh_window: timedelta):
+        self.police = CollectionLoader(police_table, refresh_window)
+        self.stats = CollectionLoader(stat_table, refresh_window)
+
+
+_engine: Optional[AnalyticsEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_analytics_engine() -> AnalyticsEngine:
+    """Process-wide engine, created on first use"""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            from settings import settings
+
+            _engine = AnalyticsEngine(timedelta(hours=settings.ANALYTICS_REFRESH_HOURS))
+        return _engine
@@ -0,0 +1,179 @@
+"""
+Process-wide cache for dashboard aggregations.
+
+Reflex keeps one state instance per browser session, so a cache stored on
+the state is recomputed by every new tab. This module keeps one cache per
+worker process, shared by all sessions, keyed by query and time window.
+Concurrent misses on the same key are coalesced so that only one
+computation runs and every waiting session receives its result.
+
+Entries older than the TTL are stale, not gone: they can still be served
+while a refresh runs (stale-while-revalidate) until they reach the stale
+TTL, after which they are evicted. When callers pass the data version of
+the underlying collection, an entry computed for an older version is stale
+as well, whatever its age.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from monitoring.metrics import metrics
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    timestamp: float
+    version: Optional[int] = None
+
+    def age(self, now: Optional[float] = None) -> float:
+        """Seconds elapsed since the entry was computed."""
+        return (now if now is not None else time.time()) - self.timestamp
+
+
+class DashboardCache:
+    """TTL cache with single-flight computation and stale reads per key."""
+
+    def __init__(self, ttl: Optional[float] = None, stale_ttl: Optional[float] = None):
+        self._ttl = ttl
+        self._stale_ttl = stale_ttl
+        self._entries: Dict[Hashable, CacheEntry] = {}
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    @property
+    def ttl(self) -> float:
+        """Seconds an entry stays fresh, CACHE_TIMEOUT unless given explicitly."""
+        if self._ttl is None:
+            # Lazy import: the police config package imports the states that
+            # import this module.
+            from app.states.police.config import CACHE_TIMEOUT
+
+            self._ttl = CACHE_TIMEOUT
+        return self._ttl
+
+    @property
+    def stale_ttl(self) -> float:
+        """Seconds an entry may be served stale, STALE_TIMEOUT by default."""
+        if self._stale_ttl is None:
+            from app.states.police.config import STALE_TIMEOUT
+
+            self._stale_ttl = STALE_TIMEOUT
+        return max(self._stale_ttl, self.ttl)
+
+    def is_fresh(
+        self,
+        entry: CacheEntry,
+        version: Optional[int] = None,
+        max_age: Optional[float] = None,
+    ) -> bool:
+        """
+        Check whether an entry is younger than the TTL and up to date.
+
+        max_age shortens the TTL for this check, e.g. for a time window that
+        moves with the clock.
+        """
+        if version is not None and entry.version != version:
+            return False
+        ttl = self.ttl if max_age is None else min(self.ttl, max_age)
+        return entry.age() < ttl
+
+    def get_stale(self, key: Hashable) -> Optional[CacheEntry]:
+        """Return the entry for key, fresh or stale, unless it was evicted."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.age() >= self.stale_ttl:
+            del self._entries[key]
+            return None
+        return entry
+
+    def lookup(
+        self,
+        key: Hashable,
+        version: Optional[int] = None,
+        max_age: Optional[float] = None,
+    ) -> Tuple[Optional[CacheEntry], bool]:
+        """
+        Return the entry for key, fresh or stale, and whether it is fresh
+
+        Each lookup is counted as a hit, stale or miss in the
+        dashboard_cache_requests_total metric, labelled with the first
+        element of the key.
+        """
+        entry = self.get_stale(key)
+        fresh = entry is not None and self.is_fresh(entry, version, max_age)
+        if entry is None:
+            result = "miss"
+        else:
+            result = "hit" if fresh else "stale"
+        cache_name = key[0] if isinstance(key, tuple) and key else str(key)
+        metrics.inc("dashboard_cache_requests_total", cache=cache_name, result=result)
+        return entry, fresh
+
+    def set(
+        self, key: Hashable, value: Any, version: Optional[int] = None
+    ) -> CacheEntry:
+        """Store a value and evict every entry past the stale TTL."""
+        now = time.time()
+        self._evict_expired(now)
+        entry = CacheEntry(value=value, timestamp=now, version=version)
+        self._entries[key] = entry
+        return entry
+
+    async def refresh(
+        self,
+        key: Hashable,
+        compute: Callable[[], Any],
+        version: Optional[int] = None,
+    ) -> CacheEntry:
+        """
+        Recompute key regardless of freshness, joining any running refresh
+
+        Used on a miss and to revalidate a stale entry after it has been
+        served. The blocking compute callable runs in a worker thread so
+        the event loop keeps serving other sessions, and callers that
+        refresh while a computation for the same key and version is running
+        wait for that computation instead of starting their own.
+
+        Args:
+            key: Hashable cache key, e.g. ("police_dashboard", window)
+            compute: Callable returning the value to cache
+            version: Data version read before computing, if known
+
+        Returns:
+            CacheEntry holding the value and the time it was computed
+        """
+        flight_key = (key, version)
+        in_flight = self._in_flight.get(flight_key)
+        if in_flight is not None:
+            return await asyncio.shield(in_flight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[flight_key] = future
+        try:
+            value = await asyncio.to_thread(compute)
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody else was waiting
+            future.exception()
+            raise
+        else:
+            entry = self.set(key, value, version)
+            future.set_result(entry)
+            return entry
+        finally:
+            self._in_flight.pop(flight_key, None)
+
+    def _evict_expired(self, now: float):
+        expired = [
+            key
+            for key, entry in self._entries.items()
+            if entry.age(now) >= self.stale_ttl
+        ]
+        for key in expired:
+            del self._entries[key]
+
+
+# Shared by every session served by this worker process
+dashboard_cache = DashboardCache()
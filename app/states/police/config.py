@@ -40,5 +40,11 @@ STATUS_LABELS = StatusLabel()
 STATUS_COLORS = StatusColor()
 STATUS_ICONS = StatusIcon()
 
-# Cache timeout in seconds
-CACHE_TIMEOUT = 300
+# Cache timeout in seconds. Syncs bump a data version that invalidates the
+# dashboard cache as soon as new data lands, so this only bounds how long an
+# unchanged result is trusted.
+CACHE_TIMEOUT = 3600
+
+# Seconds a dashboard result may still be shown (marked as stale) while a
+# background refresh runs after CACHE_TIMEOUT has passed
+STALE_TIMEOUT = 24 * 60 * 60
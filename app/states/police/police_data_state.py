@@ -1,8 +1,16 @@
+import asyncio
 import reflex as rx
 from services.police.police_data_mongo_service import PoliceDataMongoService
-from app.states.success_rate_utils import calculate_police_success_rate
+from app.states.police.analyzer import (
+    analyze_police_errors,
+    get_error_rules_for_police_type,
+)
+from app.states.success_rate_utils import success_rate_statuses
 from database_manager import DatabaseManager
-from typing import Dict, Any
+from services.data_version_service import DataVersionService
+from services.mongo_reads import created_at_match, first_created_at
+from typing import Dict, Any, Optional
+from datetime import datetime
 
 from settings import settings
 from dataclasses import dataclass, field
@@ -15,6 +23,15 @@ from app.states.police.config import (
     STATUS_ICONS,
     CACHE_TIMEOUT,
 )
+from app.states.dashboard_cache import CacheEntry, dashboard_cache
+from app.states.time_window import (
+    ALL_TIME,
+    CUSTOM_WINDOW,
+    TimeWindow,
+    resolve_time_window,
+)
+from app.states.trend_series import load_success_rate_trend
+from monitoring.metrics import timed_event
 
 from logging import Logger
 
@@ -31,6 +48,12 @@ class PoliceTypeStatusResult:
     icon: str
     success_records: int
     states: Dict[str, int] = field(default_factory=dict)
+    # Same numbers for the previous window of equal length, when the
+    # selected window has a start
+    has_previous: bool = False
+    previous_total_records: int = 0
+    previous_success_rate: float = 0.0
+    success_rate_delta: float = 0.0
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "PoliceTypeStatusResult":
@@ -43,6 +66,10 @@ class PoliceTypeStatusResult:
             icon=data["icon"],
             success_records=data["success_records"],
             states=data.get("states", {}),
+            has_previous=data.get("has_previous", False),
+            previous_total_records=data.get("previous_total_records", 0),
+            previous_success_rate=data.get("previous_success_rate", 0.0),
+            success_rate_delta=data.get("success_rate_delta", 0.0),
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -55,6 +82,10 @@ class PoliceTypeStatusResult:
             "icon": self.icon,
             "success_records": self.success_records,
             "states": self.states,
+            "has_previous": self.has_previous,
+            "previous_total_records": self.previous_total_records,
+            "previous_success_rate": self.previous_success_rate,
+            "success_rate_delta": self.success_rate_delta,
         }
 
 
@@ -66,6 +97,17 @@ class PoliceDataState(rx.State):
     error_message: str = ""
     selected_police_type: str = ""
     cache_timestamp: float = 0
+    # True while stale numbers are shown and a refresh is running
+    is_stale: bool = False
+    # Sync data version the cached numbers were computed from
+    data_version: int = 0
+    # Time window of every view (see time_window); custom bounds are ISO
+    # strings from the selector's inputs. window_key is the window the
+    # shown numbers were computed for.
+    time_window: str = ALL_TIME
+    custom_window_start: str = ""
+    custom_window_end: str = ""
+    window_key: str = ""
 
     # Modal state for showing reasons by state
     show_reasons_modal: bool = False
@@ -75,120 +117,421 @@ class PoliceDataState(rx.State):
     # Pagination for reasons modal
     reasons_current_page: int = 1
     reasons_items_per_page: int = 5
+    # Distinct reasons and documents with a reason, over all matching records
     total_reasons_count: int = 0
+    total_reason_records: int = 0
     limit_of_details: int = 10
 
+    # Recent records for the selected police type, loaded by
+    # fetch_police_type_recent_records. The key records the police type and
+    # data version they were loaded for.
+    police_type_recent_records: list[dict] = []
+    recent_records_key: str = ""
+    recent_records_loading: bool = False
+
+    # Success-rate trend of the selected police type, loaded by
+    # fetch_police_type_trend; trend_key works like recent_records_key
+    police_type_trend: list[dict] = []
+    trend_bucket_label: str = ""
+    trend_key: str = ""
+    trend_loading: bool = False
+
     # Cache timeout in seconds (from config)
     CACHE_TIMEOUT: float = CACHE_TIMEOUT
 
     @rx.event(background=True)
+    @timed_event
     async def fetch_dashboard_stats(self):
-        """Fetch only dashboard statistics (much faster than full data)."""
+        """
+        Fetch dashboard statistics with stale-while-revalidate semantics
+
+        A cached result is shown immediately. When it is older than
+        CACHE_TIMEOUT, or a sync has bumped the data version since it was
+        computed, it is marked as stale and refreshed in the background, so
+        only the very first load waits for the aggregations.
+        """
         import time
 
+        # Use singleton database manager for connection pooling
+        db_manager = DatabaseManager.get_instance()
+        db_manager.connect_mongo(
+            connection_string=settings.get_mongo_connection_string(),
+            database=settings.get_mongo_database(),
+        )
+        # One point read tells us whether a sync changed the data
+        try:
+            data_version = DataVersionService(db_manager).get_version("police_data")
+        except Exception as e:
+            logger.error(f"Failed to read data version: {str(e)}")
+            data_version = None
+
+        window = self._time_window()
+        timeout = self.CACHE_TIMEOUT
+        if window.max_age is not None:
+            timeout = min(timeout, window.max_age)
+
         # Check if cache is still valid
         current_time = time.time()
         if (
             self.stats_cache
-            and (current_time - self.cache_timestamp) < self.CACHE_TIMEOUT
+            and self.window_key == window.key
+            and (data_version is None or data_version == self.data_version)
+            and (current_time - self.cache_timestamp) < timeout
         ):
             async with self:
                 self.loading = False
             return
 
-        # Use singleton database manager for connection pooling
-        db_manager = DatabaseManager.get_instance()
-        db_manager.connect_mongo(
-            connection_string=settings.get_mongo_connection_string(),
-            database=settings.get_mongo_database(),
-        )
         police_data_service = PoliceDataMongoService(db_manager=db_manager)
-        # Use context manager to modify state in background task
-        async with self:
-            try:
-                # Get aggregated statistics instead of all data
-                stats = police_data_service.get_statistics()
-                self.stats_cache = stats
-                self.cache_timestamp = current_time
-                # Get police type status data
-                self.police_type_data = await self._get_police_type_statistics(
-                    police_data_service
-                )
+        cache_key = ("police_dashboard", window.key)
+
+        # Serve whatever we have right away, even if it is stale
+        entry, fresh = dashboard_cache.lookup(cache_key, data_version, window.max_age)
+        if entry is not None:
+            async with self:
+                if self._time_window().key != window.key:
+                    return
+                self._apply_dashboard_entry(entry, window.key)
+                self.is_stale = not fresh
+            if fresh:
+                return
+        elif self.stats_cache:
+            async with self:
+                self.is_stale = True
                 self.loading = False
-            except Exception as e:
-                self.error_message = f"Failed to load data: {str(e)}"
+
+        try:
+            # Shared across sessions: concurrent refreshes wait on one computation
+            entry = await dashboard_cache.refresh(
+                cache_key,
+                lambda: PoliceDataState._load_dashboard_data(
+                    police_data_service,
+                    data_version,
+                    window.start,
+                    window.end,
+                    window.previous_start,
+                ),
+                version=data_version,
+            )
+        except Exception as e:
+            async with self:
+                if self.stats_cache:
+                    # Keep showing the last good result, still marked as stale
+                    logger.error(f"Failed to refresh dashboard stats: {str(e)}")
+                else:
+                    self.error_message = f"Failed to load data: {str(e)}"
                 self.loading = False
+            return
 
-    async def _get_police_type_statistics(
-        self, service: PoliceDataMongoService
+        # Use context manager to modify state in background task
+        async with self:
+            # Drop the result if another window was chosen meanwhile
+            if self._time_window().key != window.key:
+                return
+            self._apply_dashboard_entry(entry, window.key)
+            self.is_stale = False
+
+    def _time_window(self) -> TimeWindow:
+        """The window chosen in the selector, resolved to datetimes."""
+        return resolve_time_window(
+            self.time_window, self.custom_window_start, self.custom_window_end
+        )
+
+    @rx.event
+    def set_time_window(self, window: str | list[str]):
+        """Switch every view to another time window."""
+        # The segmented control may send its value as a list
+        if isinstance(window, list):
+            window = window[0] if window else ALL_TIME
+        self.time_window = window
+        if window != CUSTOM_WINDOW:
+            return PoliceDataState.fetch_dashboard_stats
+
+    @rx.event
+    def apply_custom_window(self, form_data: dict):
+        """Switch to the custom window entered in the selector's form."""
+        self.custom_window_start = form_data.get("start", "")
+        self.custom_window_end = form_data.get("end", "")
+        self.time_window = CUSTOM_WINDOW
+        return PoliceDataState.fetch_dashboard_stats
+
+    def _apply_dashboard_entry(self, entry: CacheEntry, window_key: str):
+        """Copy a shared cache entry into this session's state."""
+        self.window_key = window_key
+        self.stats_cache = dict(entry.value["stats"])
+        self.police_type_data = dict(entry.value["police_type_data"])
+        self.cache_timestamp = entry.timestamp
+        self.data_version = entry.version or 0
+        self.error_message = ""
+        self.loading = False
+
+    @staticmethod
+    def _load_dashboard_data(
+        service: PoliceDataMongoService,
+        data_version: Optional[int] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        previous_start: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run the dashboard aggregations (executed once per cache miss).
+
+        start and end limit the numbers to a created_at range; with
+        previous_start, the police types are also compared with the period
+        from previous_start to start.
+        """
+        if settings.ANALYTICS_ENGINE == "numpy":
+            return PoliceDataState._load_dashboard_data_from_columns(
+                service, data_version, start, end, previous_start
+            )
+        return {
+            # Get aggregated statistics instead of all data
+            "stats": service.get_statistics(start, end),
+            # Get police type status data
+            "police_type_data": PoliceDataState._get_police_type_statistics(
+                service, start, end, previous_start
+            ),
+        }
+
+    @staticmethod
+    def _load_dashboard_data_from_columns(
+        service: PoliceDataMongoService,
+        data_version: Optional[int],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        previous_start: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """Answer the dashboard from the in-memory columnar engine."""
+        from app.states.analytics_engine import (
+            get_analytics_engine,
+            police_statistics,
+            police_type_summaries,
+        )
+
+        codes = service.codes
+        full_table = get_analytics_engine().police.refresh(
+            service._get_collection(),
+            data_version,
+            codes.decode_document if codes else None,
+        )
+        table = full_table.between(start, end)
+        police_type_stats = {}
+        summaries = police_type_summaries(table, SUCCESS_STATES, ERROR_STATES)
+        statuses = success_rate_statuses(
+            [summary["success_count"] for summary in summaries.values()],
+            [summary["error_count"] for summary in summaries.values()],
+        )
+        for (police_type, summary), status in zip(summaries.items(), statuses):
+            police_type_stats[police_type] = PoliceTypeStatusResult(
+                police_type=police_type,
+                total_records=summary["total"],
+                success_rate=round(status.success_rate, 1),
+                status=status.status,
+                color=status.color,
+                icon=status.icon,
+                success_records=summary["success_count"],
+                states=summary["states"],
+            )
+        if previous_start is not None:
+            previous = police_type_summaries(
+                full_table.between(previous_start, start),
+                SUCCESS_STATES,
+                ERROR_STATES,
+            )
+            PoliceDataState._add_previous_period(
+                police_type_stats,
+                {
+                    police_type: (
+                        summary["total"],
+                        summary["success_count"],
+                        summary["error_count"],
+                    )
+                    for police_type, summary in previous.items()
+                },
+            )
+        return {
+            "stats": police_statistics(table),
+            "police_type_data": police_type_stats,
+        }
+
+    @staticmethod
+    def _get_police_type_statistics(
+        service: PoliceDataMongoService,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        previous_start: Optional[datetime] = None,
     ) -> Dict[str, PoliceTypeStatusResult]:
-        """Get aggregated statistics by police type."""
+        """
+        Get aggregated statistics by police type, within a time range if given.
+
+        With previous_start, the same aggregation also reads the period from
+        previous_start to start: a $cond on created_at sends each document
+        to the current or the previous period's counters, so both periods
+        take one pass over the collection.
+        """
         # Get aggregated data by police type and state
         collection = service._get_collection()
+        codes = service.codes
         success_states = SUCCESS_STATES
         error_states = ERROR_STATES
-        # Simplified aggregation pipeline for police type statistics
-        pipeline = [
-            {
-                "$group": {
-                    "_id": "$police_type",
-                    "states": {"$push": {"state": "$state", "count": 1}},
-                    "total": {"$sum": 1},
-                    "docs": {"$push": {"state": "$state", "reason": "$reason"}},
-                }
+        is_error = {"$in": ["$state", codes.encode_values("state", error_states)]}
+        error_doc = {"state": "$state", "reason": "$reason"}
+        # The previous period ends where the current one starts
+        match = created_at_match(previous_start or start, end)
+        group = {
+            "_id": "$police_type",
+            "states": {"$push": {"state": "$state", "count": 1}},
+            "total": {"$sum": 1},
+            # Only error documents can count against the success
+            # rate; the others would just inflate the result
+            "docs": {"$push": {"$cond": [is_error, error_doc, "$$REMOVE"]}},
+        }
+        if previous_start is not None:
+            is_current = {"$gte": ["$created_at", start.isoformat()]}
+            is_previous = {"$not": [is_current]}
+            is_success = {
+                "$in": ["$state", codes.encode_values("state", success_states)]
             }
-        ]
+            group.update(
+                {
+                    "states": {
+                        "$push": {
+                            "$cond": [
+                                is_current,
+                                {"state": "$state", "count": 1},
+                                "$$REMOVE",
+                            ]
+                        }
+                    },
+                    "total": {"$sum": {"$cond": [is_current, 1, 0]}},
+                    "docs": {
+                        "$push": {
+                            "$cond": [
+                                {"$and": [is_current, is_error]},
+                                error_doc,
+                                "$$REMOVE",
+                            ]
+                        }
+                    },
+                    "previous_total": {"$sum": {"$cond": [is_current, 0, 1]}},
+                    "previous_success": {
+                        "$sum": {"$cond": [{"$and": [is_previous, is_success]}, 1, 0]}
+                    },
+                    "previous_docs": {
+                        "$push": {
+                            "$cond": [
+                                {"$and": [is_previous, is_error]},
+                                error_doc,
+                                "$$REMOVE",
+                            ]
+                        }
+                    },
+                }
+            )
+        pipeline = [*match, {"$group": group}]
         from collections import Counter
 
         result = list(collection.aggregate(pipeline))
         # Process the aggregated data
-        police_type_stats = {}
+        rows = []
+        previous_counts = {}
         for item in result:
-            police_type = item["_id"]
+            police_type = codes.decode("police_type", item["_id"])
             total_records = item["total"]
+            if previous_start is not None:
+                previous_docs = item.get("previous_docs", [])
+                if codes:
+                    previous_docs = [
+                        codes.decode_document(doc) for doc in previous_docs
+                    ]
+                previous_errors = analyze_police_errors(
+                    docs=previous_docs,
+                    police_type=police_type,
+                    error_states=error_states,
+                )
+                previous_counts[police_type] = (
+                    item["previous_total"],
+                    item["previous_success"],
+                    len(previous_errors),
+                )
+                # Only in the previous period: no card for the current one
+                if total_records == 0:
+                    continue
             # Aggregate state counts properly
             state_counter: Counter[str] = Counter()
             for state_info in item["states"]:
-                state = state_info["state"]
+                state = codes.decode("state", state_info["state"])
                 count = state_info["count"]
                 state_counter[state] += count
             states = dict(state_counter)
             success_count = sum(
                 count for state, count in states.items() if state in success_states
             )
-            success_rate = calculate_police_success_rate(
-                success_count=success_count,
-                error_states=error_states,
-                docs=item.get("docs", []),
+            docs = item.get("docs", [])
+            if codes:
+                docs = [codes.decode_document(doc) for doc in docs]
+            errors = analyze_police_errors(
+                docs=docs,
                 police_type=police_type,
+                error_states=error_states,
+            )
+            rows.append(
+                (police_type, total_records, states, success_count, len(errors))
             )
-            # Determine status
-            if success_rate >= SUCCESS_RATE_THRESHOLDS.good:
-                status = STATUS_LABELS.good
-                color = STATUS_COLORS.good
-                icon = STATUS_ICONS.good
-            elif success_rate >= SUCCESS_RATE_THRESHOLDS.warning:
-                status = STATUS_LABELS.warning
-                color = STATUS_COLORS.warning
-                icon = STATUS_ICONS.warning
-            else:
-                status = STATUS_LABELS.error
-                color = STATUS_COLORS.error
-                icon = STATUS_ICONS.error
 
+        # Success rates and statuses of all police types in one pass
+        statuses = success_rate_statuses(
+            [row[3] for row in rows], [row[4] for row in rows]
+        )
+        police_type_stats = {}
+        for (police_type, total_records, states, success_count, _), status in zip(
+            rows, statuses
+        ):
             police_type_stats[police_type] = PoliceTypeStatusResult(
                 police_type=police_type,
                 total_records=total_records,
-                success_rate=round(success_rate, 1),
-                status=status,
-                color=color,
-                icon=icon,
+                success_rate=round(status.success_rate, 1),
+                status=status.status,
+                color=status.color,
+                icon=status.icon,
                 success_records=success_count,
                 states=states,
             )
+        if previous_start is not None:
+            PoliceDataState._add_previous_period(police_type_stats, previous_counts)
 
         return police_type_stats
 
+    @staticmethod
+    def _add_previous_period(
+        police_type_stats: Dict[str, PoliceTypeStatusResult],
+        previous_counts: Dict[str, tuple],
+    ):
+        """
+        Fill in the previous-period fields of each result
+
+        Args:
+            police_type_stats: Results of the current period, updated in place
+            previous_counts: (total, success count, error count) of the
+                previous period per police type
+        """
+        compared = [
+            (result, previous_counts[police_type])
+            for police_type, result in police_type_stats.items()
+            if previous_counts.get(police_type, (0,))[0] > 0
+        ]
+        statuses = success_rate_statuses(
+            [counts[1] for _, counts in compared],
+            [counts[2] for _, counts in compared],
+        )
+        for (result, counts), status in zip(compared, statuses):
+            result.has_previous = True
+            result.previous_total_records = counts[0]
+            result.previous_success_rate = round(status.success_rate, 1)
+            result.success_rate_delta = round(
+                result.success_rate - result.previous_success_rate, 1
+            )
+
     @rx.event(background=True)
     async def fetch_police_data(self):
         """
@@ -200,6 +543,10 @@ class PoliceDataState(rx.State):
     def set_selected_police_type(self, police_type: str):
         """Set the selected police type for detailed view."""
         self.selected_police_type = police_type
+        return [
+            PoliceDataState.fetch_police_type_recent_records,
+            PoliceDataState.fetch_police_type_trend,
+        ]
 
     @rx.var
     def get_current_police_type_from_url(self) -> str:
@@ -359,6 +706,11 @@ class PoliceDataState(rx.State):
                     "success_rate": getattr(data, "success_rate", 0.0),
                     "total_records": getattr(data, "total_records", 0),
                     "success_records": getattr(data, "success_records", 0),
+                    "has_previous": data.has_previous,
+                    "previous_success_rate": data.previous_success_rate,
+                    "success_rate_delta": data.success_rate_delta,
+                    "delta_label": f"{data.success_rate_delta:+.1f}",
+                    "delta_color": "green" if data.success_rate_delta >= 0 else "red",
                 }
             )
 
@@ -404,7 +756,10 @@ class PoliceDataState(rx.State):
     @rx.var
     def get_police_type_recent_records(self) -> list[dict]:
         """Get recent records (state and reason) for selected police type."""
-        # Get police_type from URL params if selected_police_type is not set
+        return self.police_type_recent_records
+
+    def _resolve_police_type(self) -> str:
+        """Get the selected police type, falling back to the URL path."""
         police_type = self.selected_police_type
         if not police_type:
             try:
@@ -412,38 +767,128 @@ class PoliceDataState(rx.State):
                 path = self.router.url.path
                 if "/police-type/" in path:
                     police_type = path.split("/police-type/")[-1]
-                else:
-                    police_type = ""
             except Exception:
                 police_type = ""
+        return police_type
+
+    @rx.event(background=True)
+    @timed_event
+    async def fetch_police_type_recent_records(self):
+        """
+        Load recent records for the selected police type into state
+
+        The query only runs when the police type or the synced data version
+        differs from the ones the stored records were loaded for.
+        """
+        police_type = self._resolve_police_type()
         if not police_type:
-            return []
+            async with self:
+                self.police_type_recent_records = []
+                self.recent_records_key = ""
+            return
 
-        # Use the DB manager to get records for the selected police type
+        db_manager = DatabaseManager.get_instance()
+        db_manager.connect_mongo(
+            connection_string=settings.get_mongo_connection_string(),
+            database=settings.get_mongo_database(),
+        )
         try:
-            # Create a new database connection
-            db_manager = DatabaseManager.get_instance()
-            mongo_db = db_manager.connect_mongo(
-                connection_string=settings.get_mongo_connection_string(),
-                database=settings.get_mongo_database(),
-            )
-            collection = mongo_db["police_data"]
-            # Exclude documents with state "NEW"
-            records = list(
-                collection.find(
-                    {
-                        "police_type": police_type,
-                        "state": {"$nin": ["NEW", "SCHEDULED", "CANCELED"]},
-                    },
-                    {"state": 1, "reason": 1, "created_at": 1, "_id": 0},
-                )
-                .sort("created_at", -1)
-                .limit(self.limit_of_details)
+            data_version = DataVersionService(db_manager).get_version("police_data")
+        except Exception as e:
+            logger.error(f"Failed to read data version: {str(e)}")
+            data_version = None
+        window = self._time_window()
+        records_key = f"{police_type}:{window.key}:{data_version}"
+        if data_version is not None and records_key == self.recent_records_key:
+            return
+
+        async with self:
+            self.recent_records_loading = True
+        try:
+            service = PoliceDataMongoService(db_manager=db_manager)
+            records = await asyncio.to_thread(
+                service.get_recent_records,
+                police_type,
+                self.limit_of_details,
+                None,
+                window.start,
+                window.end,
             )
-            return records
         except Exception as e:
             logger.error(f"Error fetching recent records: {str(e)}")
-            return []
+            async with self:
+                self.police_type_recent_records = []
+                self.recent_records_key = ""
+                self.recent_records_loading = False
+            return
+
+        async with self:
+            self.police_type_recent_records = records
+            self.recent_records_key = records_key
+            self.recent_records_loading = False
+
+    @rx.event(background=True)
+    @timed_event
+    async def fetch_police_type_trend(self):
+        """
+        Load the success-rate trend of the selected police type
+
+        The series comes from the process-wide trend cache, which only
+        aggregates the buckets it lacks; nothing runs when the police type,
+        window and data version are the ones the stored trend is for.
+        """
+        police_type = self._resolve_police_type()
+        if not police_type:
+            async with self:
+                self.police_type_trend = []
+                self.trend_key = ""
+            return
+
+        db_manager = DatabaseManager.get_instance()
+        db_manager.connect_mongo(
+            connection_string=settings.get_mongo_connection_string(),
+            database=settings.get_mongo_database(),
+        )
+        try:
+            data_version = DataVersionService(db_manager).get_version("police_data")
+        except Exception as e:
+            logger.error(f"Failed to read data version: {str(e)}")
+            data_version = None
+        window = self._time_window()
+        trend_key = f"{police_type}:{window.key}:{data_version}"
+        if data_version is not None and trend_key == self.trend_key:
+            return
+
+        async with self:
+            self.trend_loading = True
+        try:
+            service = PoliceDataMongoService(db_manager=db_manager)
+            rules = get_error_rules_for_police_type(police_type)
+            points, bucket = await asyncio.to_thread(
+                load_success_rate_trend,
+                ("police_data", police_type, window.key),
+                data_version,
+                window.start,
+                window.end,
+                lambda: first_created_at(service._get_collection()),
+                lambda *args: service.get_state_buckets(police_type, *args),
+                SUCCESS_STATES,
+                ERROR_STATES,
+                rules.is_expected_error,
+            )
+        except Exception as e:
+            logger.error(f"Error fetching success-rate trend: {str(e)}")
+            async with self:
+                self.police_type_trend = []
+                self.trend_key = ""
+                self.trend_loading = False
+            return
+
+        async with self:
+            self.police_type_trend = points
+            self.trend_bucket_label = bucket.label if bucket else ""
+            self.trend_key = trend_key
+            self.trend_loading = False
 
     @rx.var
     def get_police_type_state_distribution(self) -> list[dict]:
@@ -502,117 +947,72 @@ class PoliceDataState(rx.State):
         self.selected_state = ""
         self.state_reasons = []
         self.total_reasons_count = 0
+        self.total_reason_records = 0
         self.reasons_current_page = 1
 
-    @rx.event(background=True)
-    async def show_reasons_for_state(self):
+    @rx.event
+    def show_reasons_for_state(self):
         """Show modal with reasons for the selected state."""
-        # Debug: Log the current selected_state at the very beginning
-        initial_state = self.selected_state
-        print(
-            f"DEBUG: show_reasons_for_state called with "
-            f"initial selected_state: '{initial_state}'"
-        )
-
-        # IMMEDIATELY set show_reasons_modal to True to open the modal
-        async with self:
-            self.show_reasons_modal = True
-            current_state = self.selected_state
-            print(
-                f"DEBUG: Inside async context, selected_state is: " f"'{current_state}'"
-            )
-            print(f"DEBUG: Modal opened with state: '{current_state}'")
-
-        # Get police_type from URL params if selected_police_type is not set
-        police_type = self.selected_police_type
-        if not police_type:
-            try:
-                # Try to extract police_type from the URL path
-                path = self.router.url.path
-                if "/police-type/" in path:
-                    police_type = path.split("/police-type/")[-1]
-                else:
-                    police_type = ""
-            except Exception:
-                police_type = ""
+        self.show_reasons_modal = True
+        self.reasons_current_page = 1
+        return PoliceDataState.fetch_reasons_page
 
-        final_state = self.selected_state
-        print(
-            f"DEBUG: Using police_type: '{police_type}', "
-            f"final selected_state: '{final_state}'"
-        )
+    @rx.event(background=True)
+    @timed_event
+    async def fetch_reasons_page(self):
+        """
+        Load the current page of reasons for the selected state
 
-        if not police_type:
+        Only the displayed page is held in state; the counts and totals are
+        computed over all matching documents by the aggregation.
+        """
+        police_type = self._resolve_police_type()
+        state = self.selected_state
+        if not police_type or not state:
             async with self:
                 self.state_reasons = []
+                self.total_reasons_count = 0
+                self.total_reason_records = 0
             return
 
-        # Fetch reasons for this state and police type
+        page = self.reasons_current_page
+        per_page = self.reasons_items_per_page
         try:
             db_manager = DatabaseManager.get_instance()
-            mongo_db = db_manager.connect_mongo(
+            db_manager.connect_mongo(
                 connection_string=settings.get_mongo_connection_string(),
                 database=settings.get_mongo_database(),
             )
-            collection = mongo_db["police_data"]
-
-            # Debug: Log the query parameters
-            state = self.selected_state
+            service = PoliceDataMongoService(db_manager=db_manager)
             logger.info(
-                f"Fetching reasons for police_type: {police_type}, " f"state: {state}"
+                f"Fetching reasons for police_type: {police_type}, "
+                f"state: {state}, page: {page}"
             )
-            print(f"DEBUG: About to query database with state: '{state}'")
-
-            # First, let's check if there are any records at all for this
-            # police_type and state
-            total_records = collection.count_documents(
-                {"police_type": police_type, "state": self.selected_state}
-            )
-            logger.info(
-                f"Total records found: {total_records} for "
-                f"police_type {police_type} and state {state}"
+            window = self._time_window()
+            result = await asyncio.to_thread(
+                service.get_reason_counts,
+                police_type,
+                state,
+                (page - 1) * per_page,
+                per_page,
+                window.start,
+                window.end,
             )
 
-            # Get records for this police type and state with reasons
-            records = list(
-                collection.find(
-                    {
-                        "police_type": police_type,
-                        "state": self.selected_state,
-                        "reason": {"$exists": True, "$nin": [None, ""]},
-                    },
-                    {"reason": 1, "created_at": 1, "_id": 0},
-                )
-                .sort("created_at", -1)
-                .limit(100)
-            )  # Limit to prevent overflow
-
-            logger.info(f"Records with reasons found: {len(records)}")
-            if records:
-                logger.info(f"Sample record: {records[0]}")
-
-            # Group by reason and count occurrences
-            from collections import Counter
-
-            reason_counter = Counter([r.get("reason", "Unknown") for r in records])
-
-            # Convert to list format for display
-            reasons_list = [
-                {"reason": reason, "count": count}
-                for reason, count in reason_counter.most_common()
-            ]
-
             async with self:
-                self.state_reasons = reasons_list
-                self.total_reasons_count = len(reasons_list)
-                self.reasons_current_page = 1  # Reset to first page
+                # Drop the result if the user moved on while it was loading
+                if self.selected_state != state or self.reasons_current_page != page:
+                    return
+                self.state_reasons = result["reasons"]
+                self.total_reasons_count = result["total_reasons"]
+                self.total_reason_records = result["total_records"]
 
         except Exception as e:
-            state = self.selected_state
             logger.error(f"Error fetching reasons for state {state}: {str(e)}")
             async with self:
                 self.state_reasons = []
                 self.total_reasons_count = 0
+                self.total_reason_records = 0
                 self.reasons_current_page = 1
 
     def handle_state_click(self, state_name: str):
@@ -675,16 +1075,12 @@ class PoliceDataState(rx.State):
     @rx.var
     def get_state_reasons_count(self) -> int:
         """Get the count of unique reasons for the selected state."""
-        return len(self.state_reasons)
+        return self.total_reasons_count
 
     @rx.var
     def get_paginated_reasons(self) -> list[dict]:
         """Get the current page of reasons."""
-        page = self.reasons_current_page
-        per_page = self.reasons_items_per_page
-        start_index = (page - 1) * per_page
-        end_index = start_index + per_page
-        return self.state_reasons[start_index:end_index]
+        return self.state_reasons
 
     @rx.var
     def get_total_pages(self) -> int:
@@ -713,12 +1109,93 @@ class PoliceDataState(rx.State):
         """Go to the previous page of reasons."""
         if self.has_previous_page:
             self.reasons_current_page -= 1
+            return PoliceDataState.fetch_reasons_page
 
     def go_to_next_page(self):
         """Go to the next page of reasons."""
         if self.has_next_page:
             self.reasons_current_page += 1
+            return PoliceDataState.fetch_reasons_page
 
     def reset_pagination(self):
         """Reset pagination to first page."""
         self.reasons_current_page = 1
+
+    # Reason search on the detail page. Only the displayed page of matches
+    # is held in state; the totals come from the text-index aggregation.
+    reason_search_text: str = ""
+    reason_search_results: list[dict] = []
+    reason_search_counts: list[dict] = []
+    reason_search_total: int = 0
+    reason_search_page: int = 1
+    reason_search_per_page: int = 20
+    reason_search_loading: bool = False
+
+    @rx.event
+    def search_reasons(self, form_data: dict):
+        """Start a reason search from the search form."""
+        self.reason_search_text = form_data.get("text", "").strip()
+        self.reason_search_page = 1
+        return PoliceDataState.fetch_reason_search_page
+
+    @rx.event(background=True)
+    @timed_event
+    async def fetch_reason_search_page(self):
+        """Load the current page of records matching the reason search."""
+        text = self.reason_search_text
+        page = self.reason_search_page
+        per_page = self.reason_search_per_page
+        if not text:
+            async with self:
+                self.reason_search_results = []
+                self.reason_search_counts = []
+                self.reason_search_total = 0
+            return
+
+        async with self:
+            self.reason_search_loading = True
+        try:
+            db_manager = DatabaseManager.get_instance()
+            db_manager.connect_mongo(
+                connection_string=settings.get_mongo_connection_string(),
+                database=settings.get_mongo_database(),
+            )
+            service = PoliceDataMongoService(db_manager=db_manager)
+            result = await asyncio.to_thread(
+                service.search_reasons,
+                text,
+                self._resolve_police_type(),
+                (page - 1) * per_page,
+                per_page,
+            )
+        except Exception as e:
+            logger.error(f"Error searching reasons for '{text}': {str(e)}")
+            result = {"records": [], "counts": [], "total": 0}
+
+        async with self:
+            self.reason_search_loading = False
+            # Drop the result if a newer search or page was requested
+            if self.reason_search_text != text or self.reason_search_page != page:
+                return
+            self.reason_search_results = result["records"]
+            self.reason_search_counts = result["counts"]
+            self.reason_search_total = result["total"]
+
+    @rx.var
+    def reason_search_total_pages(self) -> int:
+        """Number of pages of reason search results."""
+        if self.reason_search_total == 0:
+            return 1
+        return (self.reason_search_total - 1) // self.reason_search_per_page + 1
+
+    def reason_search_previous_page(self):
+        """Go to the previous page of reason search results."""
+        if self.reason_search_page > 1:
+            self.reason_search_page -= 1
+            return PoliceDataState.fetch_reason_search_page
+
+    def reason_search_next_page(self):
+        """Go to the next page of reason search results."""
+        if self.reason_search_page < self.reason_search_total_pages:
+            self.reason_search_page += 1
+            return PoliceDataState.fetch_reason_search_page
@@ -1,9 +1,22 @@
 # Fixed remaining long lines in `StatisticsDataState`
+import asyncio
 import reflex as rx
 from services.stats.stats_data_mongo_service import StatDataMongoService
 from database_manager import DatabaseManager
-from typing import Dict, Any
-from app.states.success_rate_utils import calculate_stat_success_rate
+from services.data_version_service import DataVersionService
+from services.mongo_reads import (
+    created_at_match,
+    created_at_range,
+    find_fields,
+    first_created_at,
+)
+from typing import Dict, Any, Optional
+from datetime import datetime
+from app.states.statistics.analyzer import (
+    filter_expected_errors,
+    get_error_rules_for_stat_type,
+)
+from app.states.success_rate_utils import success_rate_statuses
 from settings import settings
 from dataclasses import dataclass, field
 from app.states.police.config import (
@@ -16,6 +29,15 @@ from app.states.police.config import (
     STATUS_ICONS,
     CACHE_TIMEOUT,
 )
+from app.states.dashboard_cache import CacheEntry, dashboard_cache
+from app.states.time_window import (
+    ALL_TIME,
+    CUSTOM_WINDOW,
+    TimeWindow,
+    resolve_time_window,
+)
+from app.states.trend_series import load_success_rate_trend
+from monitoring.metrics import timed_event
 
 from logging import Logger
 
@@ -68,56 +90,221 @@ class StatisticsDataState(rx.State):
     error_message: str = ""
     selected_statistics_type: str = ""
     cache_timestamp: float = 0
+    # True while stale numbers are shown and a refresh is running
+    is_stale: bool = False
+    # Sync data version the cached numbers were computed from
+    data_version: int = 0
+    # Time window of every view (see time_window); custom bounds are ISO
+    # strings from the selector's inputs. window_key is the window the
+    # shown numbers were computed for.
+    time_window: str = ALL_TIME
+    custom_window_start: str = ""
+    custom_window_end: str = ""
+    window_key: str = ""
 
     # Cache timeout in seconds (from config)
     CACHE_TIMEOUT: float = CACHE_TIMEOUT
 
     @rx.event(background=True)
+    @timed_event
     async def fetch_dashboard_stats(self):
-        """Fetch only dashboard statistics (much faster than full data)."""
+        """
+        Fetch dashboard statistics with stale-while-revalidate semantics
+
+        A cached result is shown immediately. When it is older than
+        CACHE_TIMEOUT, or a sync has bumped the data version since it was
+        computed, it is marked as stale and refreshed in the background, so
+        only the very first load waits for the aggregations.
+        """
         import time
 
+        # Use singleton database manager for connection pooling
+        db_manager = DatabaseManager.get_instance()
+        db_manager.connect_mongo(
+            connection_string=settings.get_mongo_connection_string(),
+            database=settings.get_mongo_database(),
+        )
+        # One point read tells us whether a sync changed the data
+        try:
+            data_version = DataVersionService(db_manager).get_version("stat_data")
+        except Exception as e:
+            logger.error(f"Failed to read data version: {str(e)}")
+            data_version = None
+
+        window = self._time_window()
+        timeout = self.CACHE_TIMEOUT
+        if window.max_age is not None:
+            timeout = min(timeout, window.max_age)
+
         # Check if cache is still valid
         current_time = time.time()
         if (
             self.stats_cache
-            and (current_time - self.cache_timestamp) < self.CACHE_TIMEOUT
+            and self.window_key == window.key
+            and (data_version is None or data_version == self.data_version)
+            and (current_time - self.cache_timestamp) < timeout
         ):
             async with self:
                 self.loading = False
             return
 
-        # Use singleton database manager for connection pooling
-        db_manager = DatabaseManager.get_instance()
-        db_manager.connect_mongo(
-            connection_string=settings.get_mongo_connection_string(),
-            database=settings.get_mongo_database(),
-        )
         stats_data_service = StatDataMongoService(db_manager=db_manager)
-        # Use context manager to modify state in background task
-        async with self:
-            try:
-                # Get aggregated statistics instead of all data
-                stats = stats_data_service.get_statistics()
-                self.stats_cache = stats
-                self.cache_timestamp = current_time
-                # Get statistics type status data
-                self.statistics_type_data = await self._get_statistics_type_statistics(
-                    stats_data_service
-                )
+        cache_key = ("statistics_dashboard", window.key)
+
+        # Serve whatever we have right away, even if it is stale
+        entry, fresh = dashboard_cache.lookup(cache_key, data_version, window.max_age)
+        if entry is not None:
+            async with self:
+                if self._time_window().key != window.key:
+                    return
+                self._apply_dashboard_entry(entry, window.key)
+                self.is_stale = not fresh
+            if fresh:
+                return
+        elif self.stats_cache:
+            async with self:
+                self.is_stale = True
                 self.loading = False
-            except Exception as e:
-                self.error_message = f"Failed to load data: {str(e)}"
+
+        try:
+            # Shared across sessions: concurrent refreshes wait on one computation
+            entry = await dashboard_cache.refresh(
+                cache_key,
+                lambda: StatisticsDataState._load_dashboard_data(
+                    stats_data_service, data_version, window.start, window.end
+                ),
+                version=data_version,
+            )
+        except Exception as e:
+            async with self:
+                if self.stats_cache:
+                    # Keep showing the last good result, still marked as stale
+                    logger.error(f"Failed to refresh dashboard stats: {str(e)}")
+                else:
+                    self.error_message = f"Failed to load data: {str(e)}"
                 self.loading = False
+            return
+
+        # Use context manager to modify state in background task
+        async with self:
+            # Drop the result if another window was chosen meanwhile
+            if self._time_window().key != window.key:
+                return
+            self._apply_dashboard_entry(entry, window.key)
+            self.is_stale = False
+
+    def _time_window(self) -> TimeWindow:
+        """The window chosen in the selector, resolved to datetimes."""
+        return resolve_time_window(
+            self.time_window, self.custom_window_start, self.custom_window_end
+        )
+
+    @rx.event
+    def set_time_window(self, window: str | list[str]):
+        """Switch every view to another time window."""
+        # The segmented control may send its value as a list
+        if isinstance(window, list):
+            window = window[0] if window else ALL_TIME
+        self.time_window = window
+        if window != CUSTOM_WINDOW:
+            return StatisticsDataState.fetch_dashboard_stats
+
+    @rx.event
+    def apply_custom_window(self, form_data: dict):
+        """Switch to the custom window entered in the selector's form."""
+        self.custom_window_start = form_data.get("start", "")
+        self.custom_window_end = form_data.get("end", "")
+        self.time_window = CUSTOM_WINDOW
+        return StatisticsDataState.fetch_dashboard_stats
+
+    def _apply_dashboard_entry(self, entry: CacheEntry, window_key: str):
+        """Copy a shared cache entry into this session's state."""
+        self.window_key = window_key
+        self.stats_cache = dict(entry.value["stats"])
+        self.statistics_type_data = dict(entry.value["statistics_type_data"])
+        self.cache_timestamp = entry.timestamp
+        self.data_version = entry.version or 0
+        self.error_message = ""
+        self.loading = False
+
+    @staticmethod
+    def _load_dashboard_data(
+        service: StatDataMongoService,
+        data_version: Optional[int] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run the dashboard aggregations (executed once per cache miss).
+
+        start and end limit the numbers to a created_at range.
+        """
+        if settings.ANALYTICS_ENGINE == "numpy":
+            return StatisticsDataState._load_dashboard_data_from_columns(
+                service, data_version, start, end
+            )
+        return {
+            # Get aggregated statistics instead of all data
+            "stats": service.get_statistics(start, end),
+            # Get statistics type status data
+            "statistics_type_data": (
+                StatisticsDataState._get_statistics_type_statistics(service, start, end)
+            ),
+        }
+
+    @staticmethod
+    def _load_dashboard_data_from_columns(
+        service: StatDataMongoService,
+        data_version: Optional[int],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """Answer the dashboard from the in-memory columnar engine."""
+        from app.states.analytics_engine import (
+            get_analytics_engine,
+            stat_statistics,
+            stat_type_summaries,
+        )
+
+        table = (
+            get_analytics_engine()
+            .stats.refresh(service._get_collection(), data_version)
+            .between(start, end)
+        )
+        statistics_type_stats = {}
+        summaries = stat_type_summaries(table, SUCCESS_STATES, ERROR_STATES)
+        statuses = success_rate_statuses(
+            [summary["success_count"] for summary in summaries.values()],
+            [summary["error_count"] for summary in summaries.values()],
+        )
+        for (stat_type, summary), status in zip(summaries.items(), statuses):
+            statistics_type_stats[stat_type] = StatisticsTypeStatusResult(
+                stat_type=stat_type,
+                total_records=summary["total"],
+                success_rate=round(status.success_rate, 1),
+                status=status.status,
+                color=status.color,
+                icon=status.icon,
+                success_records=summary["success_count"],
+                states=summary["states"],
+            )
+        return {
+            "stats": stat_statistics(table),
+            "statistics_type_data": statistics_type_stats,
+        }
 
-    async def _get_statistics_type_statistics(
-        self, service: StatDataMongoService
+    @staticmethod
+    def _get_statistics_type_statistics(
+        service: StatDataMongoService,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
     ) -> Dict[str, StatisticsTypeStatusResult]:
-        """Get aggregated statistics by statistics type."""
+        """Get aggregated statistics by statistics type, within a time range if given."""
         collection = service._get_collection()
         success_states = SUCCESS_STATES
         error_states = ERROR_STATES
         pipeline = [
+            *created_at_match(start, end),
             {
                 "$project": {
                     "stat_type": 1,
@@ -152,8 +339,11 @@ class StatisticsDataState(rx.State):
         from collections import Counter
 
         result = list(collection.aggregate(pipeline))
+        error_docs = StatisticsDataState._get_error_documents(
+            collection, [item["_id"] for item in result], error_states, start, end
+        )
         # Process the aggregated data into expected structures
-        police_type_stats = {}
+        rows = []
         for item in result:
             stat_type = item["_id"]
             total_records = item.get("total", 0)
@@ -165,56 +355,73 @@ class StatisticsDataState(rx.State):
             success_count = sum(
                 count for state, count in states.items() if state in success_states
             )
-            try:
-                sample_docs = list(
-                    collection.find(
-                        {"stat_type": stat_type},
-                        {
-                            "status_check_in": 1,
-                            "status_check_out": 1,
-                            "status_check_in_details": 1,
-                            "status_check_out_details": 1,
-                        },
-                    )
-                )
-            except Exception:
-                # If fetching sample documents fails for any reason, fall
-                # back to an empty list so we don't crash the dashboard.
-                sample_docs = []
-
-            success_rate = calculate_stat_success_rate(
-                success_count=success_count,
-                error_states=error_states,
-                docs=sample_docs,
+            errors = filter_expected_errors(
+                docs=error_docs.get(stat_type, []),
                 stat_type=stat_type,
+                error_states=error_states,
             )
-            # Determine status
-            if success_rate >= SUCCESS_RATE_THRESHOLDS.good:
-                status = STATUS_LABELS.good
-                color = STATUS_COLORS.good
-                icon = STATUS_ICONS.good
-            elif success_rate >= SUCCESS_RATE_THRESHOLDS.warning:
-                status = STATUS_LABELS.warning
-                color = STATUS_COLORS.warning
-                icon = STATUS_ICONS.warning
-            else:
-                status = STATUS_LABELS.error
-                color = STATUS_COLORS.error
-                icon = STATUS_ICONS.error
+            rows.append((stat_type, total_records, states, success_count, len(errors)))
 
+        # Success rates and statuses of all statistics types in one pass
+        statuses = success_rate_statuses(
+            [row[3] for row in rows], [row[4] for row in rows]
+        )
+        police_type_stats = {}
+        for (stat_type, total_records, states, success_count, _), status in zip(
+            rows, statuses
+        ):
             police_type_stats[stat_type] = StatisticsTypeStatusResult(
                 stat_type=stat_type,
                 total_records=total_records,
-                success_rate=round(success_rate, 1),
-                status=status,
-                color=color,
-                icon=icon,
+                success_rate=round(status.success_rate, 1),
+                status=status.status,
+                color=status.color,
+                icon=status.icon,
                 success_records=success_count,
                 states=states,
             )
 
         return police_type_stats
 
+    @staticmethod
+    def _get_error_documents(
+        collection,
+        stat_types: list,
+        error_states: list,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Dict[str, list]:
+        """
+        Documents with a check-in or check-out error, grouped by stat type
+
+        Only these can count against the success rate, so they are all that
+        is read: one query served by the per-state indexes, returning just
+        the fields filter_expected_errors looks at.
+        """
+        query = {
+            **created_at_range(start, end),
+            "$or": [
+                {"stat_type": {"$in": stat_types}, side: {"$in": error_states}}
+                for side in ("status_check_in", "status_check_out")
+            ],
+        }
+        fields = (
+            "stat_type",
+            "status_check_in",
+            "status_check_out",
+            "status_check_in_details",
+            "status_check_out_details",
+        )
+        error_docs: Dict[str, list] = {}
+        try:
+            for doc in find_fields(collection, query, fields):
+                error_docs.setdefault(doc.get("stat_type"), []).append(doc)
+        except Exception as e:
+            # Rates then count no errors rather than crash the dashboard
+            logger.error(f"Failed to read error documents: {str(e)}")
+            return {}
+        return error_docs
+
     @rx.event(background=True)
     async def fetch_statistics_data(self):
         """
@@ -226,6 +433,11 @@ class StatisticsDataState(rx.State):
     def set_selected_statistics_type(self, statistics_type: str):
         """Set the selected statistics type for detailed view."""
         self.selected_statistics_type = statistics_type
+        return [
+            StatisticsDataState.fetch_statistics_type_distributions,
+            StatisticsDataState.fetch_recent_records_for_statistics_type,
+            StatisticsDataState.fetch_statistics_type_trend,
+        ]
 
     @rx.event
     def load_statistics_type_from_url(self):
@@ -462,63 +674,79 @@ class StatisticsDataState(rx.State):
                 "checkout_success_rate": getattr(data, "success_rate", 0.0),
             }
 
-    # Recent records cache for the current statistics type
+    # Recent records cache for the current statistics type. The key records
+    # the statistics type and data version they were loaded for.
     statistics_type_recent_records: list[dict] = []
     recent_records_loading: bool = False
+    recent_records_key: str = ""
 
     @rx.var
     def get_statistics_type_recent_records(self) -> list[dict]:
         """Get recent records for the selected statistics type."""
         return self.statistics_type_recent_records
 
-    @rx.event(background=True)
-    async def fetch_recent_records_for_statistics_type(self):
-        """Fetch recent records for the current statistics type."""
-        # Get statistics type from URL if not set in selected_statistics_type
+    def _resolve_statistics_type(self) -> str:
+        """Get the selected statistics type, falling back to the URL path."""
         statistics_type = self.selected_statistics_type
         if not statistics_type:
             try:
                 path = self.router.url.path
                 if "/statistics-type/" in path:
                     statistics_type = path.split("/statistics-type/")[-1]
-                else:
-                    statistics_type = ""
             except Exception:
                 statistics_type = ""
+        return statistics_type
 
+    @staticmethod
+    def _connect_stat_service() -> tuple[StatDataMongoService, int | None]:
+        """Connect to MongoDB and read the current stat_data version."""
+        # Use singleton database manager for connection pooling
+        db_manager = DatabaseManager.get_instance()
+        db_manager.connect_mongo(
+            connection_string=settings.get_mongo_connection_string(),
+            database=settings.get_mongo_database(),
+        )
+        try:
+            data_version = DataVersionService(db_manager).get_version("stat_data")
+        except Exception as e:
+            logger.error(f"Failed to read data version: {str(e)}")
+            data_version = None
+        return StatDataMongoService(db_manager=db_manager), data_version
+
+    @rx.event(background=True)
+    @timed_event
+    async def fetch_recent_records_for_statistics_type(self):
+        """
+        Fetch recent records for the current statistics type
+
+        The query only runs when the statistics type or the synced data
+        version differs from the ones the stored records were loaded for.
+        """
+        statistics_type = self._resolve_statistics_type()
         if not statistics_type:
             async with self:
                 self.statistics_type_recent_records = []
+                self.recent_records_key = ""
                 self.recent_records_loading = False
             return
 
+        service, data_version = self._connect_stat_service()
+        window = self._time_window()
+        records_key = f"{statistics_type}:{window.key}:{data_version}"
+        if data_version is not None and records_key == self.recent_records_key:
+            return
+
         async with self:
             self.recent_records_loading = True
 
         try:
-            # Use singleton database manager for connection pooling
-            db_manager = DatabaseManager.get_instance()
-            mongo_db = db_manager.connect_mongo(
-                connection_string=settings.get_mongo_connection_string(),
-                database=settings.get_mongo_database(),
-            )
-            collection = mongo_db["stat_data"]
-
             # Fetch recent records for this statistics type
-            records = list(
-                collection.find(
-                    {"stat_type": statistics_type},
-                    {
-                        "status_check_in": 1,
-                        "status_check_out": 1,
-                        "status_check_in_details": 1,
-                        "status_check_out_details": 1,
-                        "created_at": 1,
-                        "_id": 0,
-                    },
-                )
-                .sort("created_at", -1)
-                .limit(10)
+            records = await asyncio.to_thread(
+                service.get_recent_records,
+                statistics_type,
+                10,
+                window.start,
+                window.end,
             )
 
             # Process records into the format expected by the UI
@@ -550,14 +778,72 @@ class StatisticsDataState(rx.State):
 
             async with self:
                 self.statistics_type_recent_records = processed_records
+                self.recent_records_key = records_key
                 self.recent_records_loading = False
 
         except Exception as e:
             logger.error(f"Error fetching recent records: {str(e)}")
             async with self:
                 self.statistics_type_recent_records = []
+                self.recent_records_key = ""
                 self.recent_records_loading = False
 
+    # Success-rate trend of the selected statistics type, loaded by
+    # fetch_statistics_type_trend; trend_key works like recent_records_key
+    statistics_type_trend: list[dict] = []
+    trend_bucket_label: str = ""
+    trend_key: str = ""
+    trend_loading: bool = False
+
+    @rx.event(background=True)
+    @timed_event
+    async def fetch_statistics_type_trend(self):
+        """
+        Load the success-rate trend of the selected statistics type
+
+        Check-ins and check-outs both count, as on the dashboard. The series
+        comes from the process-wide trend cache, which only aggregates the
+        buckets it lacks.
+        """
+        statistics_type = self._resolve_statistics_type()
+        if not statistics_type:
+            async with self:
+                self.statistics_type_trend = []
+                self.trend_key = ""
+            return
+
+        service, data_version = self._connect_stat_service()
+        window = self._time_window()
+        trend_key = f"{statistics_type}:{window.key}:{data_version}"
+        if data_version is not None and trend_key == self.trend_key:
+            return
+
+        async with self:
+            self.trend_loading = True
+        try:
+            rules = get_error_rules_for_stat_type(statistics_type)
+            points, bucket = await asyncio.to_thread(
+                load_success_rate_trend,
+                ("stat_data", statistics_type, window.key),
+                data_version,
+                window.start,
+                window.end,
+                lambda: first_created_at(service._get_collection()),
+                lambda *args: service.get_state_buckets(statistics_type, *args),
+                SUCCESS_STATES,
+                ERROR_STATES,
+                rules.is_expected_error,
+            )
+        except Exception as e:
+            logger.error(f"Error fetching success-rate trend: {str(e)}")
+            points, bucket, trend_key = [], None, ""
+
+        async with self:
+            self.statistics_type_trend = points
+            self.trend_bucket_label = bucket.label if bucket else ""
+            self.trend_key = trend_key
+            self.trend_loading = False
+
     # URL handling
     @rx.var
     def get_current_statistics_type_from_url(self) -> str:
@@ -602,94 +888,61 @@ class StatisticsDataState(rx.State):
 
         return cleaned_data
 
+    # Check-in / check-out distributions for the selected statistics type,
+    # loaded by fetch_statistics_type_distributions
+    statistics_type_checkin_distribution: list[dict] = []
+    statistics_type_checkout_distribution: list[dict] = []
+    distributions_key: str = ""
+
     @rx.var
     def get_statistics_type_checkin_distribution(self) -> list[dict]:
         """Get check-in state distribution for selected statistics type."""
-        statistics_type = self.selected_statistics_type
-        if not statistics_type:
-            try:
-                path = self.router.url.path
-                if "/statistics-type/" in path:
-                    statistics_type = path.split("/statistics-type/")[-1]
-                else:
-                    statistics_type = ""
-            except Exception:
-                statistics_type = ""
-
-        if not statistics_type:
-            return []
-
-        # Query MongoDB directly for check-in states only
-        try:
-            db_manager = DatabaseManager.get_instance()
-            mongo_db = db_manager.connect_mongo(
-                connection_string=settings.get_mongo_connection_string(),
-                database=settings.get_mongo_database(),
-            )
-            collection = mongo_db["stat_data"]
-
-            # Aggregate check-in states only
-            pipeline = [
-                {"$match": {"stat_type": statistics_type}},
-                {"$group": {"_id": "$status_check_in", "count": {"$sum": 1}}},
-                {"$sort": {"count": -1}},
-            ]
-
-            result = list(collection.aggregate(pipeline))
-            cleaned_data = []
-            for item in result:
-                state = item["_id"]
-                count = item["count"]
-                if count > 0:
-                    cleaned_data.append({"name": state, "value": count})
-            return cleaned_data
-        except Exception:
-            return []
+        return self.statistics_type_checkin_distribution
 
     @rx.var
     def get_statistics_type_checkout_distribution(self) -> list[dict]:
         """Get check-out state distribution for selected statistics type."""
-        statistics_type = self.selected_statistics_type
-        if not statistics_type:
-            try:
-                path = self.router.url.path
-                if "/statistics-type/" in path:
-                    statistics_type = path.split("/statistics-type/")[-1]
-                else:
-                    statistics_type = ""
-            except Exception:
-                statistics_type = ""
+        return self.statistics_type_checkout_distribution
+
+    @rx.event(background=True)
+    @timed_event
+    async def fetch_statistics_type_distributions(self):
+        """
+        Load check-in and check-out distributions for the selected type
 
+        Both distributions come from one aggregation, which only runs when
+        the statistics type or the synced data version has changed.
+        """
+        statistics_type = self._resolve_statistics_type()
         if not statistics_type:
-            return []
+            async with self:
+                self.statistics_type_checkin_distribution = []
+                self.statistics_type_checkout_distribution = []
+                self.distributions_key = ""
+            return
+
+        service, data_version = self._connect_stat_service()
+        window = self._time_window()
+        distributions_key = f"{statistics_type}:{window.key}:{data_version}"
+        if data_version is not None and distributions_key == self.distributions_key:
+            return
 
-        # Query MongoDB directly for check-out states only
         try:
-            db_manager = DatabaseManager.get_instance()
-            mongo_db = db_manager.connect_mongo(
-                connection_string=settings.get_mongo_connection_string(),
-                database=settings.get_mongo_database(),
+            distributions = await asyncio.to_thread(
+                service.get_state_distributions,
+                statistics_type,
+                window.start,
+                window.end,
             )
-            collection = mongo_db["stat_data"]
-
-            # Aggregate check-out states only
-            pipeline = [
-                {"$match": {"stat_type": statistics_type}},
-                {"$group": {"_id": "$status_check_out", "count": {"$sum": 1}}},
-                {"$sort": {"count": -1}},
-            ]
-
-            result = list(collection.aggregate(pipeline))
-            cleaned_data = []
-            for item in result:
-                state = item["_id"]
-                count = item["count"]
-                if count > 0:
-                    cleaned_data.append({"name": state, "value": count})
+        except Exception as e:
+            logger.error(f"Error fetching state distributions: {str(e)}")
+            distributions = {"check_in": [], "check_out": []}
+            distributions_key = ""
 
-            return cleaned_data
-        except Exception:
-            return []
+        async with self:
+            self.statistics_type_checkin_distribution = distributions["check_in"]
+            self.statistics_type_checkout_distribution = distributions["check_out"]
+            self.distributions_key = distributions_key
 
     # Modal state management
     show_reasons_modal: bool = False
@@ -911,6 +1164,7 @@ class StatisticsDataState(rx.State):
         yield StatisticsDataState.show_reasons_for_state
 
     @rx.event(background=True)
+    @timed_event
     async def show_reasons_for_state(self):
         """Show modal with reasons for the selected state."""
         async with self:
@@ -941,6 +1195,8 @@ class StatisticsDataState(rx.State):
                 database=settings.get_mongo_database(),
             )
             collection = mongo_db["stat_data"]
+            window = self._time_window()
+            window_filter = created_at_range(window.start, window.end)
 
             state = self.selected_state
             operation = "COMBINED"
@@ -963,6 +1219,7 @@ class StatisticsDataState(rx.State):
                 records_checkin = list(
                     collection.find(
                         {
+                            **window_filter,
                             "stat_type": statistics_type,
                             "status_check_in": actual_state,
                             "status_check_in_details": {
@@ -979,6 +1236,7 @@ class StatisticsDataState(rx.State):
                 records_checkout = list(
                     collection.find(
                         {
+                            **window_filter,
                             "stat_type": statistics_type,
                             "status_check_out": actual_state,
                             "status_check_out_details": {
@@ -1028,6 +1286,7 @@ class StatisticsDataState(rx.State):
             records = list(
                 collection.find(
                     {
+                        **window_filter,
                         "stat_type": statistics_type,
                         field: actual_state,
                         details_field: {"$exists": True, "$nin": [None, ""]},
@@ -1062,3 +1321,77 @@ class StatisticsDataState(rx.State):
             logger.error(f"Error fetching reasons for state {state}: {str(e)}")
             async with self:
                 self.state_reasons = []
+
+    # Reason search on the detail page. Only the displayed page of matches
+    # is held in state; the totals come from the text-index aggregation.
+    reason_search_text: str = ""
+    reason_search_results: list[dict] = []
+    reason_search_counts: list[dict] = []
+    reason_search_total: int = 0
+    reason_search_page: int = 1
+    reason_search_per_page: int = 20
+    reason_search_loading: bool = False
+
+    @rx.event
+    def search_reasons(self, form_data: dict):
+        """Start a reason search from the search form."""
+        self.reason_search_text = form_data.get("text", "").strip()
+        self.reason_search_page = 1
+        return StatisticsDataState.fetch_reason_search_page
+
+    @rx.event(background=True)
+    @timed_event
+    async def fetch_reason_search_page(self):
+        """Load the current page of records matching the reason search."""
+        text = self.reason_search_text
+        page = self.reason_search_page
+        per_page = self.reason_search_per_page
+        if not text:
+            async with self:
+                self.reason_search_results = []
+                self.reason_search_counts = []
+                self.reason_search_total = 0
+            return
+
+        async with self:
+            self.reason_search_loading = True
+        try:
+            service, _ = self._connect_stat_service()
+            result = await asyncio.to_thread(
+                service.search_reasons,
+                text,
+                self._resolve_statistics_type(),
+                (page - 1) * per_page,
+                per_page,
+            )
+        except Exception as e:
+            logger.error(f"Error searching reasons for '{text}': {str(e)}")
+            result = {"records": [], "counts": [], "total": 0}
+
+        async with self:
+            self.reason_search_loading = False
+            # Drop the result if a newer search or page was requested
+            if self.reason_search_text != text or self.reason_search_page != page:
+                return
+            self.reason_search_results = result["records"]
+            self.reason_search_counts = result["counts"]
+            self.reason_search_total = result["total"]
+
+    @rx.var
+    def reason_search_total_pages(self) -> int:
+        """Number of pages of reason search results."""
+        if self.reason_search_total == 0:
+            return 1
+        return (self.reason_search_total - 1) // self.reason_search_per_page + 1
+
+    def reason_search_previous_page(self):
+        """Go to the previous page of reason search results."""
+        if self.reason_search_page > 1:
+            self.reason_search_page -= 1
+            return StatisticsDataState.fetch_reason_search_page
+
+    def reason_search_next_page(self):
+        """Go to the next page of reason search results."""
+        if self.reason_search_page < self.reason_search_total_pages:
+            self.reason_search_page += 1
+            return StatisticsDataState.fetch_reason_search_page
@@ -1,7 +1,62 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, NamedTuple, Sequence, Tuple
 from app.states.statistics.analyzer import filter_expected_errors
 
 
+class SuccessRateStatus(NamedTuple):
+    """Success rate in percent with its status label, color and icon"""
+
+    success_rate: float
+    status: str
+    color: str
+    icon: str
+
+
+def success_rate_statuses(
+    success_counts: Sequence[int], error_counts: Sequence[int]
+) -> List[SuccessRateStatus]:
+    """
+    Success rate and status of every type in one pass
+
+    The rate is success / (success + errors) * 100, or 0 for a type
+    without successes and errors. The results are in the order of the
+    counts and map onto PoliceTypeStatusResult / StatisticsTypeStatusResult.
+    Plain Python, so the default aggregation path does not need NumPy.
+    """
+    rates = []
+    for success, errors in zip(success_counts, error_counts):
+        denominator = success + errors
+        rates.append(float(success) / denominator * 100 if denominator > 0 else 0.0)
+    return [
+        SuccessRateStatus(rate, *status)
+        for rate, status in zip(rates, statuses_for_success_rates(rates))
+    ]
+
+
+def statuses_for_success_rates(
+    rates: Sequence[float],
+) -> List[Tuple[str, str, str]]:
+    """Status label, color and icon for each success rate in percent"""
+    # Lazy import: the police package imports its state, which imports us
+    from app.states.police.config import (
+        SUCCESS_RATE_THRESHOLDS,
+        STATUS_LABELS,
+        STATUS_COLORS,
+        STATUS_ICONS,
+    )
+
+    good = (STATUS_LABELS.good, STATUS_COLORS.good, STATUS_ICONS.good)
+    warning = (STATUS_LABELS.warning, STATUS_COLORS.warning, STATUS_ICONS.warning)
+    error = (STATUS_LABELS.error, STATUS_COLORS.error, STATUS_ICONS.error)
+    return [
+        (
+            good
+            if rate >= SUCCESS_RATE_THRESHOLDS.good
+            else warning if rate >= SUCCESS_RATE_THRESHOLDS.warning else error
+        )
+        for rate in rates
+    ]
+
+
 def calculate_police_success_rate(
     success_count: int,
     error_states: List[str],
@@ -19,8 +74,8 @@ def calculate_police_success_rate(
             error_states=error_states,
         )
         error_count = len(filtered_errors)
-        denominator = success_count + error_count
-        return (success_count / denominator * 100) if denominator > 0 else 0
+        (result,) = success_rate_statuses([success_count], [error_count])
+        return result.success_rate
     return 0.0
 
 
@@ -35,6 +90,6 @@ def calculate_stat_success_rate(
             docs=docs, stat_type=stat_type, error_states=error_states
         )
         error_count = len(errors)
-        denominator = success_count + error_count
-        return (success_count / denominator * 100) if denominator > 0 else 0
+        (result,) = success_rate_statuses([success_count], [error_count])
+        return result.success_rate
     return 0.0
@@ -0,0 +1,97 @@
+"""
+Time windows of the dashboard views.
+
+A window is a range ending now (1h, 6h, 24h, 7d), a custom range, or "all"
+for the whole collection. Relative windows are resolved to datetimes when
+the numbers are computed and cached under their name, so every session
+looking at the last 24h shares one cache entry. Since their range moves
+with the clock, their entries are refreshed after a share of the window
+length even when no sync changed the data.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+ALL_TIME = "all"
+CUSTOM_WINDOW = "custom"
+
+RELATIVE_WINDOWS: Dict[str, timedelta] = {
+    "1h": timedelta(hours=1),
+    "6h": timedelta(hours=6),
+    "24h": timedelta(hours=24),
+    "7d": timedelta(days=7),
+}
+
+# Choices of the selector, in display order
+TIME_WINDOW_OPTIONS = [*RELATIVE_WINDOWS, CUSTOM_WINDOW, ALL_TIME]
+
+# Share of a relative window after which cached numbers are recomputed
+REFRESH_FRACTION = 1 / 12
+
+
+@dataclass(frozen=True)
+class TimeWindow:
+    """A resolved window; None bounds are open"""
+
+    name: str = ALL_TIME
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+
+    @property
+    def key(self) -> str:
+        """Cache key: the name of a relative window, the bounds of a custom one"""
+        if self.name != CUSTOM_WINDOW:
+            return self.name
+        start = self.start.isoformat() if self.start else ""
+        end = self.end.isoformat() if self.end else ""
+        return f"{CUSTOM_WINDOW}:{start}:{end}"
+
+    @property
+    def previous_start(self) -> Optional[datetime]:
+        """
+        Start of the previous window of equal length, which ends at start
+
+        None without a start; an open end is taken as now.
+        """
+        if self.start is None:
+            return None
+        end = self.end or datetime.now()
+        return self.start - (end - self.start)
+
+    @property
+    def max_age(self) -> Optional[float]:
+        """Seconds cached numbers stay valid as the window moves, if limited"""
+        length = RELATIVE_WINDOWS.get(self.name)
+        if length is None:
+            return None
+        return length.total_seconds() * REFRESH_FRACTION
+
+
+def parse_window_bound(value: str) -> Optional[datetime]:
+    """Datetime of an ISO string (e.g. from a datetime-local input), if valid"""
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
+
+def resolve_time_window(
+    name: str,
+    custom_start: str = "",
+    custom_end: str = "",
+    now: Optional[datetime] = None,
+) -> TimeWindow:
+    """
+    Bounds of a window chosen in the selector
+
+    Unknown names fall back to the whole collection.
+    """
+    if name in RELATIVE_WINDOWS:
+        end = now or datetime.now()
+        return TimeWindow(name, end - RELATIVE_WINDOWS[name], end)
+    if name == CUSTOM_WINDOW:
+        return TimeWindow(
+            name, parse_window_bound(custom_start), parse_window_bound(custom_end)
+        )
+    return TimeWindow()
@@ -0,0 +1,291 @@
+"""
+Success-rate trends of the detail pages.
+
+A trend is the success rate per time bucket of one police or stat type.
+The buckets come from a $dateTrunc aggregation (see get_state_buckets of
+the services) and their size follows the time window, so that no window
+yields more than MAX_TREND_POINTS points: a 30-day view gets 2-hour
+buckets, a 24-hour view 5-minute ones.
+
+Series are kept per worker process in trend_cache and extended instead of
+recomputed. While the data version is unchanged a cached series is served
+as is; after a sync only the buckets from the start of the sync's refresh
+window (ANALYTICS_REFRESH_HOURS, the part of the data a sync rewrites)
+onwards are aggregated again.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from settings import settings
+
+# Most points a trend sends to the browser
+MAX_TREND_POINTS = 500
+
+# Most series kept per process; the oldest are dropped first
+MAX_TREND_SERIES = 256
+
+# (success, unexpected errors) of each bucket, by bucket start
+BucketCounts = Dict[datetime, Tuple[int, int]]
+
+
+@dataclass(frozen=True)
+class TrendBucket:
+    """Bucket size as $dateTrunc unit and bin size, with its approximate length"""
+
+    unit: str
+    bin_size: int
+    step: timedelta
+
+    @property
+    def label(self) -> str:
+        """Bucket size for display, e.g. "5 minutes" """
+        unit = self.unit if self.bin_size == 1 else f"{self.unit}s"
+        return f"{self.bin_size} {unit}"
+
+
+# Candidate bucket sizes, smallest first
+TREND_BUCKETS = [
+    TrendBucket("minute", 1, timedelta(minutes=1)),
+    TrendBucket("minute", 5, timedelta(minutes=5)),
+    TrendBucket("minute", 15, timedelta(minutes=15)),
+    TrendBucket("minute", 30, timedelta(minutes=30)),
+    TrendBucket("hour", 1, timedelta(hours=1)),
+    TrendBucket("hour", 2, timedelta(hours=2)),
+    TrendBucket("hour", 6, timedelta(hours=6)),
+    TrendBucket("hour", 12, timedelta(hours=12)),
+    TrendBucket("day", 1, timedelta(days=1)),
+    TrendBucket("day", 7, timedelta(days=7)),
+    TrendBucket("month", 1, timedelta(days=31)),
+]
+
+
+def choose_bucket(
+    start: datetime, end: datetime, max_points: int = MAX_TREND_POINTS
+) -> TrendBucket:
+    """Smallest bucket size that splits start..end into at most max_points"""
+    span = end - start
+    for bucket in TREND_BUCKETS:
+        if span / bucket.step <= max_points:
+            return bucket
+    return TREND_BUCKETS[-1]
+
+
+def count_bucket_rows(
+    rows: List[Dict[str, Any]],
+    success_states: List[str],
+    error_states: List[str],
+    is_expected_error: Callable[[str, str], bool],
+) -> BucketCounts:
+    """
+    Success and unexpected error counts per bucket
+
+    Args:
+        rows: {"bucket", "state", "reason", "count"} rows of get_state_buckets
+        success_states: States counted as successes
+        error_states: States counted as errors
+        is_expected_error: The type's rule, called with (reason, state);
+            expected errors are left out like on the dashboards
+
+    Returns:
+        {bucket start: (success, errors)} for every bucket with a row
+    """
+    counts: Dict[datetime, List[int]] = {}
+    for row in rows:
+        bucket = counts.setdefault(row["bucket"], [0, 0])
+        state = row["state"]
+        if state in success_states:
+            bucket[0] += row["count"]
+        elif state in error_states and not is_expected_error(
+            row["reason"] or "", state
+        ):
+            bucket[1] += row["count"]
+    return {start: (success, errors) for start, (success, errors) in counts.items()}
+
+
+def trend_points(counts: BucketCounts, bucket: TrendBucket) -> List[Dict[str, Any]]:
+    """
+    Chart data of a series, oldest first
+
+    Buckets without successes or errors have no rate and are left out.
+    """
+    time_format = "%Y-%m-%d" if bucket.step >= timedelta(days=1) else "%m-%d %H:%M"
+    points = []
+    for start in sorted(counts):
+        success, errors = counts[start]
+        if success + errors == 0:
+            continue
+        points.append(
+            {
+                "time": start.strftime(time_format),
+                "success_rate": round(success / (success + errors) * 100, 1),
+                "total": success + errors,
+            }
+        )
+    return points
+
+
+def load_success_rate_trend(
+    key: Hashable,
+    version: Optional[int],
+    start: Optional[datetime],
+    end: Optional[datetime],
+    first_created_at: Callable[[], Optional[datetime]],
+    load_rows: Callable[..., List[Dict[str, Any]]],
+    success_states: List[str],
+    error_states: List[str],
+    is_expected_error: Callable[[str, str], bool],
+) -> Tuple[List[Dict[str, Any]], Optional[TrendBucket]]:
+    """
+    Points of a success-rate trend through trend_cache
+
+    Blocking; run it in a worker thread.
+
+    Args:
+        key: Identifies the series, e.g. (collection, type, window key)
+        version: Data version of the collection, if known
+        start: Earliest created_at (inclusive), None for all
+        end: Latest created_at (exclusive), None for now
+        first_created_at: Earliest created_at of the collection, used to
+            size the buckets of a window without start
+        load_rows: get_state_buckets of the type, called with
+            (unit, bin_size, start, end, error_states)
+        success_states: States counted as successes
+        error_states: States counted as errors
+        is_expected_error: The type's rule, called with (reason, state)
+
+    Returns:
+        (trend_points, bucket size), or ([], None) for an empty collection
+    """
+    span_start = start or first_created_at()
+    if span_start is None:
+        return [], None
+    bucket = choose_bucket(span_start, end or datetime.now())
+
+    def load(load_start, load_end):
+        rows = load_rows(
+            bucket.unit, bucket.bin_size, load_start, load_end, error_states
+        )
+        return count_bucket_rows(rows, success_states, error_states, is_expected_error)
+
+    counts = trend_cache.series(key, bucket, version, start, end, load)
+    return trend_points(counts, bucket), bucket
+
+
+@dataclass
+class TrendSeries:
+    counts: BucketCounts = field(default_factory=dict)
+    # Start the counts cover from; None for the whole collection
+    start: Optional[datetime] = None
+    version: Optional[int] = None
+
+
+class TrendSeriesCache:
+    """Bucket counts per series, extended as the data changes"""
+
+    def __init__(self, refresh_window: Optional[timedelta] = None):
+        self._refresh_window = refresh_window
+        self._series: Dict[Hashable, TrendSeries] = {}
+        # One lock per series, so that concurrent requests for the same
+        # series wait for a single load; _lock only guards the dicts
+        self._series_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def refresh_window(self) -> timedelta:
+        """Span before now that a sync may rewrite"""
+        if self._refresh_window is None:
+            self._refresh_window = timedelta(hours=settings.ANALYTICS_REFRESH_HOURS)
+        return self._refresh_window
+
+    def series(
+        self,
+        key: Hashable,
+        bucket: TrendBucket,
+        version: Optional[int],
+        start: Optional[datetime],
+        end: Optional[datetime],
+        load: Callable[[Optional[datetime], Optional[datetime]], BucketCounts],
+    ) -> BucketCounts:
+        """
+        Bucket counts of a series from start to end
+
+        Blocking; run it in a worker thread. Requests for the same series
+        wait for one load; other series do not wait for it. load(start, end)
+        aggregates the buckets of a range and is only called for what the
+        cache lacks: everything on a first request, nothing while the
+        version is unchanged (only the last bucket when it is unknown), and
+        the buckets from the refresh window onwards after a sync.
+
+        Args:
+            key: Identifies the series, e.g. its collection, type and window
+            bucket: Bucket size load aggregates with
+            version: Data version of the collection, if known
+            start: Earliest created_at (inclusive), None for all
+            end: Latest created_at (exclusive), None for now
+            load: Aggregation of one range of buckets
+
+        Returns:
+            {bucket start: (success, errors)}
+        """
+        key = (key, bucket)
+        with self._lock:
+            series_lock = self._series_locks.setdefault(key, threading.Lock())
+        # Loads run outside _lock: only requests for this series wait on them
+        with series_lock:
+            with self._lock:
+                series = self._series.pop(key, None)
+            if series is None or not (
+                series.start is None or (start is not None and series.start <= start)
+            ):
+                series = TrendSeries(load(start, end), start, version)
+            elif version is None or version != series.version:
+                self._extend(series, start, end, version, load)
+            if start is not None and start != series.start:
+                # A moving window drops the buckets it has left behind
+                series.counts = {
+                    bucket_start: counts
+                    for bucket_start, counts in series.counts.items()
+                    if bucket_start + bucket.step > start
+                }
+                series.start = start
+            counts = dict(series.counts)
+            with self._lock:
+                # Re-inserted as the most recently used
+                self._series[key] = series
+                self._evict()
+        return counts
+
+    def _evict(self):
+        """Drop the least recently used series past MAX_TREND_SERIES"""
+        while len(self._series) > MAX_TREND_SERIES:
+            evicted = next(iter(self._series))
+            del self._series[evicted]
+            series_lock = self._series_locks.get(evicted)
+            if series_lock is not None and not series_lock.locked():
+                del self._series_locks[evicted]
+
+    def _extend(self, series: TrendSeries, start, end, version, load):
+        """Aggregate again the buckets a sync may have changed"""
+        if version is None:
+            cutoff = datetime.max
+        else:
+            cutoff = datetime.now() - self.refresh_window
+        # The bucket holding the cutoff, or the last one before it
+        tail = max(
+            (bucket for bucket in series.counts if bucket <= cutoff), default=None
+        )
+        if tail is None:
+            series.counts = load(start, end)
+        else:
+            if start is not None:
+                tail = max(tail, start)
+            kept = {bucket: c for bucket, c in series.counts.items() if bucket < tail}
+            kept.update(load(tail, end))
+            series.counts = kept
+        series.version = version
+
+
+# Shared by every session served by this worker process
+trend_cache = TrendSeriesCache()
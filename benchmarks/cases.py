@@ -0,0 +1,272 @@
+"""
+Benchmark cases.
+
+Each case has a setup building its input for n rows from synthetic data
+(not timed) and a run function processing that input (timed). Cases are
+registered in CASES under the name used on the command line and in the
+baseline file.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List
+import bson
+from app.states.police.analyzer import analyze_police_errors
+from app.states.police.config import ERROR_STATES
+from app.states.police.police_data_state import PoliceDataState
+from app.states.statistics.analyzer import filter_expected_errors
+from app.states.statistics.statistics_data_state import StatisticsDataState
+from models.police_movement import PoliceMovement
+from models.police_registration import PoliceRegistration
+from models.stat_registration import StatRegistration
+from services.mongo_reads import READ_BATCH_SIZE
+from services.police.police_codes import CodeTable
+from services.police.police_data_mongo_service import PoliceDataMongoService
+from benchmarks.synthetic import SyntheticData
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    name: str
+    description: str
+    setup: Callable[[int, SyntheticData], Any]
+    run: Callable[[Any], Any]
+
+
+CASES: Dict[str, BenchmarkCase] = {}
+
+
+def case(name: str, description: str, setup: Callable[[int, SyntheticData], Any]):
+    """Register the decorated function as the timed part of a case."""
+
+    def register(run: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        CASES[name] = BenchmarkCase(name, description, setup, run)
+        return run
+
+    return register
+
+
+class FakeCollection:
+    """Stands in for a pymongo collection with precomputed query results."""
+
+    def __init__(self, aggregate_result: List[Dict], raw_batches=None):
+        self._aggregate_result = aggregate_result
+        self._raw_batches = raw_batches or []
+
+    def aggregate(self, pipeline):
+        return iter(self._aggregate_result)
+
+    def find_raw_batches(self, query, projection=None, batch_size=0):
+        return iter(self._raw_batches)
+
+
+class FakeService:
+    codes = CodeTable()
+
+    def __init__(self, collection: FakeCollection):
+        self._collection = collection
+
+    def _get_collection(self):
+        return self._collection
+
+
+# Models
+
+
+def _movement_rows(n: int, data: SyntheticData) -> List[Dict]:
+    return list(data.movement_rows(n))
+
+
+@case("movement_from_db_row", "PoliceMovement.from_db_row", _movement_rows)
+def bench_movement_from_db_row(rows):
+    return [PoliceMovement.from_db_row(row) for row in rows]
+
+
+def _registration_rows(n: int, data: SyntheticData) -> List[Dict]:
+    return list(data.registration_rows(n))
+
+
+@case("registration_from_db_row", "PoliceRegistration.from_db_row", _registration_rows)
+def bench_registration_from_db_row(rows):
+    return [PoliceRegistration.from_db_row(row) for row in rows]
+
+
+def _stat_rows(n: int, data: SyntheticData) -> List[Dict]:
+    return list(data.stat_rows(n))
+
+
+@case("stat_from_db_row", "StatRegistration.from_db_row", _stat_rows)
+def bench_stat_from_db_row(rows):
+    return [StatRegistration.from_db_row(row) for row in rows]
+
+
+def _police_movements(n: int, data: SyntheticData) -> List:
+    return [PoliceMovement.from_db_row(row) for row in data.movement_rows(n)]
+
+
+@case(
+    "movement_to_unified",
+    "PoliceDataMongoService.movement_to_unified",
+    _police_movements,
+)
+def bench_movement_to_unified(movements):
+    service = PoliceDataMongoService(db_manager=None)
+    return [service.movement_to_unified(movement) for movement in movements]
+
+
+@case(
+    "movement_to_document",
+    "PoliceDataMongoService.movement_to_document",
+    _police_movements,
+)
+def bench_movement_to_document(movements):
+    service = PoliceDataMongoService(db_manager=None)
+    return [service.movement_to_document(movement) for movement in movements]
+
+
+def _police_registrations(n: int, data: SyntheticData) -> List:
+    return [PoliceRegistration.from_db_row(row) for row in data.registration_rows(n)]
+
+
+@case(
+    "registration_to_document",
+    "PoliceDataMongoService.registration_to_document",
+    _police_registrations,
+)
+def bench_registration_to_document(registrations):
+    service = PoliceDataMongoService(db_manager=None)
+    return [
+        service.registration_to_document(registration) for registration in registrations
+    ]
+
+
+def _unified_police_data(n: int, data: SyntheticData) -> List:
+    service = PoliceDataMongoService(db_manager=None)
+    return [
+        service.movement_to_unified(PoliceMovement.from_db_row(row))
+        for row in data.movement_rows(n)
+    ]
+
+
+@case("unified_to_mongo_dict", "UnifiedPoliceData.to_mongo_dict", _unified_police_data)
+def bench_unified_to_mongo_dict(unified):
+    return [item.to_mongo_dict() for item in unified]
+
+
+def _stat_registrations(n: int, data: SyntheticData) -> List:
+    return [StatRegistration.from_db_row(row) for row in data.stat_rows(n)]
+
+
+@case("stat_to_dict", "StatRegistration.to_dict", _stat_registrations)
+def bench_stat_to_dict(registrations):
+    return [registration.to_dict() for registration in registrations]
+
+
+# Error rules
+
+
+def _police_docs_by_type(n: int, data: SyntheticData) -> Dict[str, List[Dict]]:
+    docs_by_type = defaultdict(list)
+    for doc in data.police_documents(n):
+        docs_by_type[doc["police_type"]].append(
+            {"state": doc["state"], "reason": doc["reason"]}
+        )
+    return dict(docs_by_type)
+
+
+@case("analyze_police_errors", "analyze_police_errors", _police_docs_by_type)
+def bench_analyze_police_errors(docs_by_type):
+    return [
+        analyze_police_errors(docs, police_type, ERROR_STATES)
+        for police_type, docs in docs_by_type.items()
+    ]
+
+
+def _stat_docs_by_type(n: int, data: SyntheticData) -> Dict[str, List[Dict]]:
+    docs_by_type = defaultdict(list)
+    for doc in data.stat_documents(n):
+        docs_by_type[doc["stat_type"]].append(doc)
+    return dict(docs_by_type)
+
+
+@case("filter_expected_errors", "filter_expected_errors", _stat_docs_by_type)
+def bench_filter_expected_errors(docs_by_type):
+    return [
+        filter_expected_errors(docs, stat_type, ERROR_STATES)
+        for stat_type, docs in docs_by_type.items()
+    ]
+
+
+# Dashboard post-processing of the aggregation results
+
+
+def _police_type_aggregate(n: int, data: SyntheticData) -> FakeService:
+    result = []
+    for police_type, docs in _police_docs_by_type(n, data).items():
+        result.append(
+            {
+                "_id": police_type,
+                "states": [{"state": doc["state"], "count": 1} for doc in docs],
+                "total": len(docs),
+                # The pipeline only pushes documents in an error state
+                "docs": [doc for doc in docs if doc["state"] in ERROR_STATES],
+            }
+        )
+    return FakeService(FakeCollection(result))
+
+
+@case(
+    "police_type_statistics",
+    "PoliceDataState._get_police_type_statistics",
+    _police_type_aggregate,
+)
+def bench_police_type_statistics(service):
+    return PoliceDataState._get_police_type_statistics(service)
+
+
+def _statistics_type_aggregate(n: int, data: SyntheticData) -> FakeService:
+    docs_by_type = _stat_docs_by_type(n, data)
+    # What the error-document query returns: error rows, projected fields
+    fields = (
+        "stat_type",
+        "status_check_in",
+        "status_check_out",
+        "status_check_in_details",
+        "status_check_out_details",
+    )
+    error_docs = [
+        bson.encode({field: doc[field] for field in fields})
+        for docs in docs_by_type.values()
+        for doc in docs
+        if doc["status_check_in"] in ERROR_STATES
+        or doc["status_check_out"] in ERROR_STATES
+    ]
+    raw_batches = [
+        b"".join(error_docs[offset : offset + READ_BATCH_SIZE])
+        for offset in range(0, len(error_docs), READ_BATCH_SIZE)
+    ]
+    result = []
+    for stat_type, docs in docs_by_type.items():
+        counts = defaultdict(int)
+        for doc in docs:
+            counts[doc["status_check_in"]] += 1
+            counts[doc["status_check_out"]] += 1
+        result.append(
+            {
+                "_id": stat_type,
+                "total": sum(counts.values()),
+                "states": [
+                    {"state": state, "count": count} for state, count in counts.items()
+                ],
+            }
+        )
+    return FakeService(FakeCollection(result, raw_batches=raw_batches))
+
+
+@case(
+    "statistics_type_statistics",
+    "StatisticsDataState._get_statistics_type_statistics",
+    _statistics_type_aggregate,
+)
+def bench_statistics_type_statistics(service):
+    return StatisticsDataState._get_statistics_type_statistics(service)
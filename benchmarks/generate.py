@@ -0,0 +1,465 @@
+"""
+Fill a local PostgreSQL and/or MongoDB with synthetic data.
+
+    python -m benchmarks.generate --postgres --rows 100000
+    python -m benchmarks.generate --mongo --rows 10000000 --reset
+    python -m benchmarks.generate --postgres --mongo --rows 50000 \\
+        --distribution movement_states=SUCCESS:50,ERROR:30,INVALID:20 \\
+        --distributions-file skewed.json
+
+PostgreSQL gets the source tables read by the sync (created when missing),
+loaded with COPY. MongoDB gets police_data and stat_data documents in the
+unified format the sync writes, followed by a data version bump so running
+dashboards pick them up. Connections come from settings, so point the
+POSTGRES_* and MONGO_* variables at local databases, never at a replica.
+
+Rows are generated and written in batches, so memory stays flat from
+thousands to tens of millions of rows. The same seed, start and
+distributions produce the same data.
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from database_manager import DatabaseManager
+from services.data_version_service import DataVersionService
+from services.police.police_data_mongo_service import PoliceDataMongoService
+from services.stats.stats_data_mongo_service import StatDataMongoService
+from settings import settings
+from benchmarks.synthetic import DEFAULT_DISTRIBUTIONS, SyntheticData
+
+BATCH_SIZE = 10_000
+
+# Only the columns the sync queries read
+POSTGRES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS movements_policemovement (
+    id uuid PRIMARY KEY,
+    created_at timestamp NOT NULL,
+    updated_at timestamp NOT NULL,
+    action text NOT NULL,
+    state text NOT NULL,
+    movement_type text NOT NULL,
+    vendor text NOT NULL,
+    expiration_date date,
+    last_sent_date timestamp,
+    data text,
+    reason text,
+    reservation_id uuid,
+    tax_data jsonb,
+    is_sent_manually boolean NOT NULL DEFAULT false
+);
+CREATE INDEX IF NOT EXISTS movements_policemovement_created_at
+    ON movements_policemovement (created_at);
+
+CREATE TABLE IF NOT EXISTS police_registrations (
+    id uuid PRIMARY KEY,
+    created_at timestamp NOT NULL,
+    reservation_id uuid NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS police_guest_registrations (
+    id uuid PRIMARY KEY,
+    police_registration_id uuid NOT NULL REFERENCES police_registrations (id),
+    created_at timestamp NOT NULL,
+    updated_at timestamp NOT NULL,
+    status text NOT NULL,
+    status_details text,
+    status_booking text NOT NULL,
+    status_check_out text NOT NULL,
+    status_room_change text NOT NULL,
+    vr_sheet_number text,
+    start_date date,
+    end_date date
+);
+CREATE INDEX IF NOT EXISTS police_guest_registrations_registration
+    ON police_guest_registrations (police_registration_id);
+
+CREATE TABLE IF NOT EXISTS police_registration_tasks (
+    id uuid PRIMARY KEY,
+    police_registration_id uuid NOT NULL REFERENCES police_registrations (id),
+    created_at timestamp NOT NULL,
+    task_data jsonb
+);
+CREATE INDEX IF NOT EXISTS police_registration_tasks_created_at
+    ON police_registration_tasks (created_at);
+
+CREATE TABLE IF NOT EXISTS stat_registration_tasks (
+    id uuid PRIMARY KEY,
+    created_at timestamp NOT NULL,
+    stat_report jsonb
+);
+CREATE INDEX IF NOT EXISTS stat_registration_tasks_created_at
+    ON stat_registration_tasks (created_at);
+
+CREATE TABLE IF NOT EXISTS stat_registrations (
+    id uuid PRIMARY KEY,
+    created_at timestamp NOT NULL,
+    updated_at timestamp NOT NULL,
+    status_check_in text NOT NULL,
+    status_check_out text NOT NULL,
+    status_check_in_details text,
+    status_check_out_details text,
+    reservation_id uuid,
+    task_check_in_id uuid REFERENCES stat_registration_tasks (id),
+    task_check_out_id uuid REFERENCES stat_registration_tasks (id)
+);
+"""
+
+# Column order of each table; parents come before children, which is the
+# order batches are copied in
+POSTGRES_TABLES = {
+    "movements_policemovement": (
+        "id",
+        "created_at",
+        "updated_at",
+        "action",
+        "state",
+        "movement_type",
+        "vendor",
+        "expiration_date",
+        "last_sent_date",
+        "data",
+        "reason",
+        "reservation_id",
+        "tax_data",
+        "is_sent_manually",
+    ),
+    "police_registrations": ("id", "created_at", "reservation_id"),
+    "police_guest_registrations": (
+        "id",
+        "police_registration_id",
+        "created_at",
+        "updated_at",
+        "status",
+        "status_details",
+        "status_booking",
+        "status_check_out",
+        "status_room_change",
+        "vr_sheet_number",
+        "start_date",
+        "end_date",
+    ),
+    "police_registration_tasks": (
+        "id",
+        "police_registration_id",
+        "created_at",
+        "task_data",
+    ),
+    "stat_registration_tasks": ("id", "created_at", "stat_report"),
+    "stat_registrations": (
+        "id",
+        "created_at",
+        "updated_at",
+        "status_check_in",
+        "status_check_out",
+        "status_check_in_details",
+        "status_check_out_details",
+        "reservation_id",
+        "task_check_in_id",
+        "task_check_out_id",
+    ),
+}
+
+
+def parse_distribution(value: str) -> Tuple[str, Dict[str, float]]:
+    """Parse NAME=VALUE:WEIGHT,VALUE:WEIGHT into a distribution override"""
+    name, sep, spec = value.partition("=")
+    if not sep or not spec:
+        raise argparse.ArgumentTypeError(
+            f"Expected NAME=VALUE:WEIGHT[,VALUE:WEIGHT...], got {value!r}"
+        )
+    weights = {}
+    for item in spec.split(","):
+        choice, sep, weight = item.rpartition(":")
+        if not sep:
+            raise argparse.ArgumentTypeError(f"Missing weight in {item!r}")
+        try:
+            weights[choice] = float(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Invalid weight in {item!r}")
+    return name.strip(), weights
+
+
+def batched(items: Iterable, size: int) -> Iterator[List]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# PostgreSQL
+
+
+def movement_table_rows(data: SyntheticData, n: int) -> Iterator[Dict[str, List]]:
+    for row in data.movement_rows(n):
+        yield {
+            "movements_policemovement": [
+                tuple(
+                    row[column]
+                    for column in POSTGRES_TABLES["movements_policemovement"]
+                )
+            ]
+        }
+
+
+def registration_table_rows(data: SyntheticData, n: int) -> Iterator[Dict[str, List]]:
+    """One registration with one guest registration and one task each"""
+    for row in data.registration_rows(n):
+        registration_id = data.new_id()
+        police_type = row["police_type"]
+        task_data = {"housing": {"police_account": {"type": police_type}}}
+        yield {
+            "police_registrations": [
+                (registration_id, row["created_at"], row["reservation_id"])
+            ],
+            "police_guest_registrations": [
+                (
+                    row["id"],
+                    registration_id,
+                    row["created_at"],
+                    row["updated_at"],
+                    row["status"],
+                    row["status_details"],
+                    row["status_booking"],
+                    row["status_check_out"],
+                    row["status_room_change"],
+                    row["vr_sheet_number"],
+                    row["start_date"],
+                    row["end_date"],
+                )
+            ],
+            "police_registration_tasks": [
+                (
+                    data.new_id(),
+                    registration_id,
+                    row["created_at"],
+                    json.dumps(task_data) if police_type else None,
+                )
+            ],
+        }
+
+
+def stat_table_rows(data: SyntheticData, n: int) -> Iterator[Dict[str, List]]:
+    """One stat registration with a check-in and a check-out task each"""
+    for row in data.stat_rows(n):
+        stat_report = json.dumps({"stat_account": {"type": row["stat_type"]}})
+        check_in_id, check_out_id = data.new_id(), data.new_id()
+        yield {
+            "stat_registration_tasks": [
+                (check_in_id, row["created_at"], stat_report),
+                (check_out_id, row["updated_at"], stat_report),
+            ],
+            "stat_registrations": [
+                (
+                    row["id"],
+                    row["created_at"],
+                    row["updated_at"],
+                    row["status_check_in"],
+                    row["status_check_out"],
+                    row["status_check_in_details"],
+                    row["status_check_out_details"],
+                    row["reservation_id"],
+                    check_in_id,
+                    check_out_id,
+                )
+            ],
+        }
+
+
+def copy_rows(conn, table_rows: Iterator[Dict[str, List]], batch_size: int) -> int:
+    """COPY generated rows batch by batch, parents before children"""
+    written = 0
+    for batch in batched(table_rows, batch_size):
+        with conn.cursor() as cur:
+            for table, columns in POSTGRES_TABLES.items():
+                rows = [row for item in batch for row in item.get(table, ())]
+                if not rows:
+                    continue
+                with cur.copy(
+                    f"COPY {table} ({', '.join(columns)}) FROM STDIN"
+                ) as copy:
+                    for row in rows:
+                        copy.write_row(row)
+        conn.commit()
+        written += len(batch)
+    return written
+
+
+def generate_postgres(
+    data: SyntheticData, counts: Dict[str, int], reset: bool, batch_size: int
+) -> Dict[str, int]:
+    db_manager = DatabaseManager.get_instance()
+    conn = db_manager.connect_postgres(
+        host=settings.POSTGRES_HOST,
+        port=settings.POSTGRES_PORT,
+        database=settings.POSTGRES_DB,
+        user=settings.POSTGRES_USER,
+        password=settings.POSTGRES_PASSWORD,
+    )
+    with conn.cursor() as cur:
+        cur.execute(POSTGRES_SCHEMA)
+        if reset:
+            cur.execute(f"TRUNCATE {', '.join(POSTGRES_TABLES)} CASCADE")
+    conn.commit()
+
+    generators = {
+        "movements": movement_table_rows,
+        "registrations": registration_table_rows,
+        "stats": stat_table_rows,
+    }
+    written = {}
+    for kind, generate in generators.items():
+        started = time.perf_counter()
+        written[kind] = copy_rows(conn, generate(data, counts[kind]), batch_size)
+        print(
+            f"PostgreSQL {kind}: {written[kind]} rows "
+            f"in {time.perf_counter() - started:.1f}s"
+        )
+    with conn.cursor() as cur:
+        cur.execute(f"ANALYZE {', '.join(POSTGRES_TABLES)}")
+    conn.commit()
+    return written
+
+
+# MongoDB
+
+
+def write_documents(
+    service, documents: Iterator[Dict[str, Any]], fresh: bool, batch_size: int
+) -> int:
+    """Insert into an emptied collection, upsert by id otherwise"""
+    collection = service._get_collection()
+    # Only police_data has a compact (integer-coded) schema
+    codes = getattr(service, "codes", None)
+    written = 0
+    for batch in batched(documents, batch_size):
+        if fresh:
+            if codes:
+                batch = [codes.encode_document(doc) for doc in batch]
+            written += len(collection.insert_many(batch, ordered=False).inserted_ids)
+        else:
+            written += service.store_documents(batch)
+    return written
+
+
+def generate_mongo(
+    data: SyntheticData, counts: Dict[str, int], reset: bool, batch_size: int
+) -> Dict[str, int]:
+    db_manager = DatabaseManager.get_instance()
+    db_manager.connect_mongo(
+        connection_string=settings.get_mongo_connection_string(),
+        database=settings.get_mongo_database(),
+    )
+    version_service = DataVersionService(db_manager)
+    targets: List[Tuple[str, Any, Callable[[int], Iterator[Dict[str, Any]]]]] = [
+        ("police", PoliceDataMongoService(db_manager), data.police_documents),
+        ("stats", StatDataMongoService(db_manager), data.stat_documents),
+    ]
+    written = {}
+    for kind, service, documents in targets:
+        started = time.perf_counter()
+        if reset:
+            service._get_collection().delete_many({})
+        service.ensure_indexes()
+        written[kind] = write_documents(
+            service, documents(counts[kind]), reset, batch_size
+        )
+        version_service.bump_version(service.collection_name)
+        print(
+            f"MongoDB {service.collection_name}: {written[kind]} documents "
+            f"in {time.perf_counter() - started:.1f}s"
+        )
+    return written
+
+
+def load_distributions(
+    path: Optional[str], overrides: List[Tuple[str, Dict[str, float]]]
+) -> Dict[str, Dict[str, float]]:
+    distributions = {}
+    if path:
+        with open(path, encoding="utf-8") as f:
+            distributions.update(json.load(f))
+    distributions.update(dict(overrides))
+    return distributions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Synthetic data generator")
+    parser.add_argument("--postgres", action="store_true", help="Fill PostgreSQL")
+    parser.add_argument("--mongo", action="store_true", help="Fill MongoDB")
+    parser.add_argument(
+        "--rows", type=int, default=10_000, help="Rows per kind (default 10000)"
+    )
+    parser.add_argument("--movements", type=int, help="Override --rows")
+    parser.add_argument("--registrations", type=int, help="Override --rows")
+    parser.add_argument("--stats", type=int, help="Override --rows")
+    parser.add_argument("--police", type=int, help="Override --rows (MongoDB)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--days",
+        type=float,
+        default=1.0,
+        help="created_at values are spread over this many days (default 1)",
+    )
+    parser.add_argument(
+        "--start",
+        type=datetime.fromisoformat,
+        help="Earliest created_at, ISO format (default: now - --days)",
+    )
+    parser.add_argument(
+        "--distribution",
+        type=parse_distribution,
+        action="append",
+        default=[],
+        metavar="NAME=VALUE:WEIGHT,...",
+        help=f"Override a distribution: {', '.join(DEFAULT_DISTRIBUTIONS)}",
+    )
+    parser.add_argument(
+        "--distributions-file", help="JSON object of distribution overrides"
+    )
+    parser.add_argument(
+        "--reset", action="store_true", help="Empty the target tables first"
+    )
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    if not args.postgres and not args.mongo:
+        parser.error("choose at least one of --postgres and --mongo")
+
+    span = timedelta(days=args.days)
+    start = args.start or datetime.now() - span
+    try:
+        distributions = load_distributions(args.distributions_file, args.distribution)
+        # Fresh generators per target, so each is reproducible on its own
+        make_data = partial(
+            SyntheticData,
+            seed=args.seed,
+            start=start,
+            span=span,
+            distributions=distributions,
+        )
+        make_data()
+    except ValueError as e:
+        parser.error(str(e))
+
+    counts = {
+        kind: getattr(args, kind) if getattr(args, kind) is not None else args.rows
+        for kind in ("movements", "registrations", "stats", "police")
+    }
+    if args.postgres:
+        generate_postgres(make_data(), counts, args.reset, args.batch_size)
+    if args.mongo:
+        generate_mongo(make_data(), counts, args.reset, args.batch_size)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
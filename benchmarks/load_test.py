@@ -0,0 +1,297 @@
+"""
+Concurrent-session load test for the police dashboard states.
+
+    python -m benchmarks.load_test --sessions 50 --duration 60
+    python -m benchmarks.load_test --seed-rows 1000000 --sessions 1 --iterations 1
+
+Every simulated session owns its own state tree and walks the pages the
+way a viewer does: it loads the dashboard (fetch_dashboard_stats), opens a
+police-type detail page, clicks a state and pages through its reasons
+modal. The real event handlers run, including the shared dashboard cache
+and the Mongo queries, against the database configured in settings. Events
+returned by a handler are chained as Reflex does.
+
+Each session processes its events one at a time, like the per-client event
+queue of a Reflex worker, while all sessions run concurrently on one event
+loop. Event latency percentiles, throughput and the Mongo command
+latencies seen during the run are reported at the end.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from typing import Any, Dict, List, Optional
+from database_manager import DatabaseManager
+from monitoring.histogram import HistogramRegistry, latency_histograms
+from services.data_version_service import DataVersionService
+from services.police.police_data_mongo_service import PoliceDataMongoService
+from settings import settings
+from benchmarks.synthetic import SyntheticData
+
+SEED_BATCH_SIZE = 5000
+
+
+class SessionProxy:
+    """
+    Stands in for Reflex's StateProxy around one session's state
+
+    Background handlers enter `async with self` before touching state; the
+    proxy serializes those blocks per session with a lock, the way the
+    state manager locks a client's state.
+    """
+
+    def __init__(self, state):
+        object.__setattr__(self, "_state", state)
+        object.__setattr__(self, "_lock", asyncio.Lock())
+
+    async def __aenter__(self):
+        await self._lock.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._lock.release()
+
+    def __getattr__(self, name: str):
+        return getattr(self._state, name)
+
+    def __setattr__(self, name: str, value: Any):
+        setattr(self._state, name, value)
+
+
+class Session:
+    """One simulated viewer with its own state tree."""
+
+    def __init__(self, state_cls, histograms: HistogramRegistry, rng: random.Random):
+        from reflex.state import State
+
+        root = State(_reflex_internal_init=True)
+        self.state_cls = state_cls
+        self.state = root.get_substate(state_cls.get_full_name().split(".")[1:])
+        self.proxy = SessionProxy(self.state)
+        self.histograms = histograms
+        self.rng = rng
+        self.events = 0
+        self.errors = 0
+
+    async def dispatch(self, name: str, *args):
+        """Run an event handler and then the events it returns"""
+        handler = self.state_cls.event_handlers[name]
+        with self.histograms.time(f"event.{name}"):
+            try:
+                if handler.is_background:
+                    result = await handler.fn(self.proxy, *args)
+                else:
+                    result = handler.fn(self.state, *args)
+            except Exception:
+                self.errors += 1
+                raise
+            finally:
+                self.events += 1
+        for chained in result if isinstance(result, list) else [result]:
+            if chained is not None:
+                await self.dispatch(chained.fn.__name__)
+
+    async def walk(self, reason_pages: int):
+        """Dashboard -> police type detail -> reasons modal pages"""
+        await self.dispatch("fetch_dashboard_stats")
+        police_type_data = self.state.police_type_data
+        if not police_type_data:
+            return
+        police_type = self.rng.choice(sorted(police_type_data))
+
+        # Detail page: the link click and the page's on_mount events
+        await self.dispatch("set_selected_police_type", police_type)
+        await self.dispatch("fetch_dashboard_stats")
+
+        states = [
+            state
+            for state, count in police_type_data[police_type].states.items()
+            if count > 0
+        ]
+        if not states:
+            return
+        await self.dispatch("handle_state_click", self.rng.choice(sorted(states)))
+        for _ in range(reason_pages - 1):
+            if not self.state.has_next_page:
+                break
+            await self.dispatch("go_to_next_page")
+        await self.dispatch("close_reasons_modal")
+
+
+async def run_session(
+    session: Session,
+    deadline: Optional[float],
+    iterations: Optional[int],
+    reason_pages: int,
+    think_time: float,
+):
+    completed = 0
+    while True:
+        if iterations is not None and completed >= iterations:
+            return
+        if deadline is not None and time.perf_counter() >= deadline:
+            return
+        with session.histograms.time("session.walk"):
+            try:
+                await session.walk(reason_pages)
+            except Exception:
+                # Counted in Session.errors; keep the session going
+                pass
+        completed += 1
+        if think_time:
+            await asyncio.sleep(session.rng.uniform(0, 2 * think_time))
+
+
+async def run_load(
+    sessions: int,
+    duration: Optional[float],
+    iterations: Optional[int],
+    reason_pages: int,
+    think_time: float,
+    seed: int,
+    ramp_up: float = 0.0,
+) -> Dict[str, Any]:
+    """Run the sessions concurrently and collect latency and throughput"""
+    from app.states.police.police_data_state import PoliceDataState
+
+    histograms = HistogramRegistry()
+    latency_histograms.clear()
+    rng = random.Random(seed)
+    simulated = [
+        Session(PoliceDataState, histograms, random.Random(rng.getrandbits(64)))
+        for _ in range(sessions)
+    ]
+
+    async def start(index: int, session: Session):
+        if ramp_up and sessions > 1:
+            await asyncio.sleep(ramp_up * index / (sessions - 1))
+        await run_session(session, deadline, iterations, reason_pages, think_time)
+
+    start_time = time.perf_counter()
+    deadline = start_time + duration + ramp_up if duration else None
+    await asyncio.gather(
+        *(start(index, session) for index, session in enumerate(simulated))
+    )
+    elapsed = time.perf_counter() - start_time
+
+    events = sum(session.events for session in simulated)
+    walks = histograms.get("session.walk").count
+    return {
+        "sessions": sessions,
+        "elapsed_seconds": round(elapsed, 3),
+        "events": events,
+        "errors": sum(session.errors for session in simulated),
+        "events_per_second": round(events / elapsed, 2) if elapsed else 0.0,
+        "walks_per_second": round(walks / elapsed, 2) if elapsed else 0.0,
+        "latency": histograms.summary(),
+        "mongo": latency_histograms.summary("mongo."),
+    }
+
+
+def seed_police_data(rows: int, seed: int, reset: bool) -> int:
+    """Insert synthetic police_data documents and bump the data version"""
+    db_manager = DatabaseManager.get_instance()
+    db_manager.connect_mongo(
+        connection_string=settings.get_mongo_connection_string(),
+        database=settings.get_mongo_database(),
+    )
+    service = PoliceDataMongoService(db_manager=db_manager)
+    if reset:
+        service._get_collection().delete_many({})
+    service.ensure_indexes()
+
+    written = 0
+    batch: List[Dict[str, Any]] = []
+    for doc in SyntheticData(seed=seed).police_documents(rows):
+        batch.append(doc)
+        if len(batch) >= SEED_BATCH_SIZE:
+            written += service.store_documents(batch)
+            batch = []
+    if batch:
+        written += service.store_documents(batch)
+    DataVersionService(db_manager).bump_version(service.collection_name)
+    return written
+
+
+def print_report(report: Dict[str, Any]):
+    print(
+        f"{report['sessions']} sessions, {report['elapsed_seconds']:.1f}s: "
+        f"{report['events']} events ({report['errors']} errors), "
+        f"{report['events_per_second']:.1f} events/s, "
+        f"{report['walks_per_second']:.2f} walks/s"
+    )
+    for title, section in (("Event latency", "latency"), ("Mongo", "mongo")):
+        if not report[section]:
+            continue
+        print(f"\n{title}:")
+        print(
+            f"  {'operation':<40} {'count':>7} {'p50 ms':>9} {'p95 ms':>9} "
+            f"{'p99 ms':>9} {'max ms':>9}"
+        )
+        for operation, summary in sorted(report[section].items()):
+            print(
+                f"  {operation:<40} {summary['count']:>7} "
+                f"{summary['p50_ms']:>9.1f} {summary['p95_ms']:>9.1f} "
+                f"{summary['p99_ms']:>9.1f} {summary['max_ms']:>9.1f}"
+            )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Dashboard load test")
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument(
+        "--duration", type=float, help="Seconds to run (default: --iterations)"
+    )
+    parser.add_argument(
+        "--iterations", type=int, help="Page walks per session (default 5)"
+    )
+    parser.add_argument("--reason-pages", type=int, default=3)
+    parser.add_argument(
+        "--think-time", type=float, default=0.0, help="Mean pause between walks"
+    )
+    parser.add_argument("--ramp-up", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--seed-rows",
+        type=int,
+        default=0,
+        help="Insert this many synthetic police_data documents first",
+    )
+    parser.add_argument(
+        "--reset", action="store_true", help="Clear police_data before seeding"
+    )
+    parser.add_argument("--output", help="Write the report as JSON")
+    args = parser.parse_args(argv)
+
+    if args.seed_rows:
+        started = time.perf_counter()
+        written = seed_police_data(args.seed_rows, args.seed, args.reset)
+        print(f"Seeded {written} documents in {time.perf_counter() - started:.1f}s")
+
+    iterations = args.iterations
+    if args.duration is None and iterations is None:
+        iterations = 5
+    report = asyncio.run(
+        run_load(
+            sessions=args.sessions,
+            duration=args.duration,
+            iterations=iterations,
+            reason_pages=args.reason_pages,
+            think_time=args.think_time,
+            seed=args.seed,
+            ramp_up=args.ramp_up,
+        )
+    )
+    print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
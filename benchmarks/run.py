@@ -0,0 +1,165 @@
+"""
+Run the benchmark suite.
+
+    python -m benchmarks.run
+    python -m benchmarks.run --sizes 10000 --cases stat_to_dict analyze_police_errors
+    python -m benchmarks.run --save-baseline
+
+Each case is timed at every size (best of --repeat runs) and measured once
+more under tracemalloc for its peak memory, also given per row. Results are
+compared against the baseline file; the exit status is 1 when a case lost
+more than --tolerance of its baseline throughput.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional
+from benchmarks.cases import CASES, BenchmarkCase
+from benchmarks.synthetic import SyntheticData
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+DEFAULT_BASELINE = "benchmarks/baseline.json"
+
+
+def measure(bench: BenchmarkCase, n: int, seed: int, repeat: int) -> Dict[str, float]:
+    """Time a case at n rows and measure its peak memory"""
+    data = bench.setup(n, SyntheticData(seed=seed))
+    gc.collect()
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        bench.run(data)
+        best = min(best, time.perf_counter() - start)
+
+    # tracemalloc slows allocation down, so memory gets its own run
+    tracemalloc.start()
+    try:
+        bench.run(data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del data
+    gc.collect()
+    return {
+        "seconds": round(best, 6),
+        "ops_per_sec": round(n / best, 1) if best > 0 else float("inf"),
+        "peak_memory_mb": round(peak / (1024 * 1024), 3),
+        # Cases that build objects keep them alive, so this is their size
+        "bytes_per_row": round(peak / n, 1),
+    }
+
+
+def find_regressions(
+    results: Dict[str, Dict[str, Dict]],
+    baseline: Dict[str, Dict[str, Dict]],
+    tolerance: float,
+) -> List[str]:
+    """Cases and sizes whose throughput fell below the baseline tolerance"""
+    regressions = []
+    for name, sizes in results.items():
+        for size, result in sizes.items():
+            reference = baseline.get(name, {}).get(size)
+            if not reference:
+                continue
+            floor = reference["ops_per_sec"] * (1 - tolerance)
+            if result["ops_per_sec"] < floor:
+                regressions.append(
+                    f"{name} @ {size}: {result['ops_per_sec']:,.0f} ops/s "
+                    f"< {floor:,.0f} ops/s (baseline {reference['ops_per_sec']:,.0f})"
+                )
+    return regressions
+
+
+def load_baseline(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def write_report(path: str, report: Dict[str, Any]):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write the results as JSON")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store the results as the new baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed throughput loss against the baseline (default 0.2)",
+    )
+    args = parser.parse_args(argv)
+
+    names = args.cases or list(CASES)
+    results: Dict[str, Dict[str, Dict]] = {}
+
+    print(
+        f"{'case':<28} {'rows':>9} {'ops/sec':>14} {'seconds':>10} "
+        f"{'peak MB':>10} {'B/row':>8}"
+    )
+    for name in names:
+        for n in args.sizes:
+            result = measure(CASES[name], n, args.seed, args.repeat)
+            results.setdefault(name, {})[str(n)] = result
+            print(
+                f"{name:<28} {n:>9} {result['ops_per_sec']:>14,.0f} "
+                f"{result['seconds']:>10.4f} {result['peak_memory_mb']:>10.2f} "
+                f"{result['bytes_per_row']:>8.0f}"
+            )
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    if args.output:
+        write_report(args.output, report)
+
+    if args.save_baseline:
+        baseline = load_baseline(args.baseline) or {}
+        merged = baseline.get("results", {})
+        for name, sizes in results.items():
+            merged.setdefault(name, {}).update(sizes)
+        write_report(args.baseline, {**report, "results": merged})
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline")
+        return 0
+
+    regressions = find_regressions(results, baseline.get("results", {}), args.tolerance)
+    if regressions:
+        print(f"\nRegressions against {args.baseline}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print(f"\nNo regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,278 @@
+"""
+Synthetic data shaped like the PostgreSQL rows and MongoDB documents the
+dashboard works with.
+
+Every generator is deterministic for a given seed. Categorical fields are
+drawn from weighted distributions so that benchmarks see a realistic mix of
+states, police types and error reasons.
+"""
+
+import random
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, Optional
+
+# Weighted distributions: value -> relative weight
+MOVEMENT_STATES = {
+    "SUCCESS": 70,
+    "CONFIRMED": 8,
+    "ERROR": 8,
+    "INVALID": 6,
+    "NEW": 3,
+    "IN_PROGRESS": 2,
+    "CANCELED": 1,
+    "EXPIRED": 1,
+    "NOT_APPLY": 1,
+}
+MOVEMENT_ACTIONS = {"CHECK_IN": 60, "PRE_CHECK_IN": 15, "CHECK_OUT": 20, "CANCELED": 5}
+MOVEMENT_TYPES = {
+    "NEW_BOOKING": 50,
+    "BOOKING_MODIFIED": 20,
+    "NEW_GUEST": 20,
+    "GUEST_MODIFIED": 10,
+}
+VENDORS = {
+    "SPAIN_HOS": 45,
+    "GERMANY": 10,
+    "CROATIAN_CEV": 10,
+    "PORTUGAL_SEF": 15,
+    "ITALIA": 15,
+    "CZECH_CUP": 5,
+}
+REGISTRATION_STATUSES = {
+    "COMPLETE": 75,
+    "ERROR": 10,
+    "NEW": 5,
+    "PROGRESS": 3,
+    "SCHEDULED": 3,
+    "CANCELED": 2,
+    "NO_LOGIN_CRED": 1,
+    "RESTART": 1,
+}
+REGISTRATION_POLICE_TYPES = {"CUP2": 40, "SEF2": 30, "UHH2": 20, "": 10}
+BOOKING_STATUSES = {"COMPLETE": 80, "ERROR": 10, "NEW": 6, "PROGRESS": 4}
+CHECKOUT_STATUSES = {
+    "COMPLETE": 60,
+    "NEW": 15,
+    "ERROR": 10,
+    "SCHEDULED": 8,
+    "PROGRESS": 4,
+    "NOT_USED": 2,
+    "SENT_TO_CANCEL": 1,
+}
+STAT_TYPES = {
+    "ITAB": 20,
+    "ITCA": 15,
+    "ITLA": 15,
+    "ITMA": 10,
+    "ITPI": 10,
+    "ITRA": 10,
+    "ITSA_V2": 8,
+    "ITTO_V2": 7,
+    "AEEM": 5,
+}
+# Police types as stored in police_data (unified)
+UNIFIED_POLICE_TYPES = {
+    "SPAIN_HOS": 30,
+    "MOS": 10,
+    "ISP": 10,
+    "NAT": 8,
+    "PORTUGAL_SEF": 12,
+    "GERMANY": 8,
+    "CROATIAN_CEV": 6,
+    "CUP2": 6,
+    "SEF2": 5,
+    "UHH2": 5,
+}
+UNIFIED_STATES = {
+    "SUCCESS": 55,
+    "COMPLETE": 15,
+    "CONFIRMED": 5,
+    "ERROR": 10,
+    "INVALID": 7,
+    "NEW": 3,
+    "PROGRESS": 2,
+    "CANCELED": 2,
+    "EXPIRED": 1,
+}
+# Reasons attached to error states; some match the expected-error rules
+ERROR_REASONS = {
+    "Invalid name format. Name and first surname are required.": 10,
+    "Validation error": 8,
+    "Wrong credentials": 6,
+    "validation errors": 6,
+    "exp_date field is required!": 4,
+    "Timeout while contacting police endpoint": 20,
+    "Unexpected response from police service": 15,
+    "Document number already registered": 10,
+    "Internal server error": 8,
+}
+SUCCESS_REASONS = {"": 80, "Confirmed": 20}
+
+DEFAULT_DISTRIBUTIONS = {
+    "movement_states": MOVEMENT_STATES,
+    "movement_actions": MOVEMENT_ACTIONS,
+    "movement_types": MOVEMENT_TYPES,
+    "vendors": VENDORS,
+    "registration_statuses": REGISTRATION_STATUSES,
+    "registration_police_types": REGISTRATION_POLICE_TYPES,
+    "booking_statuses": BOOKING_STATUSES,
+    "checkout_statuses": CHECKOUT_STATUSES,
+    "stat_types": STAT_TYPES,
+    "unified_police_types": UNIFIED_POLICE_TYPES,
+    "unified_states": UNIFIED_STATES,
+    "error_reasons": ERROR_REASONS,
+    "success_reasons": SUCCESS_REASONS,
+}
+
+
+class WeightedChoice:
+    """Draws values from a weighted distribution with a shared RNG."""
+
+    def __init__(self, rng: random.Random, weights: Dict[str, float]):
+        self._rng = rng
+        self.values = list(weights)
+        self._cum_weights = []
+        total = 0.0
+        for weight in weights.values():
+            total += weight
+            self._cum_weights.append(total)
+
+    def __call__(self) -> str:
+        return self._rng.choices(self.values, cum_weights=self._cum_weights)[0]
+
+
+class SyntheticData:
+    """
+    Deterministic generator of rows and documents
+
+    Args:
+        seed: RNG seed; the same seed yields the same data
+        start: Earliest created_at
+        span: Time range created_at values are spread over
+        distributions: Overrides of DEFAULT_DISTRIBUTIONS by name, e.g.
+            {"movement_states": {"SUCCESS": 50, "ERROR": 50}}
+    """
+
+    def __init__(
+        self,
+        seed: int = 42,
+        start: Optional[datetime] = None,
+        span: timedelta = timedelta(days=1),
+        distributions: Optional[Dict[str, Dict[str, float]]] = None,
+    ):
+        self.rng = random.Random(seed)
+        self.start = start or datetime(2025, 1, 1)
+        self.span_seconds = span.total_seconds()
+        unknown = set(distributions or {}) - set(DEFAULT_DISTRIBUTIONS)
+        if unknown:
+            raise ValueError(f"Unknown distributions: {', '.join(sorted(unknown))}")
+        weights = {**DEFAULT_DISTRIBUTIONS, **(distributions or {})}
+        for name, table in weights.items():
+            setattr(self, name, WeightedChoice(self.rng, table))
+
+    def new_id(self) -> str:
+        """A random UUID4 string drawn from the seeded RNG."""
+        return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+
+    def _created_at(self) -> datetime:
+        return self.start + timedelta(seconds=self.rng.random() * self.span_seconds)
+
+    def _reason(self, state: str) -> str:
+        if state in ("ERROR", "INVALID", "EXPIRED", "CANCELED"):
+            return self.error_reasons()
+        return self.success_reasons()
+
+    # PostgreSQL rows, as returned by the registration/movement services
+
+    def movement_rows(self, n: int) -> Iterator[Dict[str, Any]]:
+        """Rows of movements_policemovement."""
+        for _ in range(n):
+            created_at = self._created_at()
+            state = self.movement_states()
+            yield {
+                "id": self.new_id(),
+                "created_at": created_at,
+                "updated_at": created_at + timedelta(seconds=30),
+                "action": self.movement_actions(),
+                "state": state,
+                "movement_type": self.movement_types(),
+                "vendor": self.vendors(),
+                "expiration_date": (created_at + timedelta(days=30)).date(),
+                "last_sent_date": created_at,
+                "data": '{"guests": 2}',
+                "reason": self._reason(state),
+                "reservation_id": self.new_id(),
+                "tax_data": '{"amount": 1.5}',
+                "is_sent_manually": False,
+            }
+
+    def registration_rows(self, n: int) -> Iterator[Dict[str, Any]]:
+        """Rows of police_guest_registrations joined with the task police type."""
+        for _ in range(n):
+            created_at = self._created_at()
+            status = self.registration_statuses()
+            yield {
+                "id": self.new_id(),
+                "created_at": created_at,
+                "updated_at": created_at + timedelta(seconds=30),
+                "status": status,
+                "status_details": self._reason(status),
+                "status_booking": self.booking_statuses(),
+                "status_check_out": self.checkout_statuses(),
+                "status_room_change": "NEW",
+                "reservation_id": self.new_id(),
+                "vr_sheet_number": str(self.rng.randint(100000, 999999)),
+                "start_date": created_at.date(),
+                "end_date": (created_at + timedelta(days=3)).date(),
+                "police_type": self.registration_police_types() or None,
+            }
+
+    def stat_rows(self, n: int) -> Iterator[Dict[str, Any]]:
+        """Rows of stat_registrations joined with the task stat type."""
+        for _ in range(n):
+            created_at = self._created_at()
+            check_in = self.booking_statuses()
+            check_out = self.checkout_statuses()
+            yield {
+                "id": self.new_id(),
+                "created_at": created_at,
+                "updated_at": created_at + timedelta(seconds=30),
+                "status_check_in": check_in,
+                "status_check_out": check_out,
+                "status_check_in_details": self._reason(check_in),
+                "status_check_out_details": self._reason(check_out),
+                "reservation_id": self.new_id(),
+                "stat_type": self.stat_types(),
+            }
+
+    # MongoDB documents, as stored by the sync
+
+    def police_documents(self, n: int) -> Iterator[Dict[str, Any]]:
+        """Unified police_data documents."""
+        for _ in range(n):
+            created_at = self._created_at()
+            state = self.unified_states()
+            yield {
+                "id": self.new_id(),
+                "created_at": created_at.isoformat(),
+                "updated_at": created_at.isoformat(),
+                "action": self.movement_actions(),
+                "state": state,
+                "movement_type": self.movement_types(),
+                "police_type": self.unified_police_types(),
+                "data": "",
+                "reason": self._reason(state),
+                "source_type": (
+                    "movement" if self.rng.random() < 0.7 else "registration"
+                ),
+                "reservation_id": self.new_id(),
+            }
+
+    def stat_documents(self, n: int) -> Iterator[Dict[str, Any]]:
+        """stat_data documents."""
+        for row in self.stat_rows(n):
+            doc = dict(row)
+            doc["created_at"] = row["created_at"].isoformat()
+            doc["updated_at"] = row["updated_at"].isoformat()
+            yield doc
@@ -1,15 +1,19 @@
 import os
-from typing import Optional
-import psycopg
-from pymongo import MongoClient
-from pymongo.database import Database
+from typing import TYPE_CHECKING, Optional
+
+# The drivers are imported on first connect: the dashboard only talks to
+# MongoDB and should not pay for loading psycopg, and vice versa.
+if TYPE_CHECKING:
+    import psycopg
+    from pymongo import MongoClient
+    from pymongo.database import Database
 
 
 class DatabaseManager:
     _instance: Optional["DatabaseManager"] = None
-    _mongo_client: Optional[MongoClient] = None
-    _mongo_db: Optional[Database] = None
-    _postgres_conn: Optional[psycopg.Connection] = None
+    _mongo_client: Optional["MongoClient"] = None
+    _mongo_db: Optional["Database"] = None
+    _postgres_conn: Optional["psycopg.Connection"] = None
 
     def __new__(cls):
         """Singleton pattern for database connections."""
@@ -24,16 +28,18 @@ class DatabaseManager:
         database: str = "legal_dashboard",
         user: str = "postgres",
         password: str = "",
-    ) -> psycopg.Connection:
+    ) -> "psycopg.Connection":
         """Connect to PostgreSQL database"""
         if self._postgres_conn is None or self._postgres_conn.closed:
+            import psycopg
+
             connstring = f"host={host} port={port} dbname={database} user={user} password={password}"
             self._postgres_conn = psycopg.connect(connstring)
         return self._postgres_conn
 
     def connect_mongo(
         self, connection_string: str, database: str = "legal_dashboard"
-    ) -> Database:
+    ) -> "Database":
         """Connect to MongoDB database using connection string with connection pooling.
 
         Args:
@@ -44,6 +50,9 @@ class DatabaseManager:
             Database: MongoDB database instance
         """
         if self._mongo_client is None:
+            from pymongo import MongoClient
+            from monitoring.mongo_commands import mongo_command_listener
+
             # Connect using connection string with connection pooling options
             self._mongo_client = MongoClient(
                 connection_string,
@@ -51,7 +60,11 @@ class DatabaseManager:
                 serverSelectionTimeoutMS=5000,  # Timeout for server selection
                 connectTimeoutMS=10000,  # Connection timeout
                 maxIdleTimeMS=45000,  # Max idle time for connections
+                # Per-command latency histograms and slow-query log
+                event_listeners=[mongo_command_listener],
             )
+            # Slow reads are explained through the same client
+            mongo_command_listener.attach_client(self._mongo_client)
 
         if self._mongo_client is not None:
             self._mongo_db = self._mongo_client[database]
@@ -76,12 +89,12 @@ class DatabaseManager:
         self.close_mongo()
 
     @property
-    def postgres(self) -> Optional[psycopg.Connection]:
+    def postgres(self) -> Optional["psycopg.Connection"]:
         """Get PostgreSQL connection"""
         return self._postgres_conn
 
     @property
-    def mongo(self) -> Optional[Database]:
+    def mongo(self) -> Optional["Database"]:
         """Get MongoDB database"""
         return self._mongo_db
 
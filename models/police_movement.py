@@ -99,7 +99,7 @@ class VendorType(Enum):
         return display_names.get(vendor, vendor)
 
 
-@dataclass
+@dataclass(slots=True)
 class PoliceMovement:
     """
     Police Movement model representing a police registration movement
@@ -60,7 +60,7 @@ class PoliceType(Enum):
     UHH2 = "UHH2"
 
 
-@dataclass
+@dataclass(slots=True)
 class PoliceRegistration:
     """
     Police Registration model representing a police registration record
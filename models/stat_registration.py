@@ -35,7 +35,7 @@ class StatType(Enum):
     ITVE = "ITVE"
 
 
-@dataclass
+@dataclass(slots=True)
 class StatRegistration:
     """
     Data class representing a statistical registration record.
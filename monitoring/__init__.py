@@ -0,0 +1,10 @@
+from .histogram import HistogramRegistry, LatencyHistogram, latency_histograms
+from .mongo_commands import MongoCommandListener, mongo_command_listener
+
+__all__ = [
+    "HistogramRegistry",
+    "LatencyHistogram",
+    "latency_histograms",
+    "MongoCommandListener",
+    "mongo_command_listener",
+]
@@ -0,0 +1,148 @@
+"""
+In-process latency histograms.
+
+Durations are counted in fixed buckets, so recording is O(log buckets) and
+memory stays constant however many samples arrive. Percentiles are
+interpolated inside the bucket that contains them, which is accurate enough
+to follow p95 trends without keeping raw samples.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+# Upper bounds of the buckets in milliseconds; the last bucket is unbounded
+DEFAULT_BUCKETS_MS = (
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+    30000,
+    60000,
+)
+
+
+class LatencyHistogram:
+    """Bucketed histogram of durations in milliseconds."""
+
+    def __init__(self, buckets_ms: tuple = DEFAULT_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        self.counts: List[int] = [0] * (len(self.buckets_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, duration_ms: float):
+        """Add one duration to the histogram."""
+        index = bisect_left(self.buckets_ms, duration_ms)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total_ms += duration_ms
+            self.max_ms = max(self.max_ms, duration_ms)
+
+    def snapshot(self) -> tuple:
+        """Consistent copy of (bucket counts, count, total milliseconds)."""
+        with self._lock:
+            return list(self.counts), self.count, self.total_ms
+
+    def percentile(self, p: float) -> float:
+        """
+        Estimate the p-th percentile (0-100) in milliseconds
+
+        Returns 0.0 when nothing was recorded.
+        """
+        with self._lock:
+            counts = list(self.counts)
+            count = self.count
+            max_ms = self.max_ms
+        if count == 0:
+            return 0.0
+
+        rank = p / 100 * count
+        cumulative = 0
+        for index, bucket_count in enumerate(counts):
+            if bucket_count == 0 or cumulative + bucket_count < rank:
+                cumulative += bucket_count
+                continue
+            lower = self.buckets_ms[index - 1] if index > 0 else 0.0
+            upper = self.buckets_ms[index] if index < len(self.buckets_ms) else max_ms
+            upper = min(upper, max_ms)
+            fraction = (rank - cumulative) / bucket_count
+            return lower + (upper - lower) * max(fraction, 0.0)
+        return max_ms
+
+    def summary(self) -> Dict[str, float]:
+        """Count, mean, p50/p95/p99 and max in milliseconds."""
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": self.max_ms,
+        }
+
+
+class HistogramRegistry:
+    """Latency histograms keyed by operation name, shared by the process."""
+
+    def __init__(self):
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def get(self, operation: str) -> LatencyHistogram:
+        """Get the histogram for an operation, creating it if needed."""
+        histogram = self._histograms.get(operation)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(operation, LatencyHistogram())
+        return histogram
+
+    def record(self, operation: str, duration_ms: float):
+        """Record one duration for an operation."""
+        self.get(operation).record(duration_ms)
+
+    @contextmanager
+    def time(self, operation: str) -> Iterator[None]:
+        """Record the wall-clock duration of the enclosed block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(operation, (time.perf_counter() - start) * 1000)
+
+    def items(self) -> List[tuple]:
+        """Snapshot of (operation, histogram) pairs sorted by name."""
+        with self._lock:
+            return sorted(self._histograms.items())
+
+    def summary(self, prefix: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+        """Percentile summary of every operation, optionally by name prefix."""
+        return {
+            operation: histogram.summary()
+            for operation, histogram in self.items()
+            if prefix is None or operation.startswith(prefix)
+        }
+
+    def clear(self):
+        """Drop all histograms."""
+        with self._lock:
+            self._histograms.clear()
+
+
+# Shared by everything running in this process
+latency_histograms = HistogramRegistry()
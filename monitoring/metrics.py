@@ -0,0 +1,260 @@
+"""
+Prometheus text-format metrics.
+
+Counters and gauges live in a small in-process registry; latency comes from
+the shared histograms in monitoring.histogram. render_prometheus() produces
+the text exposition format served on /metrics by the Reflex backend and
+written (or served) by sync_data.py, so no client library is needed.
+The backend's /metrics asks for the DASHBOARD_API_TOKEN bearer token, like
+the /api/ routes; Prometheus sends it through the authorization section of
+its scrape config.
+"""
+
+import functools
+import inspect
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Tuple
+from monitoring.histogram import HistogramRegistry, latency_histograms
+
+METRIC_PREFIX = "legal_dashboard_"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# name -> (type, help) for every counter and gauge family
+METRIC_FAMILIES: Dict[str, Tuple[str, str]] = {
+    "sync_rows_total": ("counter", "Rows processed by the sync, per stage"),
+    "sync_stage_duration_seconds": (
+        "gauge",
+        "Duration of the last run of each sync stage",
+    ),
+    "sync_stage_rows_per_second": (
+        "gauge",
+        "Throughput of the last run of each sync stage",
+    ),
+    "sync_last_success_timestamp_seconds": (
+        "gauge",
+        "Unix time of the last completed sync of a collection",
+    ),
+    "dashboard_cache_requests_total": (
+        "counter",
+        "Shared dashboard cache lookups by result (hit, stale, miss)",
+    ),
+    "mongo_documents_returned_total": (
+        "counter",
+        "Documents returned (reads) or affected (writes) by Mongo commands",
+    ),
+    "mongo_documents_examined_total": (
+        "counter",
+        "Documents examined by slow Mongo reads, from explain",
+    ),
+    "mongo_explained_commands_total": (
+        "counter",
+        "Slow Mongo reads explained to count the documents examined",
+    ),
+    "dashboard_cache_hit_ratio": (
+        "gauge",
+        "Fraction of shared dashboard cache lookups served fresh",
+    ),
+}
+OPERATION_HISTOGRAM = "operation_duration_seconds"
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (key, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for key, value in labels
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+class MetricsRegistry:
+    """Labelled counters and gauges rendered with the latency histograms."""
+
+    def __init__(self, histograms: HistogramRegistry = latency_histograms):
+        self.histograms = histograms
+        self._values: Dict[Tuple[str, tuple], float] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(name: str, labels: Dict[str, str]) -> Tuple[str, tuple]:
+        return name, tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    def inc(self, name: str, value: float = 1.0, **labels):
+        """Increase a counter."""
+        key = self._key(name, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + value
+
+    def set(self, name: str, value: float, **labels):
+        """Set a gauge."""
+        with self._lock:
+            self._values[self._key(name, labels)] = value
+
+    def value(self, name: str, **labels) -> float:
+        """Current value of a counter or gauge, 0 if never set."""
+        with self._lock:
+            return self._values.get(self._key(name, labels), 0.0)
+
+    def clear(self):
+        """Drop every counter and gauge."""
+        with self._lock:
+            self._values.clear()
+
+    def _with_cache_hit_ratio(self, values: Dict) -> Dict:
+        """Add dashboard_cache_hit_ratio gauges derived from the counters."""
+        lookups: Dict[str, Dict[str, float]] = {}
+        for (name, labels), value in values.items():
+            if name != "dashboard_cache_requests_total":
+                continue
+            labels = dict(labels)
+            lookups.setdefault(labels["cache"], {})[labels["result"]] = value
+        for cache, results in lookups.items():
+            total = sum(results.values())
+            ratio = results.get("hit", 0.0) / total if total else 0.0
+            values[("dashboard_cache_hit_ratio", (("cache", cache),))] = ratio
+        return values
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        with self._lock:
+            values = dict(self._values)
+        values = self._with_cache_hit_ratio(values)
+
+        lines: List[str] = []
+        for name in sorted({name for name, _ in values}):
+            metric_type, help_text = METRIC_FAMILIES.get(name, ("untyped", name))
+            full_name = METRIC_PREFIX + name
+            lines.append(f"# HELP {full_name} {help_text}")
+            lines.append(f"# TYPE {full_name} {metric_type}")
+            for (family, labels), value in sorted(values.items()):
+                if family == name:
+                    lines.append(
+                        f"{full_name}{_format_labels(labels)} {_format_value(value)}"
+                    )
+
+        histograms = self.histograms.items()
+        if histograms:
+            full_name = METRIC_PREFIX + OPERATION_HISTOGRAM
+            lines.append(
+                f"# HELP {full_name} Latency of Mongo commands, service methods, "
+                f"event handlers and sync stages"
+            )
+            lines.append(f"# TYPE {full_name} histogram")
+            for operation, histogram in histograms:
+                counts, count, total_ms = histogram.snapshot()
+                cumulative = 0
+                bounds = [bound / 1000 for bound in histogram.buckets_ms]
+                for bound, bucket_count in zip(bounds + [float("inf")], counts):
+                    cumulative += bucket_count
+                    labels = (("operation", operation), ("le", _format_value(bound)))
+                    lines.append(
+                        f"{full_name}_bucket{_format_labels(labels)} {cumulative}"
+                    )
+                labels = _format_labels((("operation", operation),))
+                lines.append(
+                    f"{full_name}_sum{labels} {_format_value(total_ms / 1000)}"
+                )
+                lines.append(f"{full_name}_count{labels} {count}")
+
+        return "\n".join(lines) + "\n"
+
+
+# Shared by everything running in this process
+metrics = MetricsRegistry()
+
+
+def render_prometheus() -> str:
+    """Render the process-wide metrics."""
+    return metrics.render()
+
+
+def record_sync_stage(collection: str, stage: str, rows: int, seconds: float):
+    """
+    Record one sync stage: rows processed, duration and throughput
+
+    Args:
+        collection: Target collection, e.g. "police_data"
+        stage: Stage name, e.g. "extract", "transform" or "write"
+        rows: Rows processed by the stage
+        seconds: Wall-clock duration of the stage
+    """
+    metrics.inc("sync_rows_total", rows, collection=collection, stage=stage)
+    metrics.set(
+        "sync_stage_duration_seconds", seconds, collection=collection, stage=stage
+    )
+    metrics.set(
+        "sync_stage_rows_per_second",
+        rows / seconds if seconds > 0 else 0.0,
+        collection=collection,
+        stage=stage,
+    )
+    latency_histograms.record(f"sync.{collection}.{stage}", seconds * 1000)
+
+
+def timed_event(fn: Callable) -> Callable:
+    """
+    Record the latency of a state event handler as "event.<qualname>"
+
+    Apply below @rx.event so Reflex registers the timed wrapper. Works for
+    plain and async handlers, including background ones.
+    """
+    if inspect.isgeneratorfunction(fn) or inspect.isasyncgenfunction(fn):
+        raise TypeError(f"timed_event does not support generator handler {fn}")
+    operation = f"event.{fn.__qualname__}"
+
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            with latency_histograms.time(operation):
+                return await fn(*args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with latency_histograms.time(operation):
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def write_metrics_file(path: str):
+    """Write the metrics atomically, e.g. for node_exporter's textfile collector."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(render_prometheus())
+    os.replace(tmp_path, path)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_server(port: int, host: str = "0.0.0.0") -> ThreadingHTTPServer:
+    """Serve /metrics from a daemon thread, for short-lived processes like the sync."""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
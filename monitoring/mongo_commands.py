@@ -0,0 +1,238 @@
+"""
+MongoDB command monitoring.
+
+A pymongo CommandListener times every command sent by this process. Each
+command is recorded in the process-wide latency histograms twice: under
+"mongo.<command>.<collection>" and under the service method that issued it
+(e.g. "PoliceDataMongoService.get_statistics"). Commands slower than
+MONGO_SLOW_QUERY_MS are written to the "monitoring.slow_queries" logger.
+
+The documents each operation returns (or affects, for writes) are counted
+in the mongo_documents_returned_total metric. Command replies do not say
+how many documents the server examined, so slow reads are explained with
+executionStats on a background thread, after the fact, and their
+totalDocsExamined goes to mongo_documents_examined_total. Only slow reads
+pay for the explain.
+"""
+
+import logging
+import queue
+import sys
+import threading
+from typing import Any, Dict, Optional
+from pymongo import monitoring
+from monitoring.histogram import HistogramRegistry, latency_histograms
+from monitoring.metrics import MetricsRegistry, metrics
+from settings import settings
+
+slow_query_logger = logging.getLogger("monitoring.slow_queries")
+logger = logging.getLogger(__name__)
+
+# Modules whose functions count as the caller of a command
+CALLER_MODULE_PREFIXES = ("services.", "app.", "sync_data", "benchmarks.")
+# Shared read helpers; the function calling them is the caller
+CALLER_SKIPPED_MODULES = ("services.mongo_reads",)
+
+# Commands whose slow runs are explained to count the documents examined
+EXPLAINED_COMMANDS = ("find", "aggregate", "count", "distinct")
+# Command fields that belong to the session, not the query
+_SESSION_FIELDS = ("lsid", "txnNumber", "autocommit", "startTransaction")
+# Slow reads waiting for an explain; more are dropped
+EXPLAIN_QUEUE_SIZE = 100
+
+
+def find_caller(
+    prefixes: tuple = CALLER_MODULE_PREFIXES,
+    max_depth: int = 40,
+    skipped: tuple = CALLER_SKIPPED_MODULES,
+) -> str:
+    """
+    Name of the innermost application function on the current stack
+
+    pymongo publishes the started event on the thread that issued the
+    command, so the first frame from one of the module prefixes is the
+    service method (or state handler) that ran the query. Frames of the
+    skipped modules (e.g. find_fields) are passed over.
+    """
+    frame = sys._getframe(1)
+    depth = 0
+    while frame is not None and depth < max_depth:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith(prefixes) and module not in skipped:
+            return frame.f_code.co_qualname
+        frame = frame.f_back
+        depth += 1
+    return "unknown"
+
+
+def _count_documents(command_name: str, reply: Dict[str, Any]) -> Optional[int]:
+    """Documents returned (reads) or affected (writes) by a command reply."""
+    cursor = reply.get("cursor")
+    if cursor is not None:
+        return len(cursor.get("firstBatch", cursor.get("nextBatch", [])))
+    if command_name == "findAndModify":
+        return 1 if reply.get("value") is not None else 0
+    if "n" in reply:
+        return reply["n"]
+    return None
+
+
+def _docs_examined(explain: Any) -> Optional[int]:
+    """totalDocsExamined of an explain reply, summed over its cursors"""
+    if isinstance(explain, dict):
+        if "totalDocsExamined" in explain:
+            return explain["totalDocsExamined"]
+        found = [_docs_examined(value) for value in explain.values()]
+    elif isinstance(explain, list):
+        found = [_docs_examined(value) for value in explain]
+    else:
+        return None
+    found = [count for count in found if count is not None]
+    return sum(found) if found else None
+
+
+def _collection_name(command_name: str, command: Dict[str, Any]) -> str:
+    # getMore names its collection separately from the cursor id
+    name = command.get("collection" if command_name == "getMore" else command_name)
+    return name if isinstance(name, str) else ""
+
+
+class MongoCommandListener(monitoring.CommandListener):
+    """Records duration, collection, caller and document counts per command."""
+
+    def __init__(
+        self,
+        histograms: HistogramRegistry = latency_histograms,
+        slow_query_ms: Optional[float] = None,
+        caller_prefixes: tuple = CALLER_MODULE_PREFIXES,
+        metrics_registry: MetricsRegistry = metrics,
+    ):
+        self.histograms = histograms
+        self.metrics = metrics_registry
+        self.caller_prefixes = caller_prefixes
+        self.slow_query_ms = (
+            settings.MONGO_SLOW_QUERY_MS if slow_query_ms is None else slow_query_ms
+        )
+        self._pending: Dict[tuple, tuple] = {}
+        self._lock = threading.Lock()
+        # Client that explains slow reads, set by attach_client
+        self._client = None
+        self._explain_queue: queue.Queue = queue.Queue(maxsize=EXPLAIN_QUEUE_SIZE)
+        self._explain_thread: Optional[threading.Thread] = None
+
+    def attach_client(self, client):
+        """Explain slow reads through this MongoClient."""
+        self._client = client
+
+    @staticmethod
+    def _key(event) -> tuple:
+        return (event.connection_id, event.request_id, event.operation_id)
+
+    def started(self, event: monitoring.CommandStartedEvent):
+        collection = _collection_name(event.command_name, event.command)
+        caller = find_caller(self.caller_prefixes)
+        # Kept until the command completes, in case it turns out slow
+        query = None
+        if event.command_name in EXPLAINED_COMMANDS:
+            query = (event.database_name, event.command)
+        with self._lock:
+            self._pending[self._key(event)] = (collection, caller, query)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        documents = _count_documents(event.command_name, event.reply)
+        self._record(event, documents=documents, failure=None)
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        self._record(event, documents=None, failure=event.failure)
+
+    def _record(self, event, documents: Optional[int], failure: Optional[Any]):
+        with self._lock:
+            collection, caller, query = self._pending.pop(
+                self._key(event), ("", "unknown", None)
+            )
+        duration_ms = event.duration_micros / 1000
+        command = event.command_name
+        operation = (
+            f"mongo.{command}.{collection}" if collection else f"mongo.{command}"
+        )
+        self.histograms.record(operation, duration_ms)
+        if caller != "unknown":
+            self.histograms.record(caller, duration_ms)
+        if documents is not None:
+            self.metrics.inc(
+                "mongo_documents_returned_total",
+                documents,
+                operation=operation,
+                caller=caller,
+            )
+
+        if failure is not None:
+            logger.warning(
+                f"Mongo {command} on {collection or '-'} from {caller} failed "
+                f"after {duration_ms:.1f} ms: {failure}"
+            )
+        if duration_ms >= self.slow_query_ms:
+            slow_query_logger.warning(
+                f"{duration_ms:.1f} ms {command} on {collection or '-'} "
+                f"from {caller} ({documents if documents is not None else '?'} docs)"
+            )
+            if failure is None and query is not None:
+                self._enqueue_explain(operation, caller, *query)
+
+    def _enqueue_explain(self, operation: str, caller: str, database: str, command):
+        if self._client is None:
+            return
+        with self._lock:
+            if self._explain_thread is None:
+                self._explain_thread = threading.Thread(
+                    target=self._explain_worker, name="mongo-explain", daemon=True
+                )
+                self._explain_thread.start()
+        try:
+            self._explain_queue.put_nowait((operation, caller, database, command))
+        except queue.Full:
+            pass
+
+    def _explain_worker(self):
+        while True:
+            item = self._explain_queue.get()
+            try:
+                self.explain(*item)
+            except Exception as e:
+                logger.debug(f"Could not explain a slow {item[0]}: {e}")
+            finally:
+                self._explain_queue.task_done()
+
+    def explain(self, operation: str, caller: str, database: str, command):
+        """
+        Count the documents a read examined by explaining it
+
+        The command is run again with explain (verbosity executionStats);
+        its totalDocsExamined is added to mongo_documents_examined_total and
+        the slow-query log.
+        """
+        query = {
+            key: value
+            for key, value in command.items()
+            if not key.startswith("$") and key not in _SESSION_FIELDS
+        }
+        reply = self._client[database].command(
+            {"explain": query, "verbosity": "executionStats"}
+        )
+        examined = _docs_examined(reply)
+        if examined is None:
+            return
+        self.metrics.inc(
+            "mongo_documents_examined_total",
+            examined,
+            operation=operation,
+            caller=caller,
+        )
+        self.metrics.inc(
+            "mongo_explained_commands_total", operation=operation, caller=caller
+        )
+        slow_query_logger.warning(f"{operation} from {caller} examined {examined} docs")
+
+
+# Registered on the MongoClient created by DatabaseManager
+mongo_command_listener = MongoCommandListener()
@@ -0,0 +1,184 @@
+"""
+Lightweight span tracing.
+
+Spans nest through a context variable and are exported when they end, one
+OTLP/JSON ExportTraceServiceRequest per line, which is the format written
+by the OpenTelemetry collector's file exporter. A trace file can therefore
+be replayed into a collector or loaded into a trace viewer as is, without
+adding the OpenTelemetry SDK as a dependency.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+# OTLP enum values
+SPAN_KIND_INTERNAL = 1
+STATUS_CODE_UNSET = 0
+STATUS_CODE_ERROR = 2
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    """Encode an attribute value as an OTLP AnyValue."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        # 64-bit integers are strings in OTLP/JSON
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        {"key": key, "value": _otlp_value(value)} for key, value in attributes.items()
+    ]
+
+
+class Span:
+    """A timed operation with attributes, part of a trace."""
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_span_id: str = "",
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_span_id = parent_span_id
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns = 0
+        self.status_code = STATUS_CODE_UNSET
+        self.status_message = ""
+
+    def set_attribute(self, key: str, value: Any):
+        """Set one attribute, e.g. a row count or byte size."""
+        self.attributes[key] = value
+
+    def add(self, key: str, amount: int = 1):
+        """Increase a numeric attribute."""
+        self.attributes[key] = self.attributes.get(key, 0) + amount
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_time_ns or time.time_ns()
+        return (end - self.start_time_ns) / 1_000_000
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """OTLP/JSON representation of the span."""
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(self.start_time_ns),
+            "endTimeUnixNano": str(self.end_time_ns),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": {"code": self.status_code},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        return span
+
+
+class JsonLinesSpanExporter:
+    """Appends finished spans to a file, one OTLP/JSON request per line."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def export(self, span: Span, service_name: str, scope_name: str):
+        request = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": _otlp_attributes({"service.name": service_name})
+                    },
+                    "scopeSpans": [
+                        {"scope": {"name": scope_name}, "spans": [span.to_otlp()]}
+                    ],
+                }
+            ]
+        }
+        line = json.dumps(request, separators=(",", ":"))
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class Tracer:
+    """Creates nested spans and hands finished ones to the exporter."""
+
+    def __init__(
+        self,
+        service_name: str,
+        exporter: Optional[JsonLinesSpanExporter] = None,
+        scope_name: str = "legal_dashboard",
+    ):
+        self.service_name = service_name
+        self.exporter = exporter
+        self.scope_name = scope_name
+        self._current: ContextVar[Optional[Span]] = ContextVar(
+            f"current_span_{id(self)}", default=None
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether spans are exported; callers can skip costly attributes."""
+        return self.exporter is not None
+
+    @property
+    def current_span(self) -> Optional[Span]:
+        return self._current.get()
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Span]:
+        """
+        Time the enclosed block as a child of the current span
+
+        An exception escaping the block marks the span as an error and is
+        re-raised. The span is exported even when the block exits through
+        SystemExit.
+        """
+        parent = self._current.get()
+        span = Span(
+            name,
+            trace_id=parent.trace_id if parent else os.urandom(16).hex(),
+            parent_span_id=parent.span_id if parent else "",
+            attributes=attributes,
+        )
+        token = self._current.set(span)
+        try:
+            yield span
+        except Exception as e:
+            span.status_code = STATUS_CODE_ERROR
+            span.status_message = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self._current.reset(token)
+            span.end_time_ns = time.time_ns()
+            if self.exporter is not None:
+                self.exporter.export(span, self.service_name, self.scope_name)
+
+    def shutdown(self):
+        """Close the exporter."""
+        if self.exporter is not None:
+            self.exporter.close()
+            self.exporter = None
@@ -3,6 +3,7 @@ from .police.police_registration_service import PoliceRegistrationService
 from .police.police_data_mongo_service import PoliceDataMongoService
 from .stats.stats_data_mongo_service import StatDataMongoService
 from .stats.stats_registration_service import StatRegistrationService
+from .data_version_service import DataVersionService
 
 __all__ = [
     "PoliceMovementService",
@@ -10,4 +11,5 @@ __all__ = [
     "PoliceDataMongoService",
     "StatDataMongoService",
     "StatRegistrationService",
+    "DataVersionService",
 ]
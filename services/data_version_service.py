@@ -0,0 +1,58 @@
+from datetime import datetime
+from pymongo import ReturnDocument
+from database_manager import DatabaseManager
+
+
+class DataVersionService:
+    """
+    Service for the monotonic data version of each synced collection
+
+    The sync bumps the version of a collection every time it finishes
+    writing to it, so readers can detect changed data with a single point
+    read on _id instead of relying on a time-based cache expiry.
+    """
+
+    def __init__(self, db_manager: DatabaseManager):
+        self.db_manager = db_manager
+        self.collection_name = "data_versions"
+
+    def _get_collection(self):
+        """Get MongoDB collection"""
+        mongo_db = self.db_manager.mongo
+        return mongo_db[self.collection_name]
+
+    def bump_version(self, collection_name: str) -> int:
+        """
+        Increment the data version of a collection
+
+        Args:
+            collection_name: Name of the collection that was written to
+
+        Returns:
+            The new version number
+        """
+        collection = self._get_collection()
+        doc = collection.find_one_and_update(
+            {"_id": collection_name},
+            {
+                "$inc": {"version": 1},
+                "$set": {"updated_at": datetime.now().isoformat()},
+            },
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return doc["version"]
+
+    def get_version(self, collection_name: str) -> int:
+        """
+        Get the current data version of a collection
+
+        Args:
+            collection_name: Name of the synced collection
+
+        Returns:
+            Version number, 0 if the collection was never synced
+        """
+        collection = self._get_collection()
+        doc = collection.find_one({"_id": collection_name}, {"version": 1})
+        return doc["version"] if doc else 0
@@ -0,0 +1,103 @@
+"""
+Row-to-document transforms for the sync, runnable in worker processes.
+
+The transforms take raw PostgreSQL rows (dicts) and are module-level
+functions, so they can be sent to a process pool. encode_in_workers builds
+the documents of each chunk of rows and encodes them to BSON in a worker;
+the main process gets RawBSONDocument batches that pymongo writes without
+encoding them again. Model construction and encoding, the CPU-bound part
+of the sync, then run on every core instead of the main thread.
+"""
+
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import bson
+from bson.raw_bson import RawBSONDocument
+from models.police_movement import PoliceMovement
+from models.police_registration import PoliceRegistration
+from models.stat_registration import StatRegistration
+from services.police.police_codes import CodeTable
+from services.police.police_data_mongo_service import PoliceDataMongoService
+
+# Document mapping only; never connects
+_police_service = PoliceDataMongoService(db_manager=None, compact=False)
+
+# (id, document) pairs of a chunk and the (row id, message) of failed rows
+EncodedChunk = Tuple[List[Tuple[Any, bytes]], List[Tuple[Any, str]]]
+EncodedBatch = Tuple[List[Tuple[Any, RawBSONDocument]], List[Tuple[Any, str]]]
+
+
+def movement_document(row: Dict[str, Any]) -> Dict[str, Any]:
+    """police_data document of a movements_policemovement row"""
+    return _police_service.movement_to_document(PoliceMovement.from_db_row(row))
+
+
+def registration_document(row: Dict[str, Any]) -> Dict[str, Any]:
+    """police_data document of a police registration row"""
+    return _police_service.registration_to_document(PoliceRegistration.from_db_row(row))
+
+
+def stat_document(row: Dict[str, Any]) -> Dict[str, Any]:
+    """stat_data document of a stat registration row"""
+    return StatRegistration.from_db_row(row).to_dict()
+
+
+def encode_chunk(
+    to_document: Callable[[Dict[str, Any]], Dict[str, Any]],
+    rows: List[Dict[str, Any]],
+    codes: Optional[CodeTable] = None,
+) -> EncodedChunk:
+    """
+    Build and BSON-encode the documents of a chunk of rows
+
+    A row that fails is reported by id and skipped, like load_records does
+    in process.
+    """
+    encoded = []
+    errors = []
+    for row in rows:
+        try:
+            doc = to_document(row)
+            if codes:
+                doc = codes.encode_document(doc)
+            encoded.append((doc["id"], bson.encode(doc)))
+        except Exception as e:
+            errors.append((row.get("id"), str(e)))
+    return encoded, errors
+
+
+def encode_in_workers(
+    rows: List[Dict[str, Any]],
+    to_document: Callable[[Dict[str, Any]], Dict[str, Any]],
+    chunk_size: int,
+    workers: int,
+    codes: Optional[CodeTable] = None,
+) -> Iterator[EncodedBatch]:
+    """
+    Encode rows in a process pool, yielding one batch per chunk in order
+
+    At most two chunks per worker are in flight, so the workers keep
+    transforming while the caller writes and the rows are not all copied
+    to the workers at once.
+
+    Yields:
+        ([(id, RawBSONDocument)], [(row id, error message)]) per chunk
+    """
+    # spawn: forked workers would inherit the parent's MongoClient
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        pending = deque()
+        for offset in range(0, len(rows), chunk_size):
+            chunk = rows[offset : offset + chunk_size]
+            pending.append(pool.submit(encode_chunk, to_document, chunk, codes))
+            if len(pending) >= 2 * workers:
+                yield _raw_batch(pending.popleft().result())
+        while pending:
+            yield _raw_batch(pending.popleft().result())
+
+
+def _raw_batch(chunk: EncodedChunk) -> EncodedBatch:
+    encoded, errors = chunk
+    return [(doc_id, RawBSONDocument(data)) for doc_id, data in encoded], errors
@@ -0,0 +1,84 @@
+import logging
+from typing import Any, Dict, List
+from pymongo import TEXT, IndexModel
+from pymongo.errors import PyMongoError
+
+logger = logging.getLogger(__name__)
+
+
+def _index_key(model: IndexModel) -> tuple:
+    """
+    Key pattern of an index model as a comparable tuple
+
+    The server lists a text index under the _fts/_ftsx keys instead of its
+    fields, so text fields are replaced by those to match it.
+    """
+    key = []
+    for field, direction in model.document["key"].items():
+        if direction != TEXT:
+            key.append((field, direction))
+        elif ("_fts", TEXT) not in key:
+            key.extend([("_fts", TEXT), ("_ftsx", 1)])
+    return tuple(key)
+
+
+def ensure_collection_indexes(collection, index_models: List[IndexModel]) -> Dict:
+    """
+    Create the indexes a collection's queries rely on
+
+    Indexes whose key pattern already exists are left untouched, so this is
+    cheap to run on every sync and app start. Missing indexes are logged and
+    created one by one, so a failing index (e.g. a unique index over
+    duplicated data) does not prevent the others.
+
+    Args:
+        collection: pymongo Collection
+        index_models: Indexes matching the collection's query shapes
+
+    Returns:
+        Dict with the names of the "created", "failed" and "unused" indexes
+    """
+    existing = {tuple(info["key"]) for info in collection.index_information().values()}
+    created, failed = [], []
+    for model in index_models:
+        if _index_key(model) in existing:
+            continue
+        name = model.document["name"]
+        logger.warning(f"Missing index {name} on {collection.name}, creating it")
+        try:
+            collection.create_indexes([model])
+            created.append(name)
+        except PyMongoError as e:
+            logger.error(f"Failed to create index {name} on {collection.name}: {e}")
+            failed.append(name)
+
+    return {
+        "created": created,
+        "failed": failed,
+        "unused": find_unused_indexes(collection),
+    }
+
+
+def find_unused_indexes(collection) -> List[str]:
+    """
+    Log and return the indexes with no recorded use
+
+    Usage counters come from $indexStats and reset when mongod restarts, so
+    an index reported here has not been used since the "since" timestamp.
+    """
+    try:
+        stats: List[Dict[str, Any]] = list(collection.aggregate([{"$indexStats": {}}]))
+    except PyMongoError as e:
+        logger.info(f"Index usage stats unavailable for {collection.name}: {e}")
+        return []
+
+    unused = []
+    for stat in stats:
+        if stat["name"] == "_id_" or stat["accesses"]["ops"] > 0:
+            continue
+        logger.info(
+            f"Index {stat['name']} on {collection.name} has not been used "
+            f"since {stat['accesses']['since']}"
+        )
+        unused.append(stat["name"])
+    return unused
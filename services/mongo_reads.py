@@ -0,0 +1,121 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+import bson
+from bson.codec_options import CodecOptions
+
+# Plain dicts; pass CodecOptions(document_class=RawBSONDocument) to defer
+# decoding of documents that are only handed on
+DEFAULT_CODEC_OPTIONS: CodecOptions = CodecOptions()
+READ_BATCH_SIZE = 10_000
+
+
+def field_projection(fields: Iterable[str]) -> Dict[str, int]:
+    """Projection returning only the given fields, without _id unless listed"""
+    projection = {field: 1 for field in fields}
+    projection.setdefault("_id", 0)
+    return projection
+
+
+def created_at_range(
+    start: Optional[datetime] = None, end: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    Filter on created_at from start (inclusive) to end (exclusive)
+
+    created_at is stored as an ISO string, so the bounds are compared as
+    ISO strings too; either bound may be left open.
+    """
+    bounds = {}
+    if start is not None:
+        bounds["$gte"] = start.isoformat()
+    if end is not None:
+        bounds["$lt"] = end.isoformat()
+    return {"created_at": bounds} if bounds else {}
+
+
+def created_at_match(
+    start: Optional[datetime] = None, end: Optional[datetime] = None
+) -> List[Dict[str, Any]]:
+    """Leading $match stage of a pipeline limited to a time range, if any"""
+    window = created_at_range(start, end)
+    return [{"$match": window}] if window else []
+
+
+def created_at_bucket(unit: str, bin_size: int = 1) -> Dict[str, Any]:
+    """
+    $dateTrunc expression of the time bucket holding a document's created_at
+
+    created_at is an ISO string; its first 19 characters (to the second,
+    without fraction or offset) are parsed as a date, so bucket starts come
+    back as naive datetimes on the same clock as the stored strings.
+    Requires MongoDB 5.0 or later.
+    """
+    return {
+        "$dateTrunc": {
+            "date": {
+                "$dateFromString": {
+                    "dateString": {"$substrBytes": ["$created_at", 0, 19]}
+                }
+            },
+            "unit": unit,
+            "binSize": bin_size,
+        }
+    }
+
+
+def first_created_at(collection) -> Optional[datetime]:
+    """Earliest created_at of a collection, read through its created_at index"""
+    doc = collection.find_one({}, {"created_at": 1, "_id": 0}, sort=[("created_at", 1)])
+    if not doc or not doc.get("created_at"):
+        return None
+    # Same precision and clock as created_at_bucket
+    return datetime.fromisoformat(doc["created_at"][:19])
+
+
+def text_search(text: str) -> Dict[str, Any]:
+    """
+    $text filter matching documents that contain every word of the text
+
+    Each word is searched as a quoted phrase, which makes the words required
+    instead of alternatives. With the "none" language of the text indexes,
+    words match whole tokens, without stemming or stop words.
+    """
+    words = text.replace('"', " ").split()
+    return {"$text": {"$search": " ".join(f'"{word}"' for word in words)}}
+
+
+def find_fields(
+    collection,
+    query: Dict[str, Any],
+    fields: Iterable[str],
+    batch_size: int = READ_BATCH_SIZE,
+    codec_options: CodecOptions = DEFAULT_CODEC_OPTIONS,
+    sort: Optional[List[Tuple[str, int]]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the given fields of the documents matching a query
+
+    For reads returning many documents. The projection keeps the server
+    from sending anything else (no ObjectId per document), and each batch
+    arrives as raw BSON that is decoded in one bson.decode_all call instead
+    of document by document through the cursor.
+
+    Args:
+        collection: pymongo Collection
+        query: Filter
+        fields: Fields the caller reads
+        batch_size: Documents per server round trip
+        codec_options: How documents are decoded
+        sort: Optional (field, direction) pairs; a sort no index covers
+            may spill to disk on the server
+
+    Yields:
+        One document per match, holding at most the given fields
+    """
+    cursor = collection.find_raw_batches(
+        query, field_projection(fields), batch_size=batch_size
+    )
+    if sort:
+        cursor = cursor.sort(sort).allow_disk_use(True)
+    for batch in cursor:
+        yield from bson.decode_all(batch, codec_options)
@@ -0,0 +1,151 @@
+"""
+Integer codes for the categorical fields of police_data.
+
+With the compact schema (POLICE_DATA_COMPACT=true) police_type, state,
+action, movement_type and source_type are stored as small integers instead
+of repeated strings. The codes come from the Unified* enums and are kept in
+the code_tables collection, so every process reads and writes the same
+mapping. The code of a value is its position in the field's list of
+values, and the lists are append-only: values added to an enum later get
+the next free code and existing codes never change, so stored documents
+stay valid.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+from pymongo.errors import DuplicateKeyError
+
+CODE_TABLES_COLLECTION = "code_tables"
+
+
+def default_field_values() -> Dict[str, List[str]]:
+    """Values of each coded field, in the order codes are assigned"""
+    from services.police.police_data_mongo_service import (
+        UnifiedMovementType,
+        UnifiedPoliceAction,
+        UnifiedPoliceState,
+        UnifiedPoliceType,
+    )
+
+    return {
+        "police_type": [member.value for member in UnifiedPoliceType],
+        "state": [member.value for member in UnifiedPoliceState],
+        "action": [member.value for member in UnifiedPoliceAction],
+        "movement_type": [member.value for member in UnifiedMovementType],
+        "source_type": ["movement", "registration", ""],
+    }
+
+
+class CodeTable:
+    """
+    Two-way mapping between field values and their integer codes
+
+    Values without a code (and every value of an empty table) pass through
+    unchanged in both directions, so an empty table is the identity used
+    when the compact schema is off.
+    """
+
+    def __init__(self, field_values: Optional[Dict[str, List[str]]] = None):
+        self.field_values = field_values or {}
+        self.codes = {
+            field: {value: code for code, value in enumerate(values)}
+            for field, values in self.field_values.items()
+        }
+        self.values = {
+            field: dict(enumerate(values))
+            for field, values in self.field_values.items()
+        }
+
+    def __bool__(self) -> bool:
+        return bool(self.codes)
+
+    def encode(self, field: str, value: Any) -> Any:
+        mapping = self.codes.get(field)
+        if mapping is None:
+            return value
+        return mapping.get(value, value)
+
+    def decode(self, field: str, value: Any) -> Any:
+        mapping = self.values.get(field)
+        if mapping is None:
+            return value
+        return mapping.get(value, value)
+
+    def encode_values(self, field: str, values: Iterable[Any]) -> List[Any]:
+        return [self.encode(field, value) for value in values]
+
+    def encode_document(self, doc: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of a document with its coded fields encoded"""
+        if not self.codes:
+            return doc
+        encoded = dict(doc)
+        for field, mapping in self.codes.items():
+            if field in encoded:
+                encoded[field] = mapping.get(encoded[field], encoded[field])
+        return encoded
+
+    def decode_document(self, doc: Dict[str, Any]) -> Dict[str, Any]:
+        """Decode the coded fields of a document in place and return it"""
+        for field, mapping in self.values.items():
+            if field in doc:
+                doc[field] = mapping.get(doc[field], doc[field])
+        return doc
+
+
+def merge_values(
+    stored: Dict[str, List[str]], field_values: Dict[str, List[str]]
+) -> Dict[str, List[str]]:
+    """Stored value lists with new values appended"""
+    merged = {field: list(values) for field, values in stored.items()}
+    for field, values in field_values.items():
+        known = merged.setdefault(field, [])
+        known.extend(value for value in values if value not in known)
+    return merged
+
+
+def load_code_table(
+    mongo_db,
+    name: str,
+    field_values: Optional[Dict[str, List[str]]] = None,
+    max_attempts: int = 5,
+) -> CodeTable:
+    """
+    Read the code table of a collection, adding codes for new enum values
+
+    The table document carries a revision, and new codes are only written
+    if nobody else changed the table in between. Otherwise it is read again,
+    so concurrent writers cannot hand out the same code twice.
+    """
+    if field_values is None:
+        field_values = default_field_values()
+    collection = mongo_db[CODE_TABLES_COLLECTION]
+    for _ in range(max_attempts):
+        doc = collection.find_one({"_id": name})
+        stored = doc["fields"] if doc else {}
+        merged = merge_values(stored, field_values)
+        if merged == stored:
+            return CodeTable(merged)
+        if doc is None:
+            try:
+                collection.insert_one({"_id": name, "fields": merged, "revision": 1})
+            except DuplicateKeyError:
+                # Another process created the table first
+                continue
+            return CodeTable(merged)
+        result = collection.update_one(
+            {"_id": name, "revision": doc["revision"]},
+            {"$set": {"fields": merged, "revision": doc["revision"] + 1}},
+        )
+        if result.modified_count:
+            return CodeTable(merged)
+    raise RuntimeError(f"Could not update the code table of {name}")
+
+
+_code_tables: Dict[str, CodeTable] = {}
+
+
+def get_code_table(mongo_db, name: str) -> CodeTable:
+    """Process-wide cached code table; codes never change once assigned"""
+    table = _code_tables.get(name)
+    if table is None:
+        table = _code_tables[name] = load_code_table(mongo_db, name)
+    return table
@@ -1,7 +1,19 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 from datetime import datetime, date
+from bson.raw_bson import RawBSONDocument
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel, ReplaceOne
 from database_manager import DatabaseManager
-from dataclasses import dataclass, asdict
+from services.mongo_indexes import ensure_collection_indexes
+from services.mongo_reads import (
+    created_at_bucket,
+    created_at_match,
+    created_at_range,
+    find_fields,
+    text_search,
+)
+from services.police.police_codes import CodeTable, get_code_table
+from settings import settings
+from dataclasses import dataclass
 from enum import Enum
 
 
@@ -83,7 +95,17 @@ class UnifiedMovementType(Enum):
     EMPTY = ""
 
 
-@dataclass
+def _isoformat(value):
+    """ISO string for a datetime; anything else is stored as is"""
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _isoformat_date(value):
+    """ISO string for a date or datetime; anything else is stored as is"""
+    return value.isoformat() if isinstance(value, date) else value
+
+
+@dataclass(slots=True)
 class UnifiedPoliceData:
     """
     Unified police data model for MongoDB storage
@@ -120,25 +142,24 @@ class UnifiedPoliceData:
 
     def to_mongo_dict(self) -> Dict[str, Any]:
         """Convert to MongoDB document format"""
-        doc = asdict(self)
-
-        # Convert enums to values
-        doc["action"] = self.action.value
-        doc["state"] = self.state.value
-        doc["movement_type"] = self.movement_type.value
-        doc["police_type"] = self.police_type.value
-
-        # Handle datetime objects for MongoDB
-        if isinstance(doc["created_at"], datetime):
-            doc["created_at"] = doc["created_at"].isoformat()
-        if isinstance(doc["updated_at"], datetime):
-            doc["updated_at"] = doc["updated_at"].isoformat()
-        if doc.get("expiration_date") and isinstance(doc["expiration_date"], date):
-            doc["expiration_date"] = doc["expiration_date"].isoformat()
-        if doc.get("last_sent_date") and isinstance(doc["last_sent_date"], datetime):
-            doc["last_sent_date"] = doc["last_sent_date"].isoformat()
-
-        return doc
+        return {
+            "id": self.id,
+            "created_at": _isoformat(self.created_at),
+            "updated_at": _isoformat(self.updated_at),
+            "action": self.action.value,
+            "state": self.state.value,
+            "movement_type": self.movement_type.value,
+            "police_type": self.police_type.value,
+            "data": self.data,
+            "reason": self.reason,
+            "source_type": self.source_type,
+            "reservation_id": self.reservation_id,
+            "expiration_date": _isoformat_date(self.expiration_date),
+            "last_sent_date": _isoformat(self.last_sent_date),
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "vr_sheet_number": self.vr_sheet_number,
+        }
 
     @classmethod
     def from_mongo_dict(cls, doc: Dict[str, Any]) -> "UnifiedPoliceData":
@@ -167,15 +188,72 @@ class UnifiedPoliceData:
 class PoliceDataMongoService:
     """Service for storing unified police data in MongoDB"""
 
-    def __init__(self, db_manager: DatabaseManager):
+    # Indexes matching the query shapes used by the sync and the dashboards
+    INDEXES = [
+        # Upserts by id during sync
+        IndexModel([("id", ASCENDING)], unique=True),
+        # Per-type recent records and reason counts, newest first
+        IndexModel(
+            [
+                ("police_type", ASCENDING),
+                ("state", ASCENDING),
+                ("created_at", DESCENDING),
+            ]
+        ),
+        # Movement / registration counts, over all time or a time window
+        IndexModel([("source_type", ASCENDING), ("created_at", DESCENDING)]),
+        IndexModel([("created_at", DESCENDING)]),
+        # Reason search; whole words, no stemming
+        IndexModel([("reason", TEXT)], default_language="none"),
+    ]
+
+    # Fields of an exported record, in column order; the raw data payload
+    # (guest details) is never exported
+    EXPORT_FIELDS = (
+        "id",
+        "created_at",
+        "updated_at",
+        "police_type",
+        "state",
+        "action",
+        "movement_type",
+        "source_type",
+        "reason",
+        "reservation_id",
+        "expiration_date",
+        "last_sent_date",
+        "start_date",
+        "end_date",
+        "vr_sheet_number",
+    )
+
+    def __init__(self, db_manager: DatabaseManager, compact: Optional[bool] = None):
         self.db_manager = db_manager
         self.collection_name = "police_data"
+        # Store the categorical fields as integer codes (see police_codes)
+        self.compact = settings.POLICE_DATA_COMPACT if compact is None else compact
+        self._codes: Optional[CodeTable] = None
+
+    @property
+    def codes(self) -> CodeTable:
+        """Code table of the collection; empty (identity) unless compact"""
+        if self._codes is None:
+            self._codes = (
+                get_code_table(self.db_manager.mongo, self.collection_name)
+                if self.compact
+                else CodeTable()
+            )
+        return self._codes
 
     def _get_collection(self):
         """Get MongoDB collection"""
         mongo_db = self.db_manager.mongo
         return mongo_db[self.collection_name]
 
+    def ensure_indexes(self) -> Dict[str, Any]:
+        """Create missing indexes and report unused ones"""
+        return ensure_collection_indexes(self._get_collection(), self.INDEXES)
+
     def store_police_movement(self, movement) -> str:
         """
         Store police movement data in unified format
@@ -186,8 +264,49 @@ class PoliceDataMongoService:
         Returns:
             MongoDB document ID
         """
+        collection = self._get_collection()
+        doc = self.codes.encode_document(self.movement_to_document(movement))
+        result = collection.replace_one({"id": doc["id"]}, doc, upsert=True)
+        return str(result.upserted_id if result.upserted_id else doc["id"])
+
+    def movement_to_document(self, movement) -> Dict[str, Any]:
+        """
+        Map a police movement to a unified MongoDB document
+
+        Args:
+            movement: PoliceMovement instance
+
+        Returns:
+            Document ready to be stored; the same as
+            movement_to_unified(movement).to_mongo_dict(), built directly
+        """
+        return {
+            "id": str(movement.id),
+            "created_at": _isoformat(movement.created_at),
+            "updated_at": _isoformat(movement.updated_at),
+            "action": self._map_movement_action(movement.action.value).value,
+            "state": self._map_movement_state(movement.state.value).value,
+            "movement_type": self._map_movement_type(
+                movement.movement_type.value
+            ).value,
+            "police_type": self._map_vendor_to_police_type(movement.vendor.value).value,
+            "data": movement.data,
+            "reason": movement.reason,
+            "source_type": "movement",
+            "reservation_id": (
+                str(movement.reservation_id) if movement.reservation_id else None
+            ),
+            "expiration_date": _isoformat_date(movement.expiration_date),
+            "last_sent_date": _isoformat(movement.last_sent_date),
+            "start_date": None,
+            "end_date": None,
+            "vr_sheet_number": "",
+        }
+
+    def movement_to_unified(self, movement) -> UnifiedPoliceData:
+        """Map a police movement to the unified schema"""
         # Map movement fields to unified schema
-        unified_data = UnifiedPoliceData(
+        return UnifiedPoliceData(
             id=str(movement.id),
             created_at=movement.created_at,
             updated_at=movement.updated_at,
@@ -205,23 +324,60 @@ class PoliceDataMongoService:
             last_sent_date=movement.last_sent_date,
         )
 
+    def store_police_registration(self, registration) -> str:
+        """
+        Store police registration data in unified format
+
+        Args:
+            registration: PoliceRegistration instance
+
+        Returns:
+            MongoDB document ID
+        """
         collection = self._get_collection()
-        doc = unified_data.to_mongo_dict()
+        doc = self.codes.encode_document(self.registration_to_document(registration))
         result = collection.replace_one({"id": doc["id"]}, doc, upsert=True)
         return str(result.upserted_id if result.upserted_id else doc["id"])
 
-    def store_police_registration(self, registration) -> str:
+    def registration_to_document(self, registration) -> Dict[str, Any]:
         """
-        Store police registration data in unified format
+        Map a police registration to a unified MongoDB document
 
         Args:
             registration: PoliceRegistration instance
 
         Returns:
-            MongoDB document ID
+            Document ready to be stored; the same as
+            registration_to_unified(registration).to_mongo_dict(), built
+            directly
         """
+        return {
+            "id": str(registration.id),
+            "created_at": _isoformat(registration.created_at),
+            "updated_at": _isoformat(registration.updated_at),
+            "action": UnifiedPoliceAction.REGISTRATION.value,
+            "state": self._map_registration_state(registration.status.value).value,
+            "movement_type": UnifiedMovementType.REGISTRATION.value,
+            "police_type": (
+                self._map_police_type(registration.police_type.value).value
+                if registration.police_type
+                else UnifiedPoliceType.POL.value
+            ),
+            "data": "",
+            "reason": registration.status_details,
+            "source_type": "registration",
+            "reservation_id": str(registration.reservation_id),
+            "expiration_date": None,
+            "last_sent_date": None,
+            "start_date": registration.start_date,
+            "end_date": registration.end_date,
+            "vr_sheet_number": registration.vr_sheet_number,
+        }
+
+    def registration_to_unified(self, registration) -> UnifiedPoliceData:
+        """Map a police registration to the unified schema"""
         # Map registration fields to unified schema
-        unified_data = UnifiedPoliceData(
+        return UnifiedPoliceData(
             id=str(registration.id),
             created_at=registration.created_at,
             updated_at=registration.updated_at,
@@ -242,35 +398,97 @@ class PoliceDataMongoService:
             vr_sheet_number=registration.vr_sheet_number,
         )
 
+    def store_documents(self, docs: List[Dict[str, Any]]) -> int:
+        """
+        Upsert a batch of unified documents by id in one bulk write
+
+        Args:
+            docs: Documents built by movement_to_document or
+                registration_to_document
+
+        Returns:
+            Number of documents inserted or replaced
+
+        Raises:
+            BulkWriteError: If some documents failed; the others are written
+        """
+        if not docs:
+            return 0
         collection = self._get_collection()
-        doc = unified_data.to_mongo_dict()
-        result = collection.replace_one({"id": doc["id"]}, doc, upsert=True)
-        return str(result.upserted_id if result.upserted_id else doc["id"])
+        encode = self.codes.encode_document
+        result = collection.bulk_write(
+            [ReplaceOne({"id": doc["id"]}, encode(doc), upsert=True) for doc in docs],
+            ordered=False,
+        )
+        return result.matched_count + result.upserted_count
+
+    def store_encoded_documents(self, docs: List[Tuple[Any, RawBSONDocument]]) -> int:
+        """
+        Upsert a batch of documents already encoded to BSON
 
-    def get_statistics(self) -> Dict[str, Any]:
-        """Get optimized statistics about police data using aggregation."""
+        Args:
+            docs: (id, document) pairs from the sync's transform workers, already
+                integer-coded if the compact schema is on
+
+        Returns:
+            Number of documents inserted or replaced
+
+        Raises:
+            BulkWriteError: If some documents failed; the others are written
+        """
+        if not docs:
+            return 0
         collection = self._get_collection()
+        result = collection.bulk_write(
+            [ReplaceOne({"id": doc_id}, doc, upsert=True) for doc_id, doc in docs],
+            ordered=False,
+        )
+        return result.matched_count + result.upserted_count
+
+    def get_statistics(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Get optimized statistics about police data using aggregation.
+
+        start and end limit every count to a created_at range; without them
+        the whole collection is counted.
+        """
+        collection = self._get_collection()
+        codes = self.codes
+        window = created_at_range(start, end)
 
         # Basic counts
-        total_count = collection.count_documents({})
-        movement_count = collection.count_documents({"source_type": "movement"})
-        registration_count = collection.count_documents({"source_type": "registration"})
+        total_count = collection.count_documents(window)
+        movement_count = collection.count_documents(
+            {**window, "source_type": codes.encode("source_type", "movement")}
+        )
+        registration_count = collection.count_documents(
+            {**window, "source_type": codes.encode("source_type", "registration")}
+        )
 
         # Optimized aggregation for state distribution
         state_pipeline = [
+            *created_at_match(start, end),
             {"$group": {"_id": "$state", "count": {"$sum": 1}}},
             {"$sort": {"count": -1}},
         ]
         state_results = list(collection.aggregate(state_pipeline))
-        state_distribution = {item["_id"]: item["count"] for item in state_results}
+        state_distribution = {
+            codes.decode("state", item["_id"]): item["count"] for item in state_results
+        }
 
         # Optimized aggregation for police type distribution
         type_pipeline = [
+            *created_at_match(start, end),
             {"$group": {"_id": "$police_type", "count": {"$sum": 1}}},
             {"$sort": {"count": -1}},
         ]
         type_results = list(collection.aggregate(type_pipeline))
-        police_type_distribution = {item["_id"]: item["count"] for item in type_results}
+        police_type_distribution = {
+            codes.decode("police_type", item["_id"]): item["count"]
+            for item in type_results
+        }
 
         return {
             "total_records": total_count,
@@ -280,6 +498,303 @@ class PoliceDataMongoService:
             "police_type_distribution": police_type_distribution,
         }
 
+    def get_recent_records(
+        self,
+        police_type: str,
+        limit: int = 10,
+        excluded_states: Optional[list] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> list:
+        """
+        Get the most recent records (state, reason, created_at) for a police type
+
+        Args:
+            police_type: Unified police type value
+            limit: Maximum number of records to return
+            excluded_states: States left out of the listing
+            start: Earliest created_at (inclusive)
+            end: Latest created_at (exclusive)
+
+        Returns:
+            List of documents sorted by created_at descending
+        """
+        if excluded_states is None:
+            excluded_states = ["NEW", "SCHEDULED", "CANCELED"]
+        collection = self._get_collection()
+        codes = self.codes
+        query = self.records_filter(police_type, start=start, end=end)
+        query["state"] = {"$nin": codes.encode_values("state", excluded_states)}
+        cursor = (
+            collection.find(
+                query,
+                {"state": 1, "reason": 1, "created_at": 1, "_id": 0},
+            )
+            .sort("created_at", -1)
+            .limit(limit)
+        )
+        return [codes.decode_document(doc) for doc in cursor]
+
+    def get_reason_counts(
+        self,
+        police_type: str,
+        state: str,
+        skip: int = 0,
+        limit: int = 5,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get one page of reason counts for a police type and state
+
+        Reasons are grouped over every matching document in a single
+        aggregation; $facet returns the requested page together with the
+        totals, so counts stay exact however many documents match.
+
+        Args:
+            police_type: Unified police type value
+            state: Unified state value
+            skip: Number of distinct reasons to skip
+            limit: Maximum number of reasons to return
+            start: Earliest created_at (inclusive)
+            end: Latest created_at (exclusive)
+
+        Returns:
+            Dict with "reasons" ([{"reason", "count"}] sorted by count
+            descending), "total_reasons" (distinct reasons) and
+            "total_records" (documents with a reason)
+        """
+        collection = self._get_collection()
+        pipeline = [
+            {
+                "$match": {
+                    **self.records_filter(police_type, state, start, end),
+                    "reason": {"$exists": True, "$nin": [None, ""]},
+                }
+            },
+            {"$group": {"_id": "$reason", "count": {"$sum": 1}}},
+            {
+                "$facet": {
+                    "page": [
+                        {"$sort": {"count": -1, "_id": 1}},
+                        {"$skip": skip},
+                        {"$limit": limit},
+                        {"$project": {"_id": 0, "reason": "$_id", "count": 1}},
+                    ],
+                    "totals": [
+                        {
+                            "$group": {
+                                "_id": None,
+                                "total_reasons": {"$sum": 1},
+                                "total_records": {"$sum": "$count"},
+                            }
+                        }
+                    ],
+                }
+            },
+        ]
+        result = next(collection.aggregate(pipeline), {"page": [], "totals": []})
+        totals = result["totals"][0] if result["totals"] else {}
+        return {
+            "reasons": result["page"],
+            "total_reasons": totals.get("total_reasons", 0),
+            "total_records": totals.get("total_records", 0),
+        }
+
+    def get_state_buckets(
+        self,
+        police_type: str,
+        unit: str,
+        bin_size: int = 1,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        error_states: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Count the records of a police type per time bucket and state
+
+        Records in an error state are also split by reason, so that
+        expected errors can be told apart from the counts alone.
+
+        Args:
+            police_type: Unified police type value
+            unit: $dateTrunc unit of the buckets ("minute", "hour", "day", ...)
+            bin_size: Units per bucket
+            start: Earliest created_at (inclusive)
+            end: Latest created_at (exclusive)
+            error_states: States whose reasons are kept
+
+        Returns:
+            List of {"bucket", "state", "reason", "count"} sorted by bucket;
+            bucket is the bucket's start and reason is None outside
+            error_states
+        """
+        codes = self.codes
+        encoded_errors = codes.encode_values("state", error_states or [])
+        pipeline = [
+            {"$match": self.records_filter(police_type, start=start, end=end)},
+            {
+                "$group": {
+                    "_id": {
+                        "bucket": created_at_bucket(unit, bin_size),
+                        "state": "$state",
+                        "reason": {
+                            "$cond": [
+                                {"$in": ["$state", encoded_errors]},
+                                "$reason",
+                                None,
+                            ]
+                        },
+                    },
+                    "count": {"$sum": 1},
+                }
+            },
+            {"$sort": {"_id.bucket": 1}},
+        ]
+        return [
+            {
+                "bucket": item["_id"]["bucket"],
+                "state": codes.decode("state", item["_id"].get("state")),
+                "reason": item["_id"].get("reason"),
+                "count": item["count"],
+            }
+            for item in self._get_collection().aggregate(pipeline)
+        ]
+
+    def search_reasons(
+        self,
+        text: str,
+        police_type: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> Dict[str, Any]:
+        """
+        Find the records whose reason contains every word of a text
+
+        The words are looked up in the reason text index, and $facet returns
+        the requested page of records together with the match counts of
+        every police type.
+
+        Args:
+            text: Words to search for
+            police_type: Unified police type the page is restricted to
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            Dict with "records" (id, police_type, state, reason, created_at;
+            newest first), "total" (records of the police type, or of all
+            types) and "counts" ([{"police_type", "count"}] sorted by count
+            descending)
+        """
+        if not text.strip():
+            return {"records": [], "total": 0, "counts": []}
+        codes = self.codes
+        page = [
+            {"$sort": {"created_at": -1}},
+            {"$skip": skip},
+            {"$limit": limit},
+            {
+                "$project": {
+                    "_id": 0,
+                    "id": 1,
+                    "police_type": 1,
+                    "state": 1,
+                    "reason": 1,
+                    "created_at": 1,
+                }
+            },
+        ]
+        if police_type:
+            page.insert(
+                0, {"$match": {"police_type": codes.encode("police_type", police_type)}}
+            )
+        pipeline = [
+            {"$match": text_search(text)},
+            {
+                "$facet": {
+                    "page": page,
+                    "counts": [
+                        {"$group": {"_id": "$police_type", "count": {"$sum": 1}}},
+                        {"$sort": {"count": -1, "_id": 1}},
+                    ],
+                }
+            },
+        ]
+        collection = self._get_collection()
+        result = next(collection.aggregate(pipeline), {"page": [], "counts": []})
+        counts = [
+            {
+                "police_type": codes.decode("police_type", item["_id"]),
+                "count": item["count"],
+            }
+            for item in result["counts"]
+        ]
+        total = sum(
+            item["count"]
+            for item in counts
+            if not police_type or item["police_type"] == police_type
+        )
+        return {
+            "records": [codes.decode_document(doc) for doc in result["page"]],
+            "total": total,
+            "counts": counts,
+        }
+
+    def records_filter(
+        self,
+        police_type: Optional[str] = None,
+        state: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """
+        Query matching the records of a police type and state in a time range
+
+        Every argument is optional; values are encoded for the compact schema.
+        """
+        query = created_at_range(start, end)
+        if police_type:
+            query["police_type"] = self.codes.encode("police_type", police_type)
+        if state:
+            query["state"] = self.codes.encode("state", state)
+        return query
+
+    def iter_records(
+        self,
+        police_type: Optional[str] = None,
+        state: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the matching records, newest first, one cursor batch at a time
+
+        Args:
+            police_type: Unified police type value
+            state: Unified state value
+            start: Earliest created_at (inclusive)
+            end: Latest created_at (exclusive)
+            batch_size: Documents per server round trip
+
+        Yields:
+            Decoded documents holding the EXPORT_FIELDS
+        """
+        codes = self.codes
+        docs = find_fields(
+            self._get_collection(),
+            self.records_filter(police_type, state, start, end),
+            self.EXPORT_FIELDS,
+            batch_size=batch_size,
+            sort=[("created_at", DESCENDING)],
+        )
+        if not codes:
+            yield from docs
+            return
+        for doc in docs:
+            yield codes.decode_document(doc)
+
     # Mapping methods
     def _map_movement_action(self, action: str) -> UnifiedPoliceAction:
         """Map movement action to unified action"""
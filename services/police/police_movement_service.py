@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import date
 from uuid import UUID
 from database_manager import DatabaseManager
@@ -86,6 +86,15 @@ class PoliceMovementService:
         self, start_date: date, end_date: date
     ) -> List[PoliceMovement]:
         """Get police movements within date range"""
+        return [
+            PoliceMovement.from_db_row(row)
+            for row in self.get_movement_rows_by_date_range(start_date, end_date)
+        ]
+
+    def get_movement_rows_by_date_range(
+        self, start_date: date, end_date: date
+    ) -> List[Dict[str, Any]]:
+        """Raw movements_policemovement rows within date range, as dicts"""
         query = """
         SELECT * FROM movements_policemovement 
         WHERE DATE(created_at) BETWEEN %s AND %s 
@@ -98,4 +107,4 @@ class PoliceMovementService:
             rows = cur.fetchall()
             columns = [desc[0] for desc in cur.description]
 
-        return [PoliceMovement.from_db_row(dict(zip(columns, row))) for row in rows]
+        return [dict(zip(columns, row)) for row in rows]
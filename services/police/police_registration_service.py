@@ -1,4 +1,4 @@
-from typing import List
+from typing import Any, Dict, List
 from datetime import date
 from database_manager import DatabaseManager
 from models.police_registration import (
@@ -16,6 +16,15 @@ class PoliceRegistrationService:
         self, start_date: date, end_date: date
     ) -> List[PoliceRegistration]:
         """Get police registrations within date range based on created_at"""
+        return [
+            PoliceRegistration.from_db_row(row)
+            for row in self.get_registration_rows_by_date_range(start_date, end_date)
+        ]
+
+    def get_registration_rows_by_date_range(
+        self, start_date: date, end_date: date
+    ) -> List[Dict[str, Any]]:
+        """Raw registration rows within date range, as dicts"""
         query = """
         SELECT pgr.*,
                COALESCE(prt.task_data->'housing'->'police_account'->>'type', NULL) as police_type,
@@ -33,4 +42,4 @@ class PoliceRegistrationService:
             rows = cur.fetchall()
             columns = [desc[0] for desc in cur.description]
 
-        return [PoliceRegistration.from_db_row(dict(zip(columns, row))) for row in rows]
+        return [dict(zip(columns, row)) for row in rows]
@@ -0,0 +1,89 @@
+"""
+CSV and NDJSON encoding of streamed records for the export endpoints.
+
+The encoders consume documents as the cursor yields them and emit one text
+chunk per batch of rows, so an export holds a single batch in memory
+however many records match.
+"""
+
+import csv
+import io
+import json
+from datetime import date
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, Sequence
+
+EXPORT_BATCH_SIZE = 1000
+EXPORT_MEDIA_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def _batches(docs: Iterable[Dict[str, Any]], batch_size: int) -> Iterator[list]:
+    docs = iter(docs)
+    while batch := list(islice(docs, batch_size)):
+        yield batch
+
+
+def iter_csv(
+    docs: Iterable[Dict[str, Any]],
+    fields: Sequence[str],
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> Iterator[str]:
+    """
+    CSV text of the documents, header first
+
+    Args:
+        docs: Documents to write; missing fields are left empty
+        fields: Columns, in order
+        batch_size: Rows per yielded chunk
+
+    Yields:
+        The header line, then one chunk of lines per batch of documents
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    yield buffer.getvalue()
+    for batch in _batches(docs, batch_size):
+        buffer.seek(0)
+        buffer.truncate()
+        for doc in batch:
+            writer.writerow(
+                [
+                    value.isoformat() if isinstance(value, date) else value
+                    for value in (doc.get(field) for field in fields)
+                ]
+            )
+        yield buffer.getvalue()
+
+
+def iter_ndjson(
+    docs: Iterable[Dict[str, Any]], batch_size: int = EXPORT_BATCH_SIZE
+) -> Iterator[str]:
+    """
+    Newline-delimited JSON of the documents
+
+    Yields:
+        One chunk of lines per batch of documents
+    """
+    for batch in _batches(docs, batch_size):
+        yield "".join(json.dumps(doc, default=_json_default) + "\n" for doc in batch)
+
+
+def iter_export(
+    docs: Iterable[Dict[str, Any]],
+    fields: Sequence[str],
+    export_format: str,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> Iterator[str]:
+    """Documents encoded in one of EXPORT_MEDIA_TYPES"""
+    if export_format == "csv":
+        return iter_csv(docs, fields, batch_size)
+    if export_format == "ndjson":
+        return iter_ndjson(docs, batch_size)
+    raise ValueError(f"Unsupported export format: {export_format}")
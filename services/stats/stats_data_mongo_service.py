@@ -1,12 +1,67 @@
 from dataclasses import dataclass
 from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from bson.raw_bson import RawBSONDocument
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel, ReplaceOne
 from database_manager import DatabaseManager
+from services.mongo_indexes import ensure_collection_indexes
+from services.mongo_reads import (
+    created_at_bucket,
+    created_at_match,
+    created_at_range,
+    find_fields,
+    text_search,
+)
 
 
 @dataclass
 class StatDataMongoService:
     """Service for storing stat data in MongoDB"""
 
+    # Indexes matching the query shapes used by the sync and the dashboards
+    INDEXES = [
+        # Upserts by id during sync; without it every upsert is a scan
+        IndexModel([("id", ASCENDING)], unique=True),
+        # Dashboard totals over a time window
+        IndexModel([("created_at", DESCENDING)]),
+        # Per-type distributions and recent records, newest first
+        IndexModel([("stat_type", ASCENDING), ("created_at", DESCENDING)]),
+        # Per-type reasons for a check-in / check-out state
+        IndexModel(
+            [
+                ("stat_type", ASCENDING),
+                ("status_check_in", ASCENDING),
+                ("created_at", DESCENDING),
+            ]
+        ),
+        IndexModel(
+            [
+                ("stat_type", ASCENDING),
+                ("status_check_out", ASCENDING),
+                ("created_at", DESCENDING),
+            ]
+        ),
+        # Reason search over both sides; whole words, no stemming
+        IndexModel(
+            [("status_check_in_details", TEXT), ("status_check_out_details", TEXT)],
+            default_language="none",
+        ),
+    ]
+
+    # Fields of an exported record, in column order
+    EXPORT_FIELDS = (
+        "id",
+        "created_at",
+        "updated_at",
+        "stat_type",
+        "status_check_in",
+        "status_check_out",
+        "status_check_in_details",
+        "status_check_out_details",
+        "reservation_id",
+    )
+
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
         self.collection_name = "stat_data"
@@ -16,6 +71,10 @@ class StatDataMongoService:
         mongo_db = self.db_manager.mongo
         return mongo_db[self.collection_name]
 
+    def ensure_indexes(self) -> Dict[str, Any]:
+        """Create missing indexes and report unused ones"""
+        return ensure_collection_indexes(self._get_collection(), self.INDEXES)
+
     def store_stat_data(self, stat_data) -> str:
         """
         Store stat data in MongoDB
@@ -31,24 +90,78 @@ class StatDataMongoService:
         result = collection.replace_one({"id": doc["id"]}, doc, upsert=True)
         return str(result.upserted_id if result.upserted_id else doc["id"])
 
-    def get_statistics(self):
+    def store_documents(self, docs: List[Dict[str, Any]]) -> int:
+        """
+        Upsert a batch of stat documents by id in one bulk write
+
+        Args:
+            docs: Documents built with StatRegistration.to_dict
+
+        Returns:
+            Number of documents inserted or replaced
+
+        Raises:
+            BulkWriteError: If some documents failed; the others are written
+        """
+        if not docs:
+            return 0
+        collection = self._get_collection()
+        result = collection.bulk_write(
+            [ReplaceOne({"id": doc["id"]}, doc, upsert=True) for doc in docs],
+            ordered=False,
+        )
+        return result.matched_count + result.upserted_count
+
+    def store_encoded_documents(self, docs: List[Tuple[Any, RawBSONDocument]]) -> int:
+        """
+        Upsert a batch of documents already encoded to BSON
+
+        Args:
+            docs: (id, document) pairs from the sync's transform workers;
+                the documents are written as they are
+
+        Returns:
+            Number of documents inserted or replaced
+
+        Raises:
+            BulkWriteError: If some documents failed; the others are written
+        """
+        if not docs:
+            return 0
+        collection = self._get_collection()
+        result = collection.bulk_write(
+            [ReplaceOne({"id": doc_id}, doc, upsert=True) for doc_id, doc in docs],
+            ordered=False,
+        )
+        return result.matched_count + result.upserted_count
+
+    def get_statistics(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ):
         """
         Get statistics from MongoDB
 
+        Args:
+            start: Earliest created_at (inclusive); None for no lower bound
+            end: Latest created_at (exclusive); None for no upper bound
+
         Returns:
             Dictionary with statistics
         """
         """Get optimized statistics about police data using aggregation."""
         collection = self._get_collection()
+        window_match = created_at_match(start, end)
 
         # Basic counts
-        total_count = collection.count_documents({})
+        total_count = collection.count_documents(created_at_range(start, end))
 
         status_check_in_pipeline = [
+            *window_match,
             {"$group": {"_id": "$status_check_in", "count": {"$sum": 1}}},
             {"$sort": {"count": -1}},
         ]
         status_check_out_pipeline = [
+            *window_match,
             {"$group": {"_id": "$status_check_out", "count": {"$sum": 1}}},
             {"$sort": {"count": -1}},
         ]
@@ -65,6 +178,7 @@ class StatDataMongoService:
         status_distribution = dict(result)
 
         type_pipeline = [
+            *window_match,
             {"$group": {"_id": "$stat_type", "count": {"$sum": 1}}},
             {"$sort": {"count": -1}},
         ]
@@ -82,3 +196,275 @@ class StatDataMongoService:
             "statistics_type_distribution": statistics_type_distribution,
             "stat_type_distribution": statistics_type_distribution,
         }
+
+    def get_state_distributions(
+        self,
+        stat_type: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Dict[str, List[Dict]]:
+        """
+        Get check-in and check-out state counts for a stat type in one pass
+
+        Args:
+            stat_type: Stat type value
+            start: Earliest created_at (inclusive)
+            end: Latest created_at (exclusive)
+
+        Returns:
+            Dictionary with "check_in" and "check_out" lists of
+            {"name": state, "value": count}, sorted by count descending
+        """
+        collection = self._get_collection()
+        pipeline = [
+            {"$match": self.records_filter(stat_type, start=start, end=end)},
+            {
+                "$facet": {
+                    "check_in": [
+                        {"$group": {"_id": "$status_check_in", "count": {"$sum": 1}}},
+                        {"$sort": {"count": -1}},
+                    ],
+                    "check_out": [
+                        {"$group": {"_id": "$status_check_out", "count": {"$sum": 1}}},
+                        {"$sort": {"count": -1}},
+                    ],
+                }
+            },
+        ]
+        result = next(collection.aggregate(pipeline), {})
+        return {
+            operation: [
+                {"name": item["_id"], "value": item["count"]}
+                for item in result.get(operation, [])
+                if item["count"] > 0
+            ]
+            for operation in ("check_in", "check_out")
+        }
+
+    def get_recent_records(
+        self,
+        stat_type: str,
+        limit: int = 10,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> List[Dict]:
+        """
+        Get the most recent records for a stat type
+
+        Args:
+            stat_type: Stat type value
+            limit: Maximum number of records to return
+            start: Earliest created_at (inclusive)
+            end: Latest created_at (exclusive)
+
+        Returns:
+            List of documents sorted by created_at descending
+        """
+        collection = self._get_collection()
+        return list(
+            collection.find(
+                self.records_filter(stat_type, start=start, end=end),
+                {
+                    "status_check_in": 1,
+                    "status_check_out": 1,
+                    "status_check_in_details": 1,
+                    "status_check_out_details": 1,
+                    "created_at": 1,
+                    "_id": 0,
+                },
+            )
+            .sort("created_at", -1)
+            .limit(limit)
+        )
+
+    def get_state_buckets(
+        self,
+        stat_type: str,
+        unit: str,
+        bin_size: int = 1,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        error_states: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Count the check-ins and check-outs of a stat type per time bucket and state
+
+        Each record counts once per side, like the dashboard totals. Sides
+        in an error state are also split by their details, so that expected
+        errors can be told apart from the counts alone.
+
+        Args:
+            stat_type: Stat type value
+            unit: $dateTrunc unit of the buckets ("minute", "hour", "day", ...)
+            bin_size: Units per bucket
+            start: Earliest created_at (inclusive)
+            end: Latest created_at (exclusive)
+            error_states: States whose details are kept
+
+        Returns:
+            List of {"bucket", "state", "reason", "count"} sorted by bucket;
+            bucket is the bucket's start and reason is None outside
+            error_states
+        """
+        error_states = error_states or []
+
+        def side(state_field: str, details_field: str) -> Dict[str, Any]:
+            return {
+                "state": f"${state_field}",
+                "reason": {
+                    "$cond": [
+                        {"$in": [f"${state_field}", error_states]},
+                        f"${details_field}",
+                        None,
+                    ]
+                },
+            }
+
+        pipeline = [
+            {"$match": self.records_filter(stat_type, start=start, end=end)},
+            {
+                "$project": {
+                    "bucket": created_at_bucket(unit, bin_size),
+                    "registrations": [
+                        side("status_check_in", "status_check_in_details"),
+                        side("status_check_out", "status_check_out_details"),
+                    ],
+                }
+            },
+            {"$unwind": "$registrations"},
+            {
+                "$group": {
+                    "_id": {
+                        "bucket": "$bucket",
+                        "state": "$registrations.state",
+                        "reason": "$registrations.reason",
+                    },
+                    "count": {"$sum": 1},
+                }
+            },
+            {"$sort": {"_id.bucket": 1}},
+        ]
+        return [
+            {
+                "bucket": item["_id"]["bucket"],
+                "state": item["_id"].get("state"),
+                "reason": item["_id"].get("reason"),
+                "count": item["count"],
+            }
+            for item in self._get_collection().aggregate(pipeline)
+        ]
+
+    def search_reasons(
+        self,
+        text: str,
+        stat_type: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> Dict[str, Any]:
+        """
+        Find the records whose check-in or check-out details contain every
+        word of a text
+
+        Args:
+            text: Words to search for
+            stat_type: Stat type the page is restricted to
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            Dict with "records" (newest first), "total" (records of the stat
+            type, or of all types) and "counts" ([{"stat_type", "count"}]
+            sorted by count descending)
+        """
+        if not text.strip():
+            return {"records": [], "total": 0, "counts": []}
+        page = [
+            {"$sort": {"created_at": -1}},
+            {"$skip": skip},
+            {"$limit": limit},
+            {"$project": {"_id": 0, **{field: 1 for field in self.EXPORT_FIELDS}}},
+        ]
+        if stat_type:
+            page.insert(0, {"$match": {"stat_type": stat_type}})
+        pipeline = [
+            {"$match": text_search(text)},
+            {
+                "$facet": {
+                    "page": page,
+                    "counts": [
+                        {"$group": {"_id": "$stat_type", "count": {"$sum": 1}}},
+                        {"$sort": {"count": -1, "_id": 1}},
+                    ],
+                }
+            },
+        ]
+        collection = self._get_collection()
+        result = next(collection.aggregate(pipeline), {"page": [], "counts": []})
+        counts = [
+            {"stat_type": item["_id"], "count": item["count"]}
+            for item in result["counts"]
+        ]
+        total = sum(
+            item["count"]
+            for item in counts
+            if not stat_type or item["stat_type"] == stat_type
+        )
+        return {"records": result["page"], "total": total, "counts": counts}
+
+    def records_filter(
+        self,
+        stat_type: Optional[str] = None,
+        state: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """
+        Query matching the records of a stat type and state in a time range
+
+        The state follows the dashboard's naming: CHECKIN_<state> and
+        CHECKOUT_<state> match one side, a bare state matches either side.
+        Every argument is optional.
+        """
+        query = created_at_range(start, end)
+        if stat_type:
+            query["stat_type"] = stat_type
+        if state:
+            if state.startswith("CHECKIN_"):
+                query["status_check_in"] = state[len("CHECKIN_") :]
+            elif state.startswith("CHECKOUT_"):
+                query["status_check_out"] = state[len("CHECKOUT_") :]
+            else:
+                query["$or"] = [
+                    {"status_check_in": state},
+                    {"status_check_out": state},
+                ]
+        return query
+
+    def iter_records(
+        self,
+        stat_type: Optional[str] = None,
+        state: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the matching records, newest first, one cursor batch at a time
+
+        Args:
+            stat_type: Stat type value
+            state: State as in records_filter
+            start: Earliest created_at (inclusive)
+            end: Latest created_at (exclusive)
+            batch_size: Documents per server round trip
+
+        Returns:
+            Iterator of documents holding the EXPORT_FIELDS
+        """
+        return find_fields(
+            self._get_collection(),
+            self.records_filter(stat_type, state, start, end),
+            self.EXPORT_FIELDS,
+            batch_size=batch_size,
+            sort=[("created_at", DESCENDING)],
+        )
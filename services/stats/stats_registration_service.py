@@ -1,5 +1,5 @@
 from database_manager import DatabaseManager  # Adjust the import path as needed
-from typing import List
+from typing import Any, Dict, List
 from datetime import date
 
 from models.stat_registration import StatRegistration
@@ -15,6 +15,15 @@ class StatRegistrationService:
         self, start_date: date, end_date: date
     ) -> List[StatRegistration]:
         """Get police registrations within date range based on created_at"""
+        return [
+            StatRegistration.from_db_row(row)
+            for row in self.get_registration_rows_by_date_range(start_date, end_date)
+        ]
+
+    def get_registration_rows_by_date_range(
+        self, start_date: date, end_date: date
+    ) -> List[Dict[str, Any]]:
+        """Raw stat registration rows within date range, as dicts"""
         query = """
         SELECT
             sr.id,
@@ -38,4 +47,4 @@ class StatRegistrationService:
             rows = cur.fetchall()
             columns = [desc[0] for desc in cur.description]
 
-        return [StatRegistration.from_db_row(dict(zip(columns, row))) for row in rows]
+        return [dict(zip(columns, row)) for row in rows]
@@ -24,6 +24,28 @@ class Settings:
     )
     MONGO_DATABASE: str = os.getenv("MONGO_DB", "legal_dashboard")
 
+    # Bearer token of the record export and search routes under /api/;
+    # while it is empty those routes refuse every request
+    DASHBOARD_API_TOKEN: str = os.getenv("DASHBOARD_API_TOKEN", "")
+
+    # Monitoring settings
+    # Mongo commands at or above this duration go to the slow-query log
+    MONGO_SLOW_QUERY_MS: float = float(os.getenv("MONGO_SLOW_QUERY_MS", "100"))
+
+    # Store the categorical fields of police_data as integer codes. Every
+    # process must agree; switching it needs a full (clearing) sync.
+    POLICE_DATA_COMPACT: bool = (
+        os.getenv("POLICE_DATA_COMPACT", "false").lower() == "true"
+    )
+
+    # Dashboard analytics: "mongo" runs aggregations, "numpy" answers from
+    # in-memory columns (needs the analytics extra)
+    ANALYTICS_ENGINE: str = os.getenv("ANALYTICS_ENGINE", "mongo")
+    # Hours of data the sync rewrites, re-read by an incremental refresh
+    ANALYTICS_REFRESH_HOURS: float = float(
+        os.getenv("ANALYTICS_REFRESH_HOURS", os.getenv("SYNC_HOURS", "24"))
+    )
+
     @classmethod
     def get_postgres_connection_string(cls) -> str:
         """Build PostgreSQL connection string."""
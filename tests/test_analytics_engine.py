@@ -0,0 +1,111 @@
+from collections import Counter
+
+import pytest
+
+pytest.importorskip("numpy")
+
+
+class FakeCursor(list):
+    def batch_size(self, size):
+        return self
+
+
+class FakeCollection:
+    def __init__(self, docs):
+        self.docs = docs
+        self.queries = []
+
+    def find(self, query, projection=None):
+        self.queries.append(query)
+        if not query:
+            return FakeCursor(self.docs)
+        created_at, newer = query["$or"]
+        cutoff = created_at["created_at"]["$gte"]
+        high_water = newer["_id"]["$gt"]
+        return FakeCursor(
+            doc
+            for doc in self.docs
+            if doc["created_at"] >= cutoff or doc["_id"] > high_water
+        )
+
+    def count_documents(self, query):
+        return len(self.docs)
+
+
+def police_documents(n, seed=7):
+    from bson import ObjectId
+    from benchmarks.synthetic import SyntheticData
+
+    return [
+        {"_id": ObjectId(), **doc}
+        for doc in SyntheticData(seed=seed).police_documents(n)
+    ]
+
+
+def test_police_summaries_match_the_aggregation_path():
+    from app.states.analytics_engine import (
+        CollectionLoader,
+        police_statistics,
+        police_table,
+        police_type_summaries,
+    )
+    from app.states.police.config import ERROR_STATES, SUCCESS_STATES
+    from app.states.success_rate_utils import (
+        calculate_police_success_rate,
+        success_rate_statuses,
+    )
+    from datetime import timedelta
+
+    docs = police_documents(3000)
+    loader = CollectionLoader(police_table, timedelta(hours=24), batch_size=500)
+    table = loader.refresh(FakeCollection(docs), version=1)
+
+    stats = police_statistics(table)
+    assert stats["total_records"] == 3000
+    assert stats["state_distribution"] == dict(Counter(d["state"] for d in docs))
+    assert stats["movements"] + stats["registrations"] == 3000
+
+    summaries = police_type_summaries(table, SUCCESS_STATES, ERROR_STATES)
+    for police_type in {doc["police_type"] for doc in docs}:
+        type_docs = [doc for doc in docs if doc["police_type"] == police_type]
+        states = Counter(doc["state"] for doc in type_docs)
+        success_count = sum(states[state] for state in SUCCESS_STATES)
+        expected_rate = calculate_police_success_rate(
+            success_count=success_count,
+            error_states=ERROR_STATES,
+            docs=type_docs,
+            police_type=police_type,
+        )
+        summary = summaries[police_type]
+        assert summary["states"] == dict(states)
+        assert summary["success_count"] == success_count
+        (result,) = success_rate_statuses(
+            [summary["success_count"]], [summary["error_count"]]
+        )
+        assert result.success_rate == pytest.approx(expected_rate)
+
+
+def test_refresh_reads_only_changed_data():
+    from app.states.analytics_engine import CollectionLoader, police_table
+    from datetime import timedelta
+
+    docs = police_documents(200)
+    collection = FakeCollection(docs)
+    loader = CollectionLoader(police_table, timedelta(hours=1))
+    loader.refresh(collection, version=1)
+
+    # Unchanged version: no query
+    loader.refresh(collection, version=1)
+    assert len(collection.queries) == 1
+
+    # New inserts are appended without a full reload
+    docs.extend(police_documents(50, seed=8))
+    table = loader.refresh(collection, version=2)
+    assert len(table) == 250
+    assert collection.queries[-1] != {}
+
+    # A clearing sync shrinks the collection: full reload
+    del docs[:100]
+    table = loader.refresh(collection, version=3)
+    assert len(table) == 150
+    assert collection.queries[-1] == {}
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+import time
+
+
+def test_concurrent_refreshes_share_one_computation():
+    from app.states.dashboard_cache import DashboardCache
+
+    cache = DashboardCache(ttl=60)
+    calls = []
+    lock = threading.Lock()
+
+    def compute():
+        with lock:
+            calls.append(1)
+        time.sleep(0.05)
+        return {"total_records": 42}
+
+    async def run():
+        return await asyncio.gather(
+            *[cache.refresh(("police_dashboard",), compute) for _ in range(10)]
+        )
+
+    entries = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert all(entry.value == {"total_records": 42} for entry in entries)
+    entry, fresh = cache.lookup(("police_dashboard",))
+    assert fresh and entry.value == {"total_records": 42}
+
+
+def test_expired_entries_are_recomputed():
+    from app.states.dashboard_cache import DashboardCache
+
+    cache = DashboardCache(ttl=60, stale_ttl=600)
+    cache.set(("police_dashboard",), "old")
+    cache._entries[("police_dashboard",)].timestamp -= 61
+
+    entry, fresh = cache.lookup(("police_dashboard",))
+    assert entry.value == "old" and not fresh
+
+    entry = asyncio.run(cache.refresh(("police_dashboard",), lambda: "new"))
+    assert entry.value == "new"
+    assert cache.lookup(("police_dashboard",)) == (entry, True)
+
+
+def test_failed_computation_is_not_cached():
+    from app.states.dashboard_cache import DashboardCache
+
+    cache = DashboardCache(ttl=60)
+
+    def fail():
+        raise RuntimeError("mongo down")
+
+    try:
+        asyncio.run(cache.refresh(("statistics_dashboard",), fail))
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("expected the computation error to propagate")
+
+    assert cache.lookup(("statistics_dashboard",)) == (None, False)
+    assert not cache._in_flight
+
+
+def test_stale_entries_are_served_until_refreshed():
+    from app.states.dashboard_cache import DashboardCache
+
+    cache = DashboardCache(ttl=60, stale_ttl=600)
+    cache.set(("police_dashboard",), "old")
+    cache._entries[("police_dashboard",)].timestamp -= 61
+
+    stale = cache.get_stale(("police_dashboard",))
+    assert stale.value == "old"
+    assert not cache.is_fresh(stale)
+
+    entry = asyncio.run(cache.refresh(("police_dashboard",), lambda: "new"))
+    assert cache.is_fresh(entry)
+    assert cache.lookup(("police_dashboard",))[0].value == "new"
+
+
+def test_entries_past_stale_ttl_are_evicted():
+    from app.states.dashboard_cache import DashboardCache
+
+    cache = DashboardCache(ttl=60, stale_ttl=600)
+    cache.set(("police_dashboard",), "old")
+    cache._entries[("police_dashboard",)].timestamp -= 601
+
+    assert cache.get_stale(("police_dashboard",)) is None
+
+
+def test_entries_from_an_older_data_version_are_stale():
+    from app.states.dashboard_cache import DashboardCache
+
+    cache = DashboardCache(ttl=3600, stale_ttl=7200)
+    cache.set(("police_dashboard",), "v1", version=1)
+
+    entry, fresh = cache.lookup(("police_dashboard",), version=1)
+    assert entry.value == "v1" and fresh
+    entry, fresh = cache.lookup(("police_dashboard",), version=2)
+    assert entry.value == "v1" and not fresh
+
+    entry = asyncio.run(cache.refresh(("police_dashboard",), lambda: "v2", version=2))
+    assert entry.value == "v2"
+    assert entry.version == 2
+    assert cache.lookup(("police_dashboard",), version=2) == (entry, True)
@@ -0,0 +1,23 @@
+def test_parse_distribution_override():
+    from benchmarks.generate import parse_distribution
+
+    assert parse_distribution("movement_states=SUCCESS:50,ERROR:30") == (
+        "movement_states",
+        {"SUCCESS": 50.0, "ERROR": 30.0},
+    )
+
+
+def test_generated_registration_rows_reference_their_parents():
+    from benchmarks.generate import POSTGRES_TABLES, registration_table_rows
+    from benchmarks.synthetic import SyntheticData
+
+    data = SyntheticData(
+        seed=1, distributions={"registration_police_types": {"SEF2": 1}}
+    )
+    for tables in registration_table_rows(data, 20):
+        (registration,) = tables["police_registrations"]
+        (guest,) = tables["police_guest_registrations"]
+        (task,) = tables["police_registration_tasks"]
+        assert len(guest) == len(POSTGRES_TABLES["police_guest_registrations"])
+        assert guest[1] == task[1] == registration[0]
+        assert '"type": "SEF2"' in task[3]
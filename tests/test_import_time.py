@@ -0,0 +1,49 @@
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Cumulative import time of app.app, best of a few runs. Measured at about
+# 0.8s on a single-CPU container; override for slower machines.
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "1500"))
+IMPORT_TIME_RUNS = 3
+
+# Backends the dashboard must not load at import time
+LAZY_MODULES = ("psycopg",)
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def import_times(module: str) -> dict:
+    """Cumulative import time in microseconds of every module loaded"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env={**os.environ, "PYTHONPATH": str(ROOT)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            times[match.group(4)] = int(match.group(2))
+    return times
+
+
+def test_app_import_time_within_budget():
+    runs = [import_times("app.app") for _ in range(IMPORT_TIME_RUNS)]
+
+    loaded = set(runs[0])
+    for lazy in LAZY_MODULES:
+        assert lazy not in loaded, f"{lazy} is imported by app.app"
+
+    best_ms = min(times["app.app"] for times in runs) / 1000
+    assert best_ms <= IMPORT_TIME_BUDGET_MS, (
+        f"import app.app took {best_ms:.0f} ms, "
+        f"budget is {IMPORT_TIME_BUDGET_MS:.0f} ms"
+    )
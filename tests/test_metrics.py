@@ -0,0 +1,62 @@
+import asyncio
+
+
+def test_render_exposes_counters_ratios_and_histograms():
+    from monitoring.histogram import HistogramRegistry
+    from monitoring.metrics import MetricsRegistry
+
+    histograms = HistogramRegistry()
+    registry = MetricsRegistry(histograms=histograms)
+    registry.inc("sync_rows_total", 1200, collection="stat_data", stage="write")
+    registry.inc("dashboard_cache_requests_total", 3, cache="police", result="hit")
+    registry.inc("dashboard_cache_requests_total", 1, cache="police", result="miss")
+    histograms.record("mongo.aggregate.police_data", 30)
+
+    text = registry.render()
+
+    assert "# TYPE legal_dashboard_sync_rows_total counter" in text
+    assert (
+        'legal_dashboard_sync_rows_total{collection="stat_data",stage="write"} 1200.0'
+        in text
+    )
+    assert 'legal_dashboard_dashboard_cache_hit_ratio{cache="police"} 0.75' in text
+    assert "# TYPE legal_dashboard_operation_duration_seconds histogram" in text
+    assert (
+        "legal_dashboard_operation_duration_seconds_bucket"
+        '{operation="mongo.aggregate.police_data",le="0.05"} 1' in text
+    )
+    assert (
+        "legal_dashboard_operation_duration_seconds_count"
+        '{operation="mongo.aggregate.police_data"} 1' in text
+    )
+
+
+def test_timed_event_records_async_handler_latency():
+    from monitoring.histogram import latency_histograms
+    from monitoring.metrics import timed_event
+
+    @timed_event
+    async def fetch_dashboard_stats():
+        await asyncio.sleep(0)
+        return "done"
+
+    assert asyncio.run(fetch_dashboard_stats()) == "done"
+    operation = f"event.{fetch_dashboard_stats.__qualname__}"
+    assert latency_histograms.get(operation).count == 1
+
+
+def test_metrics_route_requires_the_api_token(monkeypatch):
+    from fastapi.testclient import TestClient
+    import app.api as api_module
+
+    client = TestClient(api_module.api)
+
+    # Closed while no token is configured
+    monkeypatch.setattr(api_module.settings, "DASHBOARD_API_TOKEN", "")
+    assert client.get("/metrics").status_code == 401
+
+    monkeypatch.setattr(api_module.settings, "DASHBOARD_API_TOKEN", "secret")
+    assert client.get("/metrics").status_code == 401
+    response = client.get("/metrics", headers={"Authorization": "Bearer secret"})
+    assert response.status_code == 200
+    assert "# TYPE legal_dashboard_" in response.text
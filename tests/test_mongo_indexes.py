@@ -0,0 +1,63 @@
+from datetime import datetime
+
+
+class FakeCollection:
+    name = "stat_data"
+
+    def __init__(self, index_information, index_stats):
+        self._index_information = index_information
+        self._index_stats = index_stats
+        self.created = []
+
+    def index_information(self):
+        return self._index_information
+
+    def create_indexes(self, models):
+        self.created.extend(model.document["name"] for model in models)
+
+    def aggregate(self, pipeline):
+        return iter(self._index_stats)
+
+
+def test_only_missing_indexes_are_created_and_unused_ones_reported():
+    from services.mongo_indexes import ensure_collection_indexes
+    from services.stats.stats_data_mongo_service import StatDataMongoService
+
+    since = datetime(2025, 1, 1)
+    collection = FakeCollection(
+        index_information={
+            "_id_": {"key": [("_id", 1)]},
+            # Indexes created from the mongo shell store directions as doubles
+            "id_1": {"key": [("id", 1.0)], "unique": True},
+            "state_1": {"key": [("state", 1)]},
+        },
+        index_stats=[
+            {"name": "_id_", "accesses": {"ops": 0, "since": since}},
+            {"name": "id_1", "accesses": {"ops": 12, "since": since}},
+            {"name": "state_1", "accesses": {"ops": 0, "since": since}},
+        ],
+    )
+
+    report = ensure_collection_indexes(collection, StatDataMongoService.INDEXES)
+
+    assert "id_1" not in collection.created
+    assert "stat_type_1_created_at_-1" in collection.created
+    assert len(collection.created) == len(StatDataMongoService.INDEXES) - 1
+    assert report["created"] == collection.created
+    assert report["unused"] == ["state_1"]
+
+
+def test_existing_text_index_is_recognized():
+    from services.mongo_indexes import ensure_collection_indexes
+    from services.police.police_data_mongo_service import PoliceDataMongoService
+
+    text_index = {"key": [("_fts", "text"), ("_ftsx", 1)], "weights": {"reason": 1}}
+    collection = FakeCollection(
+        index_information={"_id_": {"key": [("_id", 1)]}, "reason_text": text_index},
+        index_stats=[],
+    )
+
+    ensure_collection_indexes(collection, PoliceDataMongoService.INDEXES)
+
+    assert "reason_text" not in collection.created
+    assert len(collection.created) == len(PoliceDataMongoService.INDEXES) - 1
@@ -0,0 +1,122 @@
+import logging
+from types import SimpleNamespace
+
+
+def test_histogram_percentiles_follow_recorded_durations():
+    from monitoring.histogram import LatencyHistogram
+
+    histogram = LatencyHistogram()
+    for _ in range(95):
+        histogram.record(3)
+    for _ in range(5):
+        histogram.record(800)
+
+    summary = histogram.summary()
+    assert summary["count"] == 100
+    assert 2.5 <= summary["p50_ms"] <= 5
+    assert 2.5 <= summary["p95_ms"] <= 5
+    assert 500 <= summary["p99_ms"] <= 800
+    assert summary["max_ms"] == 800
+
+
+def _event(command_name, collection, duration_micros, reply=None):
+    return SimpleNamespace(
+        connection_id=("localhost", 27017),
+        request_id=1,
+        operation_id=1,
+        database_name="legal_dashboard",
+        command_name=command_name,
+        command={command_name: collection},
+        duration_micros=duration_micros,
+        reply=reply or {},
+    )
+
+
+def test_listener_records_caller_and_logs_slow_commands(caplog):
+    from monitoring.histogram import HistogramRegistry
+    from monitoring.metrics import MetricsRegistry
+    from monitoring.mongo_commands import MongoCommandListener
+
+    histograms = HistogramRegistry()
+    listener = MongoCommandListener(
+        histograms=histograms,
+        slow_query_ms=100,
+        caller_prefixes=(__name__,),
+        metrics_registry=MetricsRegistry(histograms),
+    )
+
+    def get_statistics():
+        listener.started(_event("aggregate", "police_data", 0))
+
+    get_statistics()
+
+    reply = {"cursor": {"firstBatch": [{}, {}, {}]}}
+    with caplog.at_level(logging.WARNING, logger="monitoring.slow_queries"):
+        listener.succeeded(_event("aggregate", "police_data", 250_000, reply))
+
+    summary = histograms.summary()
+    assert summary["mongo.aggregate.police_data"]["count"] == 1
+    assert (
+        summary[
+            "test_listener_records_caller_and_logs_slow_commands.<locals>.get_statistics"
+        ]["count"]
+        == 1
+    )
+    assert "250.0 ms aggregate on police_data" in caplog.text
+    assert "(3 docs)" in caplog.text
+
+
+def test_documents_returned_and_examined_are_counted_per_operation():
+    from monitoring.histogram import HistogramRegistry
+    from monitoring.metrics import MetricsRegistry
+    from monitoring.mongo_commands import MongoCommandListener
+
+    histograms = HistogramRegistry()
+    registry = MetricsRegistry(histograms)
+    listener = MongoCommandListener(
+        histograms=histograms, slow_query_ms=100, metrics_registry=registry
+    )
+    explained = []
+
+    class Database:
+        def command(self, command):
+            explained.append(command)
+            return {"executionStats": {"totalDocsExamined": 120}}
+
+    listener.attach_client({"legal_dashboard": Database()})
+
+    reply = {"cursor": {"firstBatch": [{}, {}, {}]}}
+    fast = _event("find", "police_data", 2_000, reply)
+    listener.started(fast)
+    listener.succeeded(fast)
+    slow = _event("find", "police_data", 250_000, reply)
+    slow.command["$db"] = "legal_dashboard"
+    listener.started(slow)
+    listener.succeeded(slow)
+    listener._explain_queue.join()
+
+    operation = {"operation": "mongo.find.police_data", "caller": "unknown"}
+    assert registry.value("mongo_documents_returned_total", **operation) == 6
+    # Only the slow read is explained, without its driver fields
+    assert explained == [
+        {"explain": {"find": "police_data"}, "verbosity": "executionStats"}
+    ]
+    assert registry.value("mongo_documents_examined_total", **operation) == 120
+    assert registry.value("mongo_explained_commands_total", **operation) == 1
+
+
+def test_caller_skips_the_shared_read_helpers():
+    from monitoring.mongo_commands import find_caller
+
+    helpers = {"__name__": "services.mongo_reads", "find_caller": find_caller}
+    exec("def find_fields():\n    return find_caller(('services.',))", helpers)
+    service = {**helpers, "__name__": "services.police_data_service"}
+    exec(
+        "class PoliceDataMongoService:\n"
+        "    def iter_records(self):\n"
+        "        return find_fields()",
+        service,
+    )
+
+    caller = service["PoliceDataMongoService"]().iter_records()
+    assert caller == "PoliceDataMongoService.iter_records"
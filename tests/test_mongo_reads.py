@@ -0,0 +1,22 @@
+def test_find_fields_projects_and_decodes_raw_batches():
+    import bson
+    from bson.raw_bson import RawBSONDocument
+    from bson.codec_options import CodecOptions
+    from services.mongo_reads import find_fields
+
+    docs = [{"stat_type": "ITAB", "status_check_in": "ERROR"} for _ in range(3)]
+
+    class FakeCollection:
+        def find_raw_batches(self, query, projection, batch_size):
+            self.projection = projection
+            encoded = [bson.encode(doc) for doc in docs]
+            return iter([b"".join(encoded[:2]), encoded[2]])
+
+    collection = FakeCollection()
+    fields = ("stat_type", "status_check_in")
+    assert list(find_fields(collection, {}, fields)) == docs
+    assert collection.projection == {"stat_type": 1, "status_check_in": 1, "_id": 0}
+
+    raw = CodecOptions(document_class=RawBSONDocument)
+    first, *_ = find_fields(collection, {}, fields, codec_options=raw)
+    assert isinstance(first, RawBSONDocument) and first["stat_type"] == "ITAB"
@@ -0,0 +1,61 @@
+def test_previous_period_comes_from_the_same_aggregation():
+    from datetime import datetime
+    from app.states.police.police_data_state import PoliceDataState
+    from services.police.police_data_mongo_service import PoliceDataMongoService
+
+    class FakeCollection:
+        def __init__(self):
+            self.pipelines = []
+
+        def aggregate(self, pipeline):
+            self.pipelines.append(pipeline)
+            return iter(
+                [
+                    {
+                        "_id": "MOS",
+                        "states": [{"state": "SUCCESS", "count": 1}] * 9
+                        + [{"state": "ERROR", "count": 1}],
+                        "total": 10,
+                        "docs": [{"state": "ERROR", "reason": "Timeout"}],
+                        "previous_total": 4,
+                        "previous_success": 2,
+                        "previous_docs": [{"state": "ERROR", "reason": "Timeout"}] * 2,
+                    },
+                    # Records only in the previous period get no card
+                    {
+                        "_id": "SPAIN_HOS",
+                        "states": [],
+                        "total": 0,
+                        "docs": [],
+                        "previous_total": 3,
+                        "previous_success": 3,
+                        "previous_docs": [],
+                    },
+                ]
+            )
+
+    collection = FakeCollection()
+    service = PoliceDataMongoService(db_manager=None, compact=False)
+    service._get_collection = lambda: collection
+
+    start, end = datetime(2025, 1, 2), datetime(2025, 1, 3)
+    stats = PoliceDataState._get_police_type_statistics(
+        service, start, end, previous_start=datetime(2025, 1, 1)
+    )
+
+    (pipeline,) = collection.pipelines
+    assert pipeline[0] == {
+        "$match": {
+            "created_at": {"$gte": "2025-01-01T00:00:00", "$lt": "2025-01-03T00:00:00"}
+        }
+    }
+    assert list(stats) == ["MOS"]
+    result = stats["MOS"]
+    assert (result.total_records, result.success_rate) == (10, 90.0)
+    assert result.has_previous and result.previous_total_records == 4
+    assert result.previous_success_rate == 50.0
+    assert result.success_rate_delta == 40.0
+    assert (
+        PoliceDataState._get_police_type_statistics(service)["MOS"].has_previous
+        is False
+    )
@@ -0,0 +1,51 @@
+class FakeCodeTables:
+    """code_tables collection with the revision check of update_one"""
+
+    def __init__(self):
+        self.docs = {}
+
+    def find_one(self, query):
+        doc = self.docs.get(query["_id"])
+        return dict(doc) if doc else None
+
+    def insert_one(self, doc):
+        from pymongo.errors import DuplicateKeyError
+
+        if doc["_id"] in self.docs:
+            raise DuplicateKeyError("duplicate key")
+        self.docs[doc["_id"]] = dict(doc)
+
+    def update_one(self, query, update):
+        class Result:
+            modified_count = 0
+
+        doc = self.docs.get(query["_id"])
+        if doc and doc["revision"] == query["revision"]:
+            doc.update(update["$set"])
+            Result.modified_count = 1
+        return Result()
+
+
+def test_codes_are_append_only_and_round_trip():
+    from services.police.police_codes import CodeTable, load_code_table
+
+    db = {"code_tables": FakeCodeTables()}
+    first = load_code_table(
+        db, "police_data", {"state": ["SUCCESS", "ERROR"], "police_type": ["MOS"]}
+    )
+    # A new enum value gets the next code; existing codes are unchanged
+    second = load_code_table(
+        db, "police_data", {"state": ["NEW", "SUCCESS", "ERROR"], "police_type": []}
+    )
+    assert first.encode("state", "ERROR") == second.encode("state", "ERROR") == 1
+    assert second.encode("state", "NEW") == 2
+    assert db["code_tables"].docs["police_data"]["revision"] == 2
+
+    doc = {"id": "a", "state": "ERROR", "police_type": "MOS", "reason": "x"}
+    encoded = second.encode_document(doc)
+    assert encoded == {"id": "a", "state": 1, "police_type": 0, "reason": "x"}
+    assert doc["state"] == "ERROR"
+    assert second.decode_document(encoded) == doc
+    # Unknown values and an empty table pass through unchanged
+    assert second.encode("state", "UNKNOWN") == "UNKNOWN"
+    assert CodeTable().encode_document(doc) is doc
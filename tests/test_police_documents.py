@@ -0,0 +1,20 @@
+def test_direct_documents_match_the_unified_model():
+    from benchmarks.synthetic import SyntheticData
+    from models.police_movement import PoliceMovement
+    from models.police_registration import PoliceRegistration
+    from services.police.police_data_mongo_service import PoliceDataMongoService
+
+    service = PoliceDataMongoService(db_manager=None, compact=False)
+    data = SyntheticData(seed=3)
+    for row in data.movement_rows(200):
+        movement = PoliceMovement.from_db_row(row)
+        doc = service.movement_to_document(movement)
+        expected = service.movement_to_unified(movement).to_mongo_dict()
+        assert list(doc.items()) == list(expected.items())
+        assert doc["created_at"] == row["created_at"].isoformat()
+        assert doc["expiration_date"] == row["expiration_date"].isoformat()
+    for row in data.registration_rows(200):
+        registration = PoliceRegistration.from_db_row(row)
+        doc = service.registration_to_document(registration)
+        expected = service.registration_to_unified(registration).to_mongo_dict()
+        assert list(doc.items()) == list(expected.items())
@@ -0,0 +1,72 @@
+def test_search_requires_every_word_and_decodes_counts():
+    from services.mongo_reads import text_search
+    from services.police.police_codes import CodeTable
+    from services.police.police_data_mongo_service import PoliceDataMongoService
+
+    assert text_search(' invalid  "document" ') == {
+        "$text": {"$search": '"invalid" "document"'}
+    }
+
+    class FakeCollection:
+        def aggregate(self, pipeline):
+            self.pipeline = pipeline
+            return iter(
+                [
+                    {
+                        "page": [{"id": "a", "police_type": 0, "state": 1}],
+                        "counts": [{"_id": 1, "count": 7}, {"_id": 0, "count": 3}],
+                    }
+                ]
+            )
+
+    collection = FakeCollection()
+    service = PoliceDataMongoService(db_manager=None, compact=False)
+    service._codes = CodeTable(
+        {"police_type": ["SPAIN_HOS", "MOS"], "state": ["SUCCESS", "INVALID"]}
+    )
+    service._get_collection = lambda: collection
+
+    result = service.search_reasons("invalid document", "SPAIN_HOS", skip=20)
+
+    match, facet = collection.pipeline
+    assert match == {"$match": text_search("invalid document")}
+    assert facet["$facet"]["page"][0] == {"$match": {"police_type": 0}}
+    assert {"$skip": 20} in facet["$facet"]["page"]
+    assert result == {
+        "records": [{"id": "a", "police_type": "SPAIN_HOS", "state": "INVALID"}],
+        "total": 3,
+        "counts": [
+            {"police_type": "MOS", "count": 7},
+            {"police_type": "SPAIN_HOS", "count": 3},
+        ],
+    }
+    assert service.search_reasons("  ")["total"] == 0
+
+
+def test_search_route_requires_the_api_token(monkeypatch):
+    from fastapi.testclient import TestClient
+    import app.api as api_module
+    from services.stats.stats_data_mongo_service import StatDataMongoService
+
+    searches = []
+
+    def search_reasons(self, text, stat_type, skip, limit):
+        searches.append((text, stat_type, skip, limit))
+        return {"records": [], "total": 0, "counts": []}
+
+    monkeypatch.setattr(api_module, "_connected_db_manager", lambda: None)
+    monkeypatch.setattr(StatDataMongoService, "search_reasons", search_reasons)
+    client = TestClient(api_module.api)
+
+    # Closed while no token is configured
+    monkeypatch.setattr(api_module.settings, "DASHBOARD_API_TOKEN", "")
+    assert client.get("/api/search/stat_data", params={"q": "x"}).status_code == 401
+
+    monkeypatch.setattr(api_module.settings, "DASHBOARD_API_TOKEN", "secret")
+    response = client.get(
+        "/api/search/stat_data",
+        params={"q": "card declined", "limit": 5},
+        headers={"Authorization": "Bearer secret"},
+    )
+    assert response.status_code == 200
+    assert searches == [("card declined", None, 0, 5)]
@@ -0,0 +1,117 @@
+def test_stat_export_filters_like_the_dashboard_and_streams_csv():
+    import csv
+    import io
+    from datetime import datetime
+    import bson
+    from services.record_export import iter_export
+    from services.stats.stats_data_mongo_service import StatDataMongoService
+
+    docs = [
+        {"id": str(i), "created_at": f"2025-01-01T0{i}:00:00", "stat_type": "ITAB"}
+        for i in range(5)
+    ]
+
+    class FakeCursor:
+        def __init__(self, batches):
+            self.batches = batches
+
+        def sort(self, sort):
+            self.sorted_by = sort
+            return self
+
+        def allow_disk_use(self, allow):
+            return self
+
+        def __iter__(self):
+            return iter(self.batches)
+
+    class FakeCollection:
+        def find_raw_batches(self, query, projection, batch_size):
+            self.query = query
+            encoded = [bson.encode(doc) for doc in docs]
+            return FakeCursor([b"".join(encoded[:2]), b"".join(encoded[2:])])
+
+    collection = FakeCollection()
+    service = StatDataMongoService(db_manager=None)
+    service._get_collection = lambda: collection
+
+    start = datetime(2025, 1, 1, 1)
+    records = service.iter_records("ITAB", "CHECKOUT_ERROR", start=start)
+    chunks = list(iter_export(records, service.EXPORT_FIELDS, "csv", batch_size=2))
+
+    assert collection.query == {
+        "created_at": {"$gte": "2025-01-01T01:00:00"},
+        "stat_type": "ITAB",
+        "status_check_out": "ERROR",
+    }
+    assert service.records_filter(state="ERROR") == {
+        "$or": [{"status_check_in": "ERROR"}, {"status_check_out": "ERROR"}]
+    }
+    # Header, then one chunk per two rows
+    assert len(chunks) == 4
+    rows = list(csv.DictReader(io.StringIO("".join(chunks))))
+    assert [row["id"] for row in rows] == ["0", "1", "2", "3", "4"]
+    assert rows[0]["status_check_in"] == ""
+
+
+def test_police_export_endpoint_decodes_compact_records(monkeypatch):
+    import json
+    import bson
+    from fastapi.testclient import TestClient
+    import app.api as api_module
+    from services.police.police_codes import CodeTable
+    from services.police.police_data_mongo_service import PoliceDataMongoService
+
+    codes = CodeTable({"state": ["SUCCESS", "INVALID"], "police_type": ["SPAIN_HOS"]})
+
+    class FakeCursor:
+        def sort(self, sort):
+            return self
+
+        def allow_disk_use(self, allow):
+            return self
+
+        def __iter__(self):
+            return iter([bson.encode({"id": "a", "state": 1, "police_type": 0})])
+
+    class FakeCollection:
+        def find_raw_batches(self, query, projection, batch_size):
+            self.query = query
+            return FakeCursor()
+
+    class FakeDbManager:
+        mongo = {"police_data": FakeCollection()}
+
+    monkeypatch.setattr(api_module, "_connected_db_manager", FakeDbManager)
+    monkeypatch.setattr(PoliceDataMongoService, "codes", codes)
+    monkeypatch.setattr(api_module.settings, "DASHBOARD_API_TOKEN", "secret")
+    client = TestClient(api_module.api)
+
+    # Guest records need the API token
+    assert client.get("/api/export/police_data").status_code == 401
+
+    response = client.get(
+        "/api/export/police_data",
+        headers={"Authorization": "Bearer secret"},
+        params={
+            "format": "ndjson",
+            "police_type": "SPAIN_HOS",
+            "state": "INVALID",
+            "end": "2025-01-02T00:00:00",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert (
+        "police_data-SPAIN_HOS-INVALID.ndjson"
+        in response.headers["content-disposition"]
+    )
+    assert FakeDbManager.mongo["police_data"].query == {
+        "created_at": {"$lt": "2025-01-02T00:00:00"},
+        "police_type": 0,
+        "state": 1,
+    }
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {"id": "a", "state": "INVALID", "police_type": "SPAIN_HOS"}
+    ]
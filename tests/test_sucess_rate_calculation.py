@@ -105,3 +105,12 @@ def test_stat_success_rate_calculation():
         )
 
         assert round(success_rate, 2) == expected_success_rate, f"Failed for {stat_type}"
+
+
+def test_success_rate_statuses_cover_every_type_in_one_pass():
+    from app.states.success_rate_utils import success_rate_statuses
+
+    results = success_rate_statuses(success_counts=[95, 3, 0], error_counts=[1, 2, 2])
+
+    assert [round(result.success_rate, 2) for result in results] == [98.96, 60.0, 0.0]
+    assert [result.status for result in results] == ["Good", "Error", "Error"]
@@ -0,0 +1,93 @@
+import pytest
+
+
+def _fake_police_sync(monkeypatch, movement_rows):
+    import sync_data
+
+    events = []
+
+    class FakeVersionService:
+        def __init__(self, db_manager):
+            pass
+
+        def bump_version(self, collection_name):
+            events.append(f"bump {collection_name}")
+            return len(events)
+
+    class FakeCollection:
+        def delete_many(self, query):
+            events.append("clear")
+            return type("Result", (), {"deleted_count": 5})()
+
+    class FakeMongoService:
+        collection_name = "police_data"
+
+        def __init__(self, db_manager):
+            pass
+
+        def _get_collection(self):
+            return FakeCollection()
+
+        def get_statistics(self):
+            return {
+                "total_records": 0,
+                "movements": 0,
+                "registrations": 0,
+                "state_distribution": {},
+                "police_type_distribution": {},
+            }
+
+    class FakeSourceService:
+        def __init__(self, db_manager):
+            pass
+
+        def get_movement_rows_by_date_range(self, start, end):
+            return movement_rows()
+
+        def get_registration_rows_by_date_range(self, start, end):
+            return []
+
+    class FakeDatabase:
+        def close_all(self):
+            pass
+
+    monkeypatch.setenv("CLEAR_EXISTING", "true")
+    monkeypatch.setattr(sync_data, "get_database", FakeDatabase)
+    monkeypatch.setattr(sync_data, "report_indexes", lambda service: None)
+    monkeypatch.setattr(sync_data, "DataVersionService", FakeVersionService)
+    monkeypatch.setattr(sync_data, "PoliceDataMongoService", FakeMongoService)
+    monkeypatch.setattr(sync_data, "PoliceMovementService", FakeSourceService)
+    monkeypatch.setattr(sync_data, "PoliceRegistrationService", FakeSourceService)
+    monkeypatch.setattr(
+        sync_data, "load_records", lambda source, *args: events.append(source) or (0, 0)
+    )
+    return sync_data, events
+
+
+def test_cleared_collection_is_bumped_after_the_clear_and_the_last_source(
+    monkeypatch,
+):
+    sync_data, events = _fake_police_sync(monkeypatch, lambda: [])
+
+    sync_data.sync_police_data()
+
+    # Not after movements: a dashboard without registrations is not cached
+    assert events == [
+        "clear",
+        "bump police_data",
+        "police_movements",
+        "police_registrations",
+        "bump police_data",
+    ]
+
+
+def test_failed_sync_bumps_the_version_of_the_cleared_collection(monkeypatch):
+    def fail():
+        raise RuntimeError("postgres down")
+
+    sync_data, events = _fake_police_sync(monkeypatch, fail)
+
+    with pytest.raises(SystemExit):
+        sync_data.sync_police_data()
+
+    assert events == ["clear", "bump police_data", "bump police_data"]
@@ -0,0 +1,69 @@
+def test_windows_resolve_to_bounds_and_cache_keys():
+    from datetime import datetime
+    from app.states.time_window import resolve_time_window
+
+    now = datetime(2025, 1, 2, 12, 0)
+    day = resolve_time_window("24h", now=now)
+    assert (day.start, day.end) == (datetime(2025, 1, 1, 12, 0), now)
+    # Relative windows share one cache entry and are refreshed as they move
+    assert day.key == "24h"
+    assert day.max_age == 2 * 60 * 60
+
+    custom = resolve_time_window("custom", "2025-01-01T08:00", "")
+    assert (custom.start, custom.end) == (datetime(2025, 1, 1, 8, 0), None)
+    assert custom.key == "custom:2025-01-01T08:00:00:"
+    assert custom.max_age is None
+    assert resolve_time_window("bogus").key == "all"
+
+
+def test_aggregations_start_with_the_window_match():
+    from datetime import datetime
+    from services.stats.stats_data_mongo_service import StatDataMongoService
+
+    class FakeCollection:
+        def __init__(self):
+            self.pipelines = []
+            self.counted = []
+
+        def count_documents(self, query):
+            self.counted.append(query)
+            return 0
+
+        def aggregate(self, pipeline):
+            self.pipelines.append(pipeline)
+            return iter([])
+
+    collection = FakeCollection()
+    service = StatDataMongoService(db_manager=None)
+    service._get_collection = lambda: collection
+
+    start, end = datetime(2025, 1, 1), datetime(2025, 1, 2)
+    service.get_statistics(start, end)
+
+    window = {
+        "created_at": {"$gte": "2025-01-01T00:00:00", "$lt": "2025-01-02T00:00:00"}
+    }
+    assert collection.counted == [window]
+    assert all(pipeline[0] == {"$match": window} for pipeline in collection.pipelines)
+
+    collection.pipelines = []
+    service.get_statistics()
+    assert all("$match" not in pipeline[0] for pipeline in collection.pipelines)
+
+
+def test_columnar_table_window():
+    from datetime import datetime
+    from app.states.analytics_engine import police_statistics, police_table
+
+    table = police_table()
+    table.append(
+        [
+            {"created_at": f"2025-01-0{day}T00:00:00", "police_type": "MOS"}
+            for day in (1, 2, 3)
+        ]
+    )
+
+    window = table.between(datetime(2025, 1, 2), datetime(2025, 1, 3))
+    assert len(window) == 1 and len(table) == 3
+    assert police_statistics(window)["police_type_distribution"] == {"MOS": 1}
+    assert table.between() is table
@@ -0,0 +1,106 @@
+import json
+from types import SimpleNamespace
+
+
+def test_nested_spans_are_exported_as_otlp_json_lines(tmp_path):
+    from monitoring.tracing import JsonLinesSpanExporter, Tracer
+
+    path = tmp_path / "trace.jsonl"
+    tracer = Tracer("sync-test", exporter=JsonLinesSpanExporter(str(path)))
+
+    with tracer.span("sync") as root:
+        with tracer.span("write", source="stat_data") as span:
+            span.set_attribute("rows", 3)
+            span.set_attribute("bytes", 512)
+    tracer.shutdown()
+
+    requests = [json.loads(line) for line in path.read_text().splitlines()]
+    spans = [r["resourceSpans"][0]["scopeSpans"][0]["spans"][0] for r in requests]
+    write, sync = spans
+
+    assert [span["name"] for span in spans] == ["write", "sync"]
+    assert write["traceId"] == sync["traceId"] == root.trace_id
+    assert write["parentSpanId"] == sync["spanId"]
+    assert "parentSpanId" not in sync
+    assert {"key": "rows", "value": {"intValue": "3"}} in write["attributes"]
+    assert int(write["endTimeUnixNano"]) >= int(write["startTimeUnixNano"])
+    assert requests[0]["resourceSpans"][0]["resource"]["attributes"] == [
+        {"key": "service.name", "value": {"stringValue": "sync-test"}}
+    ]
+
+
+def test_load_records_counts_transform_and_write_errors():
+    from pymongo.errors import BulkWriteError
+    import sync_data
+
+    class FakeMongoService:
+        def __init__(self):
+            self.batches = []
+
+        def store_documents(self, docs):
+            self.batches.append(docs)
+            if len(self.batches) == 1:
+                raise BulkWriteError(
+                    {
+                        "nMatched": 0,
+                        "nUpserted": len(docs) - 1,
+                        "writeErrors": [{"op": docs[0], "errmsg": "duplicate key"}],
+                    }
+                )
+            return len(docs)
+
+    def to_document(record):
+        if record.id == 4:
+            raise ValueError("bad state")
+        return {"id": str(record.id)}
+
+    records = [SimpleNamespace(id=i) for i in range(6)]
+    service = FakeMongoService()
+    original_batch_size = sync_data.SYNC_BATCH_SIZE
+    sync_data.SYNC_BATCH_SIZE = 3
+    try:
+        written, errors = sync_data.load_records(
+            "stat_data", records, to_document, service
+        )
+    finally:
+        sync_data.SYNC_BATCH_SIZE = original_batch_size
+
+    assert [len(batch) for batch in service.batches] == [3, 2]
+    assert written == 4
+    assert errors == 2
+
+
+def test_load_records_in_workers_writes_encoded_batches():
+    import bson
+    import sync_data
+    from benchmarks.synthetic import SyntheticData
+    from services.document_transform import movement_document
+
+    class FakeMongoService:
+        def __init__(self):
+            self.batches = []
+
+        def store_encoded_documents(self, docs):
+            self.batches.append(docs)
+            return len(docs)
+
+    rows = list(SyntheticData(seed=5).movement_rows(7))
+    rows[4]["state"] = "BOGUS"
+    service = FakeMongoService()
+    original_batch_size = sync_data.SYNC_BATCH_SIZE
+    sync_data.SYNC_BATCH_SIZE = 3
+    try:
+        written, errors = sync_data.load_records(
+            "police_movements", rows, movement_document, service, workers=2
+        )
+    finally:
+        sync_data.SYNC_BATCH_SIZE = original_batch_size
+
+    assert (written, errors) == (6, 1)
+    assert [len(batch) for batch in service.batches] == [3, 2, 1]
+    stored = [bson.decode(doc.raw) for batch in service.batches for _, doc in batch]
+    good_rows = rows[:4] + rows[5:]
+    assert stored == [movement_document(row) for row in good_rows]
+    assert [doc_id for batch in service.batches for doc_id, _ in batch] == [
+        str(row["id"]) for row in good_rows
+    ]
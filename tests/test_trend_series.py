@@ -0,0 +1,95 @@
+def test_bucket_size_keeps_windows_under_the_point_limit():
+    from datetime import datetime, timedelta
+    from app.states.trend_series import MAX_TREND_POINTS, choose_bucket
+
+    end = datetime(2025, 1, 31)
+    month = choose_bucket(end - timedelta(days=30), end)
+    assert (month.unit, month.bin_size) == ("hour", 2)
+    assert timedelta(days=30) / month.step <= MAX_TREND_POINTS
+    day = choose_bucket(end - timedelta(hours=24), end)
+    assert (day.unit, day.bin_size, day.label) == ("minute", 5, "5 minutes")
+
+
+def test_rows_count_successes_and_unexpected_errors_per_bucket():
+    from datetime import datetime
+    from app.states.trend_series import count_bucket_rows, trend_points, TREND_BUCKETS
+
+    first, second = datetime(2025, 1, 1, 10), datetime(2025, 1, 1, 11)
+    rows = [
+        {"bucket": first, "state": "SUCCESS", "reason": None, "count": 3},
+        {"bucket": first, "state": "ERROR", "reason": "timeout", "count": 1},
+        {"bucket": first, "state": "ERROR", "reason": "duplicate", "count": 5},
+        {"bucket": second, "state": "NEW", "reason": None, "count": 2},
+    ]
+    counts = count_bucket_rows(
+        rows,
+        ["SUCCESS"],
+        ["ERROR"],
+        lambda reason, state: reason == "duplicate",
+    )
+    assert counts == {first: (3, 1), second: (0, 0)}
+    # Buckets without a rate are left out of the chart
+    assert trend_points(counts, TREND_BUCKETS[4]) == [
+        {"time": "01-01 10:00", "success_rate": 75.0, "total": 4}
+    ]
+
+
+def test_series_are_extended_from_the_refresh_window_after_a_sync():
+    from datetime import datetime, timedelta
+    from app.states.trend_series import TREND_BUCKETS, TrendSeriesCache
+
+    hour = TREND_BUCKETS[4]
+    now = datetime.now().replace(minute=0, second=0, microsecond=0)
+    buckets = [now - timedelta(hours=hours) for hours in range(48, -1, -1)]
+    loads = []
+
+    def load(start, end):
+        loads.append(start)
+        return {
+            bucket: (1, 0) for bucket in buckets if start is None or bucket >= start
+        }
+
+    cache = TrendSeriesCache(refresh_window=timedelta(hours=6))
+    first = cache.series("police", hour, 1, None, None, load)
+    assert len(first) == 49 and loads == [None]
+
+    # Unchanged data is served from the cache
+    assert cache.series("police", hour, 1, None, None, load) == first
+    assert loads == [None]
+
+    # After a sync only the buckets from the refresh window are aggregated
+    assert cache.series("police", hour, 2, None, None, load) == first
+    assert len(loads) == 2
+    assert now - timedelta(hours=7) < loads[1] <= now - timedelta(hours=6)
+
+    # A later start drops the buckets it has left behind, without a query
+    start = now - timedelta(hours=10, minutes=30)
+    trimmed = cache.series("police", hour, 2, start, None, load)
+    assert min(trimmed) == now - timedelta(hours=11) and len(loads) == 2
+
+
+def test_a_slow_load_only_blocks_its_own_series():
+    import threading
+    from app.states.trend_series import TREND_BUCKETS, TrendSeriesCache
+
+    hour = TREND_BUCKETS[4]
+    cache = TrendSeriesCache()
+    started, release = threading.Event(), threading.Event()
+
+    def slow_load(start, end):
+        started.set()
+        release.wait(5)
+        return {}
+
+    slow = threading.Thread(
+        target=cache.series, args=("slow", hour, 1, None, None, slow_load)
+    )
+    slow.start()
+    assert started.wait(5)
+    try:
+        # Another series is served while the slow load is still running
+        assert cache.series("fast", hour, 1, None, None, lambda s, e: {}) == {}
+        assert slow.is_alive()
+    finally:
+        release.set()
+        slow.join(5)